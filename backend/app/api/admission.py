@@ -0,0 +1,347 @@
+"""
+Admission Control.
+Pure ASGI middleware that rate-limits clients and gives every request a
+deadline, and the slots handlers take before translating or streaming
+a document, which bound concurrent and queued translations and
+concurrent document streams.
+"""
+
+import asyncio
+import math
+import time
+from collections import OrderedDict
+
+from fastapi import HTTPException, status
+from starlette.datastructures import Headers
+from starlette.requests import HTTPConnection
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.deadlines import remaining_seconds, set_deadline
+from app.core.metrics import ADMISSION_DECISIONS, ADMISSION_IN_FLIGHT, ADMISSION_QUEUE_DEPTH
+
+DEADLINE_HEADER = "x-request-deadline-ms"
+
+# Keys of a request's AdmissionSlots in the ASGI scope state
+_SLOT_STATE_KEY = "translation_slot"
+_DOCUMENT_SLOT_STATE_KEY = "document_slot"
+
+_OVERLOADED = "Server is overloaded, retry shortly"
+
+
+class TokenBucketLimiter:
+    """
+    Per-client token buckets.
+
+    Each client may send `burst` requests at once and `rate` requests
+    per second on average. Buckets of the least recently seen clients
+    are dropped beyond `max_clients`. Used from the event loop only.
+    """
+
+    def __init__(self, rate: float, burst: int, max_clients: int = 10_000):
+        self._rate = rate
+        self._burst = float(burst)
+        self._max_clients = max_clients
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def acquire(self, client: str) -> float:
+        """
+        Take a token for a client.
+
+        Returns:
+            0 if the request is allowed, otherwise seconds until a token is available
+        """
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(client, (self._burst, now))
+        tokens = min(self._burst, tokens + (now - updated) * self._rate)
+
+        wait = 0.0
+        if tokens >= 1.0:
+            tokens -= 1.0
+        else:
+            wait = (1.0 - tokens) / self._rate
+
+        self._buckets[client] = (tokens, now)
+        if len(self._buckets) > self._max_clients:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+class ConcurrencyGate:
+    """
+    Bounds requests in flight and requests waiting for a slot.
+
+    Requests beyond `max_concurrent` wait in FIFO order; once
+    `max_queue` are waiting, new ones are rejected immediately rather
+    than adding to a queue whose wait would exceed their deadline.
+    """
+
+    def __init__(self, max_concurrent: int, max_queue: int, name: str = "translations"):
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._max_queue = max_queue
+        self._name = name  # Gate label of the admission gauges
+        self._waiting = 0
+        self._in_flight = 0
+
+    async def acquire(self, timeout: float | None) -> str:
+        """
+        Wait for a slot.
+
+        Args:
+            timeout: Longest time to wait (None = no limit)
+
+        Returns:
+            "admitted", "shed" (queue full) or "timeout"
+        """
+        if self._semaphore.locked():
+            if self._waiting >= self._max_queue:
+                return "shed"
+
+            self._waiting += 1
+            ADMISSION_QUEUE_DEPTH.set(self._waiting, gate=self._name)
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout)
+            except asyncio.TimeoutError:
+                return "timeout"
+            finally:
+                self._waiting -= 1
+                ADMISSION_QUEUE_DEPTH.set(self._waiting, gate=self._name)
+        else:
+            await self._semaphore.acquire()
+
+        self._in_flight += 1
+        ADMISSION_IN_FLIGHT.set(self._in_flight, gate=self._name)
+        return "admitted"
+
+    def release(self) -> None:
+        """Free a slot taken by acquire."""
+        self._in_flight -= 1
+        ADMISSION_IN_FLIGHT.set(self._in_flight, gate=self._name)
+        self._semaphore.release()
+
+
+class AdmissionSlot:
+    """
+    A request's claim on a ConcurrencyGate, taken only when the handler
+    is about to translate (or stream a document), so cache revalidations,
+    manifests and other cheap responses under the same path never wait
+    for (or hold) a slot.
+    """
+
+    def __init__(self, gate: ConcurrencyGate):
+        self._gate = gate
+        self._held = False
+
+    async def acquire(self) -> str:
+        """
+        Wait for a slot until the request's deadline.
+
+        Returns:
+            "admitted", "shed" (queue full) or "timeout"
+        """
+        if self._held:
+            return "admitted"
+        decision = await self._gate.acquire(timeout=max(0.0, remaining_seconds()))
+        ADMISSION_DECISIONS.inc(result=decision)
+        self._held = decision == "admitted"
+        return decision
+
+    def release(self) -> None:
+        """Free the slot, if one was taken."""
+        if self._held:
+            self._held = False
+            self._gate.release()
+
+
+async def _take_slot(connection: HTTPConnection, key: str) -> None:
+    """Take the request's slot stored under `key`; 503 if it is not admitted."""
+    slot = connection.scope.get("state", {}).get(key)
+    if slot is None:
+        return
+    if await slot.acquire() != "admitted":
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=_OVERLOADED,
+            headers={"Retry-After": "1"},
+        )
+
+
+async def admit(connection: HTTPConnection) -> None:
+    """
+    Take a translation slot for the request before translating.
+
+    The slot is held until the response is sent. Requests outside
+    admission control (e.g. with ADMISSION_ENABLED=false) pass through.
+
+    Args:
+        connection: The request
+
+    Raises:
+        HTTPException: 503 with Retry-After if the request is shed or
+            its deadline passes while queued
+    """
+    await _take_slot(connection, _SLOT_STATE_KEY)
+
+
+async def admit_document(connection: HTTPConnection) -> None:
+    """
+    Take a document slot for the request before streaming a document.
+
+    The slot is held until the whole stream is sent. Document streams
+    never queue: they run far longer than any deadline.
+
+    Args:
+        connection: The request
+
+    Raises:
+        HTTPException: 503 with Retry-After if all document slots are taken
+    """
+    await _take_slot(connection, _DOCUMENT_SLOT_STATE_KEY)
+
+
+class AdmissionControlMiddleware:
+    """
+    Admission control for the translation endpoints.
+
+    Requests whose path starts with `path_prefix` are
+    1. rate-limited per client with a token bucket (429 + Retry-After),
+    2. given a deadline: `deadline_seconds`, or less if the client sends
+       an X-Request-Deadline-Ms header,
+    3. given a translation slot. Handlers call `admit` right before they
+       translate; fewer than `max_concurrent` translations run at once,
+       others queue until their deadline, and are shed with 503 once
+       `max_queue` are already waiting. Handlers that never call it
+       (304 revalidations, the clip manifest) never wait for or hold a
+       slot,
+    4. given a document slot. The document handler calls
+       `admit_document` before it streams; at most `max_documents`
+       streams run at once and others are shed with 503 right away.
+    Handlers read the remaining budget from app.core.deadlines.
+
+    WebSocket connections under the prefix are admitted per message:
+    each message waits for a rate-limit token, gets a deadline and holds
+    a slot until the handler receives its next message. Messages that
+    are shed or time out are answered with an error frame and dropped.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_prefix: str,
+        max_concurrent: int,
+        max_queue: int,
+        deadline_seconds: float,
+        rate_per_second: float = 0.0,
+        burst: int = 20,
+        trust_forwarded_for: bool = False,
+        max_documents: int = 4,
+    ):
+        self.app = app
+        self._path_prefix = path_prefix
+        self._deadline_seconds = deadline_seconds
+        self._gate = ConcurrencyGate(max_concurrent, max_queue)
+        self._document_gate = ConcurrencyGate(max_documents, max_queue=0, name="documents")
+        self._limiter = TokenBucketLimiter(rate_per_second, burst) if rate_per_second > 0 else None
+        self._trust_forwarded_for = trust_forwarded_for
+
+    def _client_key(self, scope: Scope, headers: Headers) -> str:
+        """Identify the client by its (forwarded) address."""
+        if self._trust_forwarded_for:
+            forwarded = headers.get("x-forwarded-for")
+            if forwarded:
+                return forwarded.split(",")[0].strip()
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    def _budget(self, headers: Headers) -> float:
+        """Deadline budget of a request in seconds."""
+        requested = headers.get(DEADLINE_HEADER)
+        if requested:
+            try:
+                return max(0.0, min(self._deadline_seconds, float(requested) / 1000))
+            except ValueError:
+                pass
+        return self._deadline_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "websocket" and scope["path"].startswith(self._path_prefix):
+            await self._call_websocket(scope, receive, send)
+            return
+
+        if scope["type"] != "http" or not scope["path"].startswith(self._path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+
+        if self._limiter is not None:
+            wait = self._limiter.acquire(self._client_key(scope, headers))
+            if wait > 0:
+                ADMISSION_DECISIONS.inc(result="rate_limited")
+                response = JSONResponse(
+                    {"detail": "Rate limit exceeded"},
+                    status_code=429,
+                    headers={"Retry-After": str(math.ceil(wait))},
+                )
+                await response(scope, receive, send)
+                return
+
+        set_deadline(self._budget(headers))
+        slot = AdmissionSlot(self._gate)
+        document_slot = AdmissionSlot(self._document_gate)
+        scope["state"] = {
+            **scope.get("state", {}),
+            _SLOT_STATE_KEY: slot,
+            _DOCUMENT_SLOT_STATE_KEY: document_slot,
+        }
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            slot.release()
+            document_slot.release()
+
+    async def _call_websocket(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run a WebSocket connection, admitting each received message."""
+        headers = Headers(scope=scope)
+        client = self._client_key(scope, headers)
+        holding = False
+
+        async def admitted_receive() -> Message:
+            nonlocal holding
+            # The handler is done with the previous message
+            if holding:
+                self._gate.release()
+                holding = False
+
+            while True:
+                message = await receive()
+                if message["type"] != "websocket.receive":
+                    return message
+
+                if self._limiter is not None:
+                    wait = self._limiter.acquire(client)
+                    if wait > 0:
+                        # Delay rather than drop: the client's latest text must get through
+                        ADMISSION_DECISIONS.inc(result="rate_limited")
+                        while wait > 0:
+                            await asyncio.sleep(wait)
+                            wait = self._limiter.acquire(client)
+
+                set_deadline(self._budget(headers))
+                decision = await self._gate.acquire(timeout=max(0.0, remaining_seconds()))
+                ADMISSION_DECISIONS.inc(result=decision)
+                if decision == "admitted":
+                    holding = True
+                    return message
+
+                await send({
+                    "type": "websocket.send",
+                    "text": f'{{"type":"error","detail":"{_OVERLOADED}"}}',
+                })
+
+        try:
+            await self.app(scope, admitted_receive, send)
+        finally:
+            if holding:
+                self._gate.release()
@@ -0,0 +1,45 @@
+"""
+Client Hints.
+Chooses a clip rendition from the network hints a browser sends.
+"""
+
+from collections.abc import Mapping
+
+# Effective connection types (ECT header) and the rendition they get
+_ECT_RENDITIONS = {"slow-2g": "low", "2g": "low", "3g": "medium"}
+
+# Request headers the rendition choice depends on (for Vary)
+RENDITION_HINT_HEADERS = "Save-Data, ECT, Downlink"
+
+
+def select_rendition(headers: Mapping[str, str]) -> str | None:
+    """
+    Pick a clip rendition for a request.
+    
+    `Save-Data: on` and 2G connections get "low", 3G and downlinks
+    below 5 Mbit/s "medium"; everything else the original clips.
+    ECT and Downlink are only sent to origins that asked for them with
+    `Accept-CH: ECT, Downlink`.
+    
+    Args:
+        headers: Request headers (case-insensitive mapping)
+        
+    Returns:
+        Rendition name, or None for the original clips
+    """
+    if headers.get("save-data", "").strip().lower() == "on":
+        return "low"
+    
+    rendition = _ECT_RENDITIONS.get(headers.get("ect", "").strip().lower())
+    if rendition is not None:
+        return rendition
+    
+    try:
+        downlink = float(headers.get("downlink", ""))
+    except ValueError:
+        return None
+    if downlink < 1.0:
+        return "low"
+    if downlink < 5.0:
+        return "medium"
+    return None
@@ -5,20 +5,74 @@ Uses FastAPI's Depends() for clean dependency injection.
 
 from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from app.config import get_settings
+from app.core.cache import LruCache
+from app.core.interfaces.embedding_matcher import IEmbeddingMatcher, MatchResult
+from app.core.interfaces.ner_detector import INerDetector
+from app.core.interfaces.phrase_matcher import IPhraseMatcher
+from app.core.interfaces.text_encoder import ITextEncoder
+from app.core.interfaces.video_repository import IVideoRepository
+from app.repositories.clip_cache import DiskClipCache
+from app.repositories.s3_video_repository import S3Credentials, S3VideoRepository
 from app.repositories.video_repository import FileSystemVideoRepository
-from app.services.embedding_service import EmbeddingService
-from app.services.ner_service import NerService
-from app.services.translation_service import TranslationService
+from app.services.async_adapters import (
+    AsyncEmbeddingMatcherAdapter,
+    AsyncNerDetectorAdapter,
+    AsyncVideoRepositoryAdapter,
+)
+from app.services.async_translation_service import AsyncTranslationService
+from app.services.clip_manifest import ClipManifestService
+from app.services.document_service import DocumentTranslationService
+from app.services.phrase_matcher import PhraseMatcher
+from app.services.stand_in_services import HashingEmbeddingMatcher, RuleBasedNerDetector
+from app.services.tiered_matcher import TieredMatcher
+from app.services.translation_service import TranslationResult, TranslationService
+from app.services.vocabulary_registry import LoadedVocabulary, VocabularyRegistry
+from app.services.warm_cache import CacheWarmer, CachingMatcher, compute_fingerprint
+
+# sentence-transformers (torch) and spaCy take seconds to import; they are
+# imported by the factories of the "full" profile only
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+    from app.services.embedding_service import EmbeddingService
+    from app.services.ner_service import NerService
+
+
+# Matcher tiers used when a request's deadline cannot fit the full pipeline
+DEGRADED_TIERS = {"exact", "stem"}
 
 
 @lru_cache
-def get_video_repository() -> FileSystemVideoRepository:
-    """Factory for video repository."""
+def get_video_repository() -> IVideoRepository:
+    """Factory for video repository (object storage if a bucket is configured)."""
     settings = get_settings()
     videos_dir = settings.videos_directory
     
+    if settings.videos_s3_bucket:
+        credentials = None
+        if settings.videos_s3_access_key_id and settings.videos_s3_secret_access_key:
+            credentials = S3Credentials(
+                access_key_id=settings.videos_s3_access_key_id,
+                secret_access_key=settings.videos_s3_secret_access_key,
+                session_token=settings.videos_s3_session_token,
+            )
+        return S3VideoRepository(
+            bucket=settings.videos_s3_bucket,
+            cache=DiskClipCache(
+                directory=settings.clip_cache_directory,
+                max_bytes=settings.clip_cache_max_mb * 2**20,
+            ),
+            prefix=settings.videos_s3_prefix,
+            endpoint_url=settings.videos_s3_endpoint_url,
+            region=settings.videos_s3_region,
+            credentials=credentials,
+            base_url="/signs",
+            max_connections=settings.videos_s3_max_connections,
+        )
+    
     return FileSystemVideoRepository(
         videos_directory=videos_dir,
         base_url="/signs",
@@ -26,11 +80,21 @@ def get_video_repository() -> FileSystemVideoRepository:
 
 
 @lru_cache
-def get_embedding_service() -> EmbeddingService:
+def get_sentence_model() -> "SentenceTransformer":
+    """Factory for the sentence-transformers model shared by all vocabularies."""
+    from app.services.embedding_service import load_embedding_model
+    
+    return load_embedding_model(get_settings().embedding_model)
+
+
+@lru_cache
+def get_embedding_service() -> "EmbeddingService":
     """
     Factory for embedding service.
     Pre-computes embeddings for all sign words on first call.
     """
+    from app.services.embedding_service import EmbeddingService
+    
     settings = get_settings()
     video_repo = get_video_repository()
     
@@ -41,21 +105,336 @@ def get_embedding_service() -> EmbeddingService:
         vocabulary=vocabulary,
         model_name=settings.embedding_model,
         similarity_threshold=settings.similarity_threshold,
+        model=get_sentence_model(),
     )
 
 
 @lru_cache
-def get_ner_service() -> NerService:
+def get_ner_service() -> "NerService":
     """Factory for NER service."""
+    from app.services.ner_service import NerService
+    
     settings = get_settings()
     return NerService(model_name=settings.spacy_model)
 
 
+def build_matcher(vocabulary: list[str], fallback: IEmbeddingMatcher | None) -> TieredMatcher:
+    """Put the configured matcher tiers in front of a fallback matcher."""
+    settings = get_settings()
+    return TieredMatcher.from_vocabulary(
+        vocabulary=vocabulary,
+        fallback=fallback,
+        stem=settings.matcher_stem_enabled,
+        lemma=settings.matcher_lemma_enabled,
+        synonyms_path=settings.matcher_synonyms_path,
+        typo=settings.matcher_typo_enabled,
+        typo_max_distance=settings.matcher_typo_max_distance,
+        typo_prefix_length=settings.matcher_typo_prefix_length,
+        typo_min_word_length=settings.matcher_typo_min_word_length,
+        typo_max_index_entries=settings.matcher_typo_max_index_entries,
+        lexicon_path=settings.matcher_lexicon_path,
+    )
+
+
+def build_fallback_matcher(vocabulary: list[str]) -> IEmbeddingMatcher | None:
+    """
+    Create the embedding matcher of the configured service profile.
+    The stand-in profile replaces the transformer with a model-free matcher;
+    the lite profile has none, so only the matcher tiers apply.
+    """
+    settings = get_settings()
+    if settings.service_profile == "lite":
+        return None
+    if settings.service_profile == "stand_in":
+        return HashingEmbeddingMatcher(
+            vocabulary=vocabulary,
+            similarity_threshold=settings.similarity_threshold,
+        )
+    
+    from app.services.embedding_service import EmbeddingService
+    
+    return EmbeddingService(
+        vocabulary=vocabulary,
+        model_name=settings.embedding_model,
+        similarity_threshold=settings.similarity_threshold,
+        model=get_sentence_model(),
+    )
+
+
+def build_phrase_matcher(
+    vocabulary: list[str],
+    fallback: IEmbeddingMatcher | None,
+) -> IPhraseMatcher | None:
+    """
+    Create the phrase matcher of a vocabulary (None if disabled).
+    Paraphrases are embedded with the fallback's model when it can encode
+    texts; otherwise only exact and stemmed phrases match.
+    """
+    settings = get_settings()
+    if not settings.matcher_phrases_enabled:
+        return None
+    return PhraseMatcher(
+        vocabulary=vocabulary,
+        encoder=fallback if isinstance(fallback, ITextEncoder) else None,
+        similarity_threshold=settings.matcher_phrase_threshold,
+        max_length=settings.matcher_phrase_max_length,
+        max_candidates=settings.matcher_phrase_max_candidates,
+    )
+
+
+@lru_cache
+def get_fallback_matcher() -> IEmbeddingMatcher | None:
+    """Factory for the embedding matcher of the default vocabulary (None in lite)."""
+    if get_settings().service_profile == "full":
+        return get_embedding_service()
+    return build_fallback_matcher(get_video_repository().get_available_words())
+
+
+@lru_cache
+def get_tiered_matcher() -> TieredMatcher:
+    """
+    Factory for the tiered matcher of the default vocabulary.
+    Exact/synonym/stem/lemma/typo tiers answer first; only the residue
+    reaches the embedding model (if the service profile has one).
+    """
+    vocabulary = get_video_repository().get_available_words()
+    return build_matcher(vocabulary, get_fallback_matcher())
+
+
+@lru_cache
+def get_phrase_matcher() -> IPhraseMatcher | None:
+    """Factory for the phrase matcher of the default vocabulary."""
+    vocabulary = get_video_repository().get_available_words()
+    return build_phrase_matcher(vocabulary, get_fallback_matcher())
+
+
+@lru_cache
+def get_embedding_matcher() -> IEmbeddingMatcher:
+    """Factory for the default vocabulary's matcher, memoized in the match cache."""
+    matcher = get_tiered_matcher()
+    match_cache = get_match_cache()
+    if match_cache is not None:
+        return CachingMatcher(matcher, match_cache)
+    return matcher
+
+
+@lru_cache
+def get_degraded_matcher() -> IEmbeddingMatcher:
+    """
+    Factory for the default vocabulary's degraded-mode matcher:
+    cached full results, else exact and stem lookups only.
+    """
+    matcher = get_tiered_matcher().restricted_to(DEGRADED_TIERS)
+    match_cache = get_match_cache()
+    if match_cache is not None:
+        return CachingMatcher(matcher, match_cache, read_only=True)
+    return matcher
+
+
+@lru_cache
+def get_ner_detector() -> INerDetector:
+    """Factory for the NER detector of the configured service profile."""
+    if get_settings().service_profile == "full":
+        return get_ner_service()
+    return RuleBasedNerDetector()
+
+
 @lru_cache
 def get_translation_service() -> TranslationService:
     """Factory for translation service with all dependencies."""
     return TranslationService(
-        embedding_matcher=get_embedding_service(),
-        ner_detector=get_ner_service(),
+        embedding_matcher=get_embedding_matcher(),
+        ner_detector=get_ner_detector(),
         video_repository=get_video_repository(),
+        result_cache=get_sentence_cache(),
+        degraded_matcher=get_degraded_matcher(),
+        phrase_matcher=get_phrase_matcher(),
+    )
+
+
+def build_async_translation_service(
+    matcher: IEmbeddingMatcher,
+    degraded_matcher: IEmbeddingMatcher,
+    repository: IVideoRepository,
+    phrase_matcher: IPhraseMatcher | None,
+    result_cache: LruCache[str, TranslationResult] | None = None,
+) -> AsyncTranslationService:
+    """
+    Create the async translation service of a vocabulary over its
+    synchronous components. Model calls and file system lookups run in
+    worker threads; in-memory lookups run inline.
+    """
+    return AsyncTranslationService(
+        embedding_matcher=AsyncEmbeddingMatcherAdapter(matcher),
+        ner_detector=get_async_ner_detector(),
+        video_repository=AsyncVideoRepositoryAdapter(
+            repository,
+            # Answers from its bucket index without I/O
+            offload=not isinstance(repository, S3VideoRepository),
+        ),
+        result_cache=result_cache,
+        # Cached results plus exact and stem lookups only
+        degraded_matcher=AsyncEmbeddingMatcherAdapter(degraded_matcher, offload=False),
+        phrase_matcher=phrase_matcher,
+    )
+
+
+@lru_cache
+def get_async_ner_detector() -> AsyncNerDetectorAdapter:
+    """Factory for the async NER detector, shared by all vocabularies."""
+    return AsyncNerDetectorAdapter(get_ner_detector())
+
+
+@lru_cache
+def get_async_translation_service() -> AsyncTranslationService:
+    """Factory for the default vocabulary's async translation service."""
+    return build_async_translation_service(
+        matcher=get_embedding_matcher(),
+        degraded_matcher=get_degraded_matcher(),
+        repository=get_video_repository(),
+        phrase_matcher=get_phrase_matcher(),
+        result_cache=get_sentence_cache(),
+    )
+
+
+@lru_cache
+def get_match_cache() -> LruCache[str, MatchResult] | None:
+    """Factory for the process-wide word match cache (None if disabled)."""
+    size = get_settings().cache_match_size
+    return LruCache("matches", size) if size > 0 else None
+
+
+@lru_cache
+def get_sentence_cache() -> LruCache[str, TranslationResult] | None:
+    """Factory for the process-wide translated text cache (None if disabled)."""
+    size = get_settings().cache_sentence_size
+    return LruCache("sentences", size) if size > 0 else None
+
+
+def translation_fingerprint(vocabulary: list[str]) -> str:
+    """
+    Fingerprint of everything besides the text that a translation into
+    a vocabulary depends on: its words, the embedding and NER models
+    and matcher settings.
+    """
+    settings = get_settings()
+    matcher_settings = sorted(
+        (name, str(value))
+        for name, value in settings.model_dump().items()
+        if name.startswith("matcher_")
+    )
+    return compute_fingerprint(
+        vocabulary,
+        settings.app_version,
+        settings.service_profile,
+        settings.embedding_model,
+        # Entities decide which words are fingerspelled
+        settings.spacy_model,
+        settings.similarity_threshold,
+        matcher_settings,
+    )
+
+
+@lru_cache
+def get_cache_warmer() -> CacheWarmer:
+    """
+    Factory for the cache snapshot writer/loader.
+    The fingerprint covers everything a cached match depends on, so
+    snapshots from a different vocabulary or model are only replayed.
+    """
+    settings = get_settings()
+    fingerprint = translation_fingerprint(get_video_repository().get_available_words())
+    
+    return CacheWarmer(
+        path=settings.cache_snapshot_path,
+        fingerprint=fingerprint,
+        match_cache=get_match_cache(),
+        sentence_cache=get_sentence_cache(),
+        max_words=settings.cache_snapshot_max_words,
+        max_sentences=settings.cache_snapshot_max_sentences,
+        max_age_seconds=settings.cache_snapshot_max_age_seconds,
+    )
+
+
+@lru_cache
+def get_document_service() -> DocumentTranslationService:
+    """Factory for long-document translation service."""
+    settings = get_settings()
+    return DocumentTranslationService(
+        translation_service=get_translation_service(),
+        max_workers=settings.document_workers,
+        chunk_sentences=settings.document_chunk_sentences,
+        chunk_max_chars=settings.document_chunk_max_chars,
+    )
+
+
+@lru_cache
+def get_clip_manifest_service() -> ClipManifestService:
+    """Factory for the clip manifests of the compact translation format."""
+    return ClipManifestService(max_size=get_settings().manifest_cache_size)
+
+
+def _load_vocabulary(name: str) -> LoadedVocabulary:
+    """
+    Build a named vocabulary for the registry.
+    The default vocabulary reuses the process-wide singletons (and their
+    caches) and is pinned; the others get their own repository, matcher
+    indexes and embedding matrix, sharing the model and NER pipeline.
+    """
+    settings = get_settings()
+    
+    if name == settings.default_vocabulary:
+        service = get_translation_service()
+        return LoadedVocabulary(
+            name=name,
+            translation_service=service,
+            async_translation_service=get_async_translation_service(),
+            video_repository=get_video_repository(),
+            memory_bytes=get_embedding_matcher().estimate_memory_bytes()
+            + (get_phrase_matcher().estimate_memory_bytes() if get_phrase_matcher() else 0),
+            fingerprint=translation_fingerprint(get_video_repository().get_available_words()),
+            pinned=True,
+        )
+    
+    repository = FileSystemVideoRepository(
+        videos_directory=settings.vocabularies[name],
+        base_url=f"/signs/{name}",
+    )
+    vocabulary = repository.get_available_words()
+    fallback = build_fallback_matcher(vocabulary)
+    matcher = build_matcher(vocabulary, fallback)
+    phrase_matcher = build_phrase_matcher(vocabulary, fallback)
+    degraded_matcher = matcher.restricted_to(DEGRADED_TIERS)
+    
+    return LoadedVocabulary(
+        name=name,
+        translation_service=TranslationService(
+            embedding_matcher=matcher,
+            ner_detector=get_ner_detector(),
+            video_repository=repository,
+            degraded_matcher=degraded_matcher,
+            phrase_matcher=phrase_matcher,
+        ),
+        async_translation_service=build_async_translation_service(
+            matcher=matcher,
+            degraded_matcher=degraded_matcher,
+            repository=repository,
+            phrase_matcher=phrase_matcher,
+        ),
+        video_repository=repository,
+        memory_bytes=matcher.estimate_memory_bytes()
+        + (phrase_matcher.estimate_memory_bytes() if phrase_matcher else 0),
+        fingerprint=translation_fingerprint(vocabulary),
+    )
+
+
+@lru_cache
+def get_vocabulary_registry() -> VocabularyRegistry:
+    """Factory for the registry of named sign vocabularies."""
+    settings = get_settings()
+    return VocabularyRegistry(
+        names=list(dict.fromkeys([settings.default_vocabulary, *settings.vocabularies])),
+        default=settings.default_vocabulary,
+        loader=_load_vocabulary,
+        memory_budget_bytes=settings.vocabulary_memory_budget_mb * 2**20,
     )
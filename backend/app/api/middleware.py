@@ -0,0 +1,224 @@
+"""
+API Middleware.
+Pure ASGI middleware for request instrumentation.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import random
+import threading
+import time
+import uuid
+from pathlib import Path
+from urllib.parse import parse_qs
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import REQUEST_SECONDS, begin_request_timings, get_request_timings
+from app.core.profiling import RequestProfile, begin_request_profile
+
+# Request bodies larger than this are hashed up to the limit only
+_MAX_CAPTURED_BODY = 1024 * 1024
+
+
+def _route_label(scope: Scope) -> str:
+    """Low-cardinality route label for a request scope."""
+    route = scope.get("route")
+    if route is not None and getattr(route, "name", None):
+        return route.name
+    endpoint = scope.get("endpoint")
+    if endpoint is not None:
+        return getattr(endpoint, "__name__", type(endpoint).__name__)
+    return "unmatched"
+
+
+def format_server_timing(timings: dict[str, float], total: float) -> str:
+    """Render stage timings (seconds) as a Server-Timing header value in ms."""
+    metrics = [f"{stage};dur={seconds * 1000:.3f}" for stage, seconds in timings.items()]
+    metrics.append(f"total;dur={total * 1000:.3f}")
+    return ", ".join(metrics)
+
+
+class ServerTimingMiddleware:
+    """
+    Collects per-stage timings of a request.
+    
+    Stage timings recorded by the services (tokenize, ner, embed,
+    similarity, lookup) are attached to the response as a Server-Timing
+    header, and the request latency is recorded by route.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        timings = begin_request_timings()
+        started = time.perf_counter()
+        status_code = 500
+        
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    format_server_timing(timings, time.perf_counter() - started),
+                )
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                method=scope["method"],
+                route=_route_label(scope),
+                status=str(status_code),
+            )
+
+
+def _text_hash(scope: Scope, body: bytes) -> str:
+    """SHA-256 of the request text (JSON 'text' field, 'text' query param or raw body)."""
+    text: str | None = None
+    
+    if body:
+        try:
+            payload = json.loads(body)
+            if isinstance(payload, dict) and isinstance(payload.get("text"), str):
+                text = payload["text"]
+        except ValueError:
+            pass
+    else:
+        values = parse_qs(scope.get("query_string", b"").decode("latin-1")).get("text")
+        if values:
+            text = values[0]
+    
+    data = text.encode("utf-8") if text is not None else body
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_profile(
+    directory: Path,
+    max_files: int,
+    profile_id: str,
+    profile: RequestProfile,
+    metadata: dict,
+) -> None:
+    """Write a profile and its metadata, then prune the oldest artefacts."""
+    directory.mkdir(parents=True, exist_ok=True)
+    if profile.call_count:
+        profile.stats().dump_stats(directory / f"{profile_id}.prof")
+    (directory / f"{profile_id}.json").write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    
+    # Keep the directory bounded: each profile is a .json (+ .prof) pair
+    profiles = sorted(directory.glob("*.json"), key=lambda path: (path.stat().st_mtime, path.name))
+    for path in profiles[: max(0, len(profiles) - max_files)]:
+        path.unlink(missing_ok=True)
+        path.with_suffix(".prof").unlink(missing_ok=True)
+
+
+class ProfilingMiddleware:
+    """
+    Profiles a sample of requests with cProfile.
+    
+    A request is profiled with probability `sample_rate`, or always when
+    it carries an `X-Profile-Token` header matching the configured token.
+    Each profile is written as `<id>.prof` (pstats, loadable by snakeviz,
+    flameprof or gprof2dot) with an `<id>.json` sidecar holding the
+    request text hash, stage timings, duration and number of profiled
+    calls. At most `max_files` profiles are kept.
+    
+    Only one request is profiled at a time. The profile covers the
+    service calls the request makes (matching, phrases, NER, video
+    lookups; see app.core.profiling), in whichever thread they run, and
+    nothing of other requests. Requests making no such call get the
+    sidecar only.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        directory: Path,
+        sample_rate: float = 0.01,
+        header_token: str | None = None,
+        max_files: int = 200,
+    ):
+        self.app = app
+        self._directory = directory
+        self._sample_rate = sample_rate
+        self._header_token = header_token
+        self._max_files = max_files
+        self._lock = threading.Lock()
+
+    def _should_profile(self, scope: Scope) -> bool:
+        """Decide whether to profile a request."""
+        if self._header_token:
+            token = Headers(scope=scope).get("x-profile-token")
+            if token is not None and hmac.compare_digest(token, self._header_token):
+                return True
+        return random.random() < self._sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+        
+        # Another request is being profiled; cProfile allows one at a time
+        if not self._lock.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+        
+        profile_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        body = bytearray()
+        status_code = 500
+        
+        async def capture_receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.request" and len(body) < _MAX_CAPTURED_BODY:
+                body.extend(message.get("body", b"")[: _MAX_CAPTURED_BODY - len(body)])
+            return message
+        
+        async def send_with_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("X-Profile-Id", profile_id)
+            await send(message)
+        
+        profile = begin_request_profile()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, capture_receive, send_with_id)
+            
+            metadata = {
+                "id": profile_id,
+                "timestamp": time.time(),
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status_code,
+                "text_sha256": _text_hash(scope, bytes(body)),
+                "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                "profiled_calls": profile.call_count,
+                "stage_timings_ms": {
+                    stage: round(seconds * 1000, 3)
+                    for stage, seconds in (get_request_timings() or {}).items()
+                },
+            }
+            await asyncio.to_thread(
+                _write_profile,
+                self._directory,
+                self._max_files,
+                profile_id,
+                profile,
+                metadata,
+            )
+        finally:
+            self._lock.release()
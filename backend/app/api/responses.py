@@ -0,0 +1,127 @@
+"""
+API Responses.
+Serializes translation results straight to JSON bytes with orjson,
+skipping the intermediate Pydantic models.
+"""
+
+import hashlib
+from typing import Any
+from urllib.parse import quote
+
+import orjson
+from fastapi import Response
+
+from app.services.clip_manifest import ITEM_TYPE_CODES, ClipManifest
+from app.services.translation_service import TranslationResult
+
+
+def build_stats(result: TranslationResult) -> dict:
+    """Build the stats block of a translation response."""
+    return {
+        "video_count": result.video_count,
+        "fingerspell_count": result.fingerspell_count,
+        "skipped_count": result.skipped_count,
+        "total": len(result.items),
+        "total_duration": result.total_duration,
+    }
+
+
+def translation_payload(result: TranslationResult) -> dict:
+    """
+    Build the TranslationResponse body for a result.
+    
+    Items are left as TranslationItem dataclasses; orjson serializes
+    their fields directly, in the same order as TranslationItemSchema.
+    """
+    return {
+        "success": True,
+        "original_text": result.original_text,
+        "translations": result.items,
+        "stats": build_stats(result),
+        "degraded": result.degraded,
+    }
+
+
+def compact_translation_payload(result: TranslationResult, manifest: ClipManifest) -> dict:
+    """
+    Build the compact body of a translation result.
+    
+    Items are packed arrays [type code, original word, clip ID] that
+    reference clips of the given manifest; fingerspelled items spell the
+    letters of their word and skipped items have no third element. A
+    clip missing from the manifest is sent as its URL instead of an ID.
+    """
+    items = []
+    for item in result.items:
+        packed = [ITEM_TYPE_CODES[item.type], item.original_word]
+        if item.type == "video":
+            packed.append(manifest.clip_ids.get(item.matched_word, item.url))
+        items.append(packed)
+    
+    return {
+        "manifest": manifest.version,
+        "original_text": result.original_text,
+        "items": items,
+        "stats": build_stats(result),
+        "degraded": result.degraded,
+    }
+
+
+def preload_links(result: TranslationResult, limit: int) -> str | None:
+    """
+    Build a Link header preloading the first clips of a result.
+    
+    Args:
+        result: Translation result
+        limit: Maximum number of distinct clips to preload
+        
+    Returns:
+        Header value, or None if the result has no clips
+    """
+    urls = list(dict.fromkeys(item.url for item in result.items if item.url))[:limit]
+    if not urls:
+        return None
+    return ", ".join(f"<{quote(url)}>; rel=preload; as=video" for url in urls)
+
+
+def dumps(payload: Any) -> bytes:
+    """Serialize a payload (dicts, lists, dataclasses) to JSON bytes."""
+    return orjson.dumps(payload)
+
+
+def json_response(
+    payload: Any,
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Create a JSON response without FastAPI's response_model validation."""
+    return Response(
+        content=dumps(payload),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+def strong_etag(*parts: str) -> str:
+    """Build a strong ETag from the parts a response depends on."""
+    digest = hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+    
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so a
+    CDN that weakened the tag (e.g. after compressing) still revalidates.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
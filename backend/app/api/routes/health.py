@@ -5,10 +5,11 @@ Provides API health and status information.
 
 from fastapi import APIRouter, Depends
 
-from app.api.dependencies import get_translation_service
+from app.api.dependencies import get_translation_service, get_vocabulary_registry
 from app.config import get_settings, Settings
 from app.schemas.translation import HealthResponse
 from app.services.translation_service import TranslationService
+from app.services.vocabulary_registry import VocabularyRegistry
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
@@ -22,15 +23,18 @@ router = APIRouter(prefix="/health", tags=["Health"])
 async def health_check(
     settings: Settings = Depends(get_settings),
     translation_service: TranslationService = Depends(get_translation_service),
+    registry: VocabularyRegistry = Depends(get_vocabulary_registry),
 ) -> HealthResponse:
     """
     Get API health status.
     
     Returns:
-        Health status with version and available word count
+        Health status with version, available word count and vocabularies
     """
     return HealthResponse(
         status="healthy",
         version=settings.app_version,
         available_words=translation_service.get_available_word_count(),
+        vocabularies=registry.names,
+        loaded_vocabularies=registry.loaded_names(),
     )
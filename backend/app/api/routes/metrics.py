@@ -0,0 +1,26 @@
+"""
+Metrics Routes.
+Exposes pipeline metrics in Prometheus text format.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import REGISTRY
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Prometheus metrics",
+    description="Per-stage latency histograms, match and cache counters, "
+    "vocabulary size and model load times",
+)
+async def metrics() -> PlainTextResponse:
+    """Render all metrics in Prometheus text exposition format."""
+    return PlainTextResponse(
+        REGISTRY.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -3,18 +3,214 @@ Translation API Routes.
 Semantic matching with embedding similarity and NER fallback.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+import time
+from collections.abc import AsyncIterator
+from typing import Any, Literal
 
-from app.api.dependencies import get_translation_service
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+
+from app.api.admission import admit, admit_document
+from app.api.client_hints import RENDITION_HINT_HEADERS, select_rendition
+from app.api.dependencies import get_clip_manifest_service, get_document_service, get_vocabulary_registry
+from app.api.responses import (
+    build_stats,
+    compact_translation_payload,
+    dumps,
+    etag_matches,
+    json_response,
+    preload_links,
+    strong_etag,
+    translation_payload,
+)
+from app.config import Settings, get_settings
+from app.core.deadlines import FULL_TRANSLATION_LATENCY, remaining_seconds
+from app.core.metrics import DEGRADED_TRANSLATIONS
 from app.schemas.translation import (
     TranslationRequest,
+    IncrementalTranslationRequest,
     TranslationResponse,
-    TranslationItemSchema,
+    CompactTranslationResponse,
+    ClipManifestResponse,
+    DocumentTranslationRequest,
 )
-from app.services.translation_service import TranslationService
+from app.services.async_translation_service import AsyncTranslationService
+from app.services.clip_manifest import ClipManifest, ClipManifestService
+from app.services.document_service import DocumentTranslationService
+from app.services.incremental_translation import IncrementalTranslationSession
+from app.services.translation_service import TranslationResult, TranslationService
+from app.services.vocabulary_registry import LoadedVocabulary, UnknownVocabularyError, VocabularyRegistry
 
 router = APIRouter(prefix="/translate", tags=["Translation"])
 
+ResponseFormat = Literal["full", "compact"]
+
+_FORMAT_DESCRIPTION = "Response body: 'full' items, or 'compact' items referencing clip manifest IDs"
+_COMPACT_RESPONSES = {
+    200: {
+        "description": "TranslationResponse, or CompactTranslationResponse with format=compact",
+        "model": TranslationResponse | CompactTranslationResponse,
+    },
+}
+
+
+def _get_vocabulary(registry: VocabularyRegistry, vocabulary: str | None) -> LoadedVocabulary:
+    """Resolve a vocabulary by name; 404 if it is unknown."""
+    try:
+        return registry.get(vocabulary)
+    except UnknownVocabularyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown vocabulary '{vocabulary}'. Available: {', '.join(registry.names)}",
+        )
+
+
+def _get_translation_service(registry: VocabularyRegistry, vocabulary: str | None) -> TranslationService:
+    """Resolve the translation service of a vocabulary; 404 if it is unknown."""
+    return _get_vocabulary(registry, vocabulary).translation_service
+
+
+async def _translate(
+    translation_service: AsyncTranslationService,
+    text: str,
+    settings: Settings,
+    rendition: str | None = None,
+) -> TranslationResult:
+    """
+    Translate, degrading if the request's deadline is too close for the
+    full pipeline, and point videos at the rendition.
+    """
+    remaining = remaining_seconds()
+    degraded = (
+        settings.degraded_mode_enabled
+        and remaining is not None
+        and remaining < FULL_TRANSLATION_LATENCY.value
+    )
+    
+    try:
+        started = time.perf_counter()
+        result = await translation_service.translate(text, degraded)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Translation failed: {str(e)}",
+        )
+    
+    if result.degraded:
+        DEGRADED_TRANSLATIONS.inc()
+    else:
+        FULL_TRANSLATION_LATENCY.observe(time.perf_counter() - started)
+    
+    if rendition is not None:
+        result = await translation_service.with_rendition(result, rendition)
+    return result
+
+
+async def _get_manifest(
+    manifests: ClipManifestService,
+    loaded: LoadedVocabulary,
+    response_format: ResponseFormat,
+    rendition: str | None,
+) -> ClipManifest | None:
+    """Clip manifest compact responses refer to (None for full responses)."""
+    if response_format != "compact":
+        return None
+    # The first build of a manifest reads the whole clip listing
+    return await run_in_threadpool(manifests.get, loaded, rendition)
+
+
+def _payload(result: TranslationResult, manifest: ClipManifest | None) -> dict:
+    """Response body of a result: compact if there is a manifest, full otherwise."""
+    if manifest is None:
+        return translation_payload(result)
+    return compact_translation_payload(result, manifest)
+
+
+def _preload_headers(result: TranslationResult, settings: Settings) -> dict[str, str]:
+    """Link header preloading the first clips of a result (if enabled)."""
+    if settings.preload_clip_count <= 0:
+        return {}
+    links = preload_links(result, settings.preload_clip_count)
+    return {"Link": links} if links else {}
+
+
+@router.get(
+    "",
+    response_model=TranslationResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Translate text to sign language (cacheable)",
+    description="""
+    Same translation as POST, for browser and CDN caching.
+    
+    Whitespace in `text` is normalised. Responses carry a strong ETag
+    derived from the text, the vocabulary, model and matcher version and
+    the clip manifest version (clip URLs, sizes, durations), and
+    `Cache-Control: public`; requests whose `If-None-Match` matches
+    get `304 Not Modified` without translating. Degraded responses are
+    marked `no-store`. Clip renditions are chosen from the Save-Data,
+    ECT and Downlink client hints.
+    
+    With `format=compact`, items reference clips by their ID in the
+    clip manifest (`GET /translate/manifest`) of the given version.
+    """,
+    responses={
+        **_COMPACT_RESPONSES,
+        304: {"description": "Translation unchanged since the given ETag"},
+    },
+)
+async def translate_text_cacheable(
+    http_request: Request,
+    text: str = Query(..., min_length=1, max_length=1000, description="Text to translate"),
+    vocabulary: str | None = Query(None, description="Sign vocabulary (default if omitted)"),
+    response_format: ResponseFormat = Query("full", alias="format", description=_FORMAT_DESCRIPTION),
+    if_none_match: str | None = Header(None),
+    settings: Settings = Depends(get_settings),
+    registry: VocabularyRegistry = Depends(get_vocabulary_registry),
+    manifests: ClipManifestService = Depends(get_clip_manifest_service),
+) -> Response:
+    """Translate text to sign language video URLs, with HTTP caching."""
+    loaded = await run_in_threadpool(_get_vocabulary, registry, vocabulary)
+    text = " ".join(text.split())
+    rendition = select_rendition(http_request.headers)
+    # Full bodies embed clip URLs and metadata too, so re-encoded clips must change the ETag
+    manifest = await run_in_threadpool(manifests.get, loaded, rendition)
+    
+    etag = strong_etag(loaded.name, loaded.fingerprint, rendition or "", response_format, text, manifest.version)
+    cache_headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.translate_cache_max_age_seconds}",
+        "Vary": RENDITION_HINT_HEADERS,
+    }
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+    
+    # Revalidations above never wait for a translation slot
+    await admit(http_request)
+    result = await _translate(loaded.async_translation_service, text, settings, rendition)
+    headers = _preload_headers(result, settings)
+    if result.degraded:
+        # Must not stand in for the full translation in any cache
+        headers["Cache-Control"] = "no-store"
+    else:
+        headers.update(cache_headers)
+    return json_response(
+        _payload(result, manifest if response_format == "compact" else None), headers=headers
+    )
+
 
 @router.post(
     "",
@@ -29,40 +225,239 @@ router = APIRouter(prefix="/translate", tags=["Translation"])
     2. If similarity >= threshold → use matched sign video
     3. If no match, check NER → if named entity → fingerspell
     4. Otherwise → skip word
+    
+    Video URLs point to a lower-bitrate rendition when the Save-Data,
+    ECT or Downlink client hints indicate a slow connection.
+    
+    If the request's remaining deadline is shorter than a full translation
+    is expected to take, only cheap exact/stem matching is done, NER is
+    skipped and the response is marked `degraded`.
+    
+    With `?format=compact`, items reference clips by their ID in the
+    clip manifest (`GET /translate/manifest`) of the given version.
     """,
+    responses=_COMPACT_RESPONSES,
 )
 async def translate_text(
     request: TranslationRequest,
-    translation_service: TranslationService = Depends(get_translation_service),
-) -> TranslationResponse:
+    http_request: Request,
+    response_format: ResponseFormat = Query("full", alias="format", description=_FORMAT_DESCRIPTION),
+    settings: Settings = Depends(get_settings),
+    registry: VocabularyRegistry = Depends(get_vocabulary_registry),
+    manifests: ClipManifestService = Depends(get_clip_manifest_service),
+) -> Response:
     """Translate text to sign language video URLs."""
-    try:
-        result = translation_service.translate(request.text)
-        
-        return TranslationResponse(
-            success=True,
-            original_text=result.original_text,
-            translations=[
-                TranslationItemSchema(
-                    original_word=item.original_word,
-                    matched_word=item.matched_word,
-                    type=item.type,
-                    url=item.url,
-                    letters=item.letters,
-                    similarity=item.similarity,
-                )
-                for item in result.items
-            ],
-            stats={
-                "video_count": result.video_count,
-                "fingerspell_count": result.fingerspell_count,
-                "skipped_count": result.skipped_count,
-                "total": len(result.items),
-            },
-        )
-    except Exception as e:
+    # Loading a vocabulary may take seconds; keep it off the event loop
+    loaded = await run_in_threadpool(_get_vocabulary, registry, request.vocabulary)
+    rendition = select_rendition(http_request.headers)
+    manifest = await _get_manifest(manifests, loaded, response_format, rendition)
+    await admit(http_request)
+    result = await _translate(loaded.async_translation_service, request.text, settings, rendition)
+    
+    # Serialized directly; response_model only documents the schema
+    return json_response(_payload(result, manifest), headers=_preload_headers(result, settings))
+
+
+@router.get(
+    "/manifest",
+    response_model=ClipManifestResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Clip manifest of a vocabulary",
+    description="""
+    Maps the integer clip IDs of compact translation responses to clip
+    URLs and playback metadata, one row per clip.
+    
+    The manifest changes only when the vocabulary's clips or their
+    metadata do (S3 clips are probed once downloaded). It is
+    served with its version as strong ETag and a long
+    `Cache-Control: public` lifetime; requests whose `If-None-Match`
+    matches get `304 Not Modified`. Clients keep it until a compact
+    response names another `manifest` version. Clip URLs point to the
+    rendition chosen from the Save-Data, ECT and Downlink client hints.
+    """,
+    responses={304: {"description": "Manifest unchanged since the given ETag"}},
+)
+async def get_clip_manifest(
+    http_request: Request,
+    vocabulary: str | None = Query(None, description="Sign vocabulary (default if omitted)"),
+    if_none_match: str | None = Header(None),
+    settings: Settings = Depends(get_settings),
+    registry: VocabularyRegistry = Depends(get_vocabulary_registry),
+    manifests: ClipManifestService = Depends(get_clip_manifest_service),
+) -> Response:
+    """Get the clip manifest of a vocabulary, with HTTP caching."""
+    loaded = await run_in_threadpool(_get_vocabulary, registry, vocabulary)
+    manifest = await run_in_threadpool(manifests.get, loaded, select_rendition(http_request.headers))
+    
+    headers = {
+        "ETag": manifest.etag,
+        "Cache-Control": f"public, max-age={settings.manifest_cache_max_age_seconds}",
+        "Vary": RENDITION_HINT_HEADERS,
+    }
+    if etag_matches(if_none_match, manifest.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    # Serialized once per manifest
+    return Response(content=manifest.body, headers=headers, media_type="application/json")
+
+
+@router.post(
+    "/document",
+    status_code=status.HTTP_200_OK,
+    summary="Translate a long document to sign language",
+    description="""
+    Translates documents longer than the single-request limit.
+    
+    The text is split into sentences, sentence chunks are translated in
+    parallel, and results are streamed back in document order as
+    newline-delimited JSON: one 'chunk' line per chunk, then a 'summary'
+    line (or an 'error' line if translation fails part way).
+    
+    At most MAX_CONCURRENT_DOCUMENTS documents are streamed at once;
+    others get `503` with `Retry-After`.
+    """,
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def translate_document(
+    request: DocumentTranslationRequest,
+    http_request: Request,
+    settings: Settings = Depends(get_settings),
+    document_service: DocumentTranslationService = Depends(get_document_service),
+    registry: VocabularyRegistry = Depends(get_vocabulary_registry),
+) -> StreamingResponse:
+    """Translate a long document, streaming chunk results as NDJSON."""
+    if len(request.text) > settings.document_max_length:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Translation failed: {str(e)}",
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Document exceeds {settings.document_max_length} characters",
         )
+    translation_service = await run_in_threadpool(_get_translation_service, registry, request.vocabulary)
+    # Held until the whole stream is sent
+    await admit_document(http_request)
+    
+    return StreamingResponse(
+        _stream_document(document_service, translation_service, request.text),
+        media_type="application/x-ndjson",
+    )
 
+
+async def _stream_document(
+    document_service: DocumentTranslationService,
+    translation_service: TranslationService,
+    text: str,
+) -> AsyncIterator[bytes]:
+    """Serialize document chunk results as NDJSON lines."""
+    totals = {
+        "video_count": 0,
+        "fingerspell_count": 0,
+        "skipped_count": 0,
+        "total": 0,
+        "total_duration": 0.0,
+    }
+    chunk_count = 0
+    
+    try:
+        async for chunk_result in document_service.translate_stream(text, translation_service):
+            chunk = chunk_result.chunk
+            items = [item for result in chunk_result.sentences for item in result.items]
+            stats = dict.fromkeys(totals, 0)
+            for result in chunk_result.sentences:
+                for key, value in build_stats(result).items():
+                    stats[key] += value
+                    totals[key] += value
+            stats["total_duration"] = round(stats["total_duration"], 3)
+            chunk_count += 1
+            
+            # Same shape as DocumentChunkResponse
+            yield dumps({
+                "type": "chunk",
+                "index": chunk.index,
+                "start": chunk.start,
+                "end": chunk.end,
+                "original_text": text[chunk.start:chunk.end],
+                "translations": items,
+                "stats": stats,
+            }) + b"\n"
+    except Exception as e:
+        yield dumps({"type": "error", "detail": f"Translation failed: {str(e)}"}) + b"\n"
+        return
+    
+    # Same shape as DocumentSummaryResponse
+    totals["total_duration"] = round(totals["total_duration"], 3)
+    yield dumps({"type": "summary", "chunk_count": chunk_count, "stats": totals}) + b"\n"
+
+
+async def _receive_json(websocket: WebSocket) -> Any:
+    """Receive a JSON text frame; ValueError if the frame is not JSON text."""
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    text = message.get("text")
+    if text is None:
+        raise ValueError("Expected a JSON text frame")
+    return json.loads(text)
+
+
+@router.websocket("/ws")
+async def translate_incremental(
+    websocket: WebSocket,
+    vocabulary: str | None = Query(None, description="Sign vocabulary (default if omitted)"),
+    registry: VocabularyRegistry = Depends(get_vocabulary_registry),
+) -> None:
+    """
+    Incremental translation for as-you-type input.
+    
+    The client sends the full current text as {"text": "..."} on every
+    change. The server keeps per-connection state and replies with a
+    diff: replace `delete_count` items at index `start` with
+    `translations`. Updates that do not change any item are not answered.
+    The vocabulary is chosen per connection with ?vocabulary=<name>.
+    Frames that are not JSON text get an error frame.
+    """
+    await websocket.accept()
+    try:
+        # Loading a vocabulary and translating may take a while; keep them off the event loop
+        translation_service = (await run_in_threadpool(registry.get, vocabulary)).translation_service
+    except UnknownVocabularyError:
+        await websocket.send_json({"type": "error", "detail": f"Unknown vocabulary '{vocabulary}'"})
+        await websocket.close(code=1008)
+        return
+    
+    session = IncrementalTranslationSession(translation_service)
+    
+    try:
+        while True:
+            try:
+                message = await _receive_json(websocket)
+            except ValueError:
+                await websocket.send_json({"type": "error", "detail": "Invalid JSON message"})
+                continue
+            
+            try:
+                request = IncrementalTranslationRequest.model_validate(message)
+                diff = await run_in_threadpool(session.update, request.text)
+            except ValidationError as e:
+                await websocket.send_json({"type": "error", "detail": e.errors(include_url=False, include_context=False, include_input=False)})
+                continue
+            except Exception as e:
+                await websocket.send_json(
+                    {"type": "error", "detail": f"Translation failed: {str(e)}"}
+                )
+                continue
+            
+            if diff.is_empty:
+                continue
+            
+            # Same shape as TranslationDiffResponse
+            await websocket.send_text(
+                dumps({
+                    "type": "diff",
+                    "version": diff.version,
+                    "start": diff.start,
+                    "delete_count": diff.delete_count,
+                    "translations": diff.items,
+                    "stats": build_stats(diff.result),
+                }).decode("utf-8")
+            )
+    except WebSocketDisconnect:
+        pass
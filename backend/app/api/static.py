@@ -0,0 +1,62 @@
+"""
+Static Files.
+Serves sign clips with caching headers, so clips preloaded from a
+translation's Link header are reused when the player requests them.
+"""
+
+from os import PathLike, stat_result
+
+import httpx
+from fastapi.staticfiles import StaticFiles
+from starlette.responses import PlainTextResponse, Response
+from starlette.types import Scope
+
+from app.repositories.s3_video_repository import S3VideoRepository
+
+
+class SignClipFiles(StaticFiles):
+    """
+    StaticFiles with a Cache-Control header on every clip.
+
+    Byte-range requests (as sent by video elements) and ETag /
+    Last-Modified revalidation are handled by Starlette's FileResponse.
+    """
+
+    def __init__(self, *, directory: str | PathLike[str], max_age: int):
+        super().__init__(directory=directory)
+        self._cache_control = f"public, max-age={max_age}"
+
+    def file_response(
+        self,
+        full_path: str | PathLike[str],
+        stat_result: stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Serve a clip (or a 304) with the configured Cache-Control."""
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["cache-control"] = self._cache_control
+        return response
+
+
+class CachedClipFiles(SignClipFiles):
+    """
+    SignClipFiles over the local clip cache of an S3VideoRepository.
+
+    Clips missing from the cache are downloaded (once, however many
+    requests ask for them) before being served from disk.
+    """
+
+    def __init__(self, *, repository: S3VideoRepository, max_age: int):
+        super().__init__(directory=repository.cache.directory, max_age=max_age)
+        self._repository = repository
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """Read the clip through the cache, then serve it as a static file."""
+        if scope["method"] in ("GET", "HEAD"):
+            try:
+                await self._repository.fetch_clip(path)
+            except httpx.HTTPError as e:
+                print(f"Clip download failed for {path}: {e}")
+                return PlainTextResponse("Bad Gateway", status_code=502)
+        return await super().get_response(path, scope)
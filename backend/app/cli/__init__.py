@@ -0,0 +1 @@
+"""CLI package - offline command line tools."""
@@ -0,0 +1,241 @@
+"""
+Clip Optimisation - Offline faststart remux and bitrate renditions.
+Writes a faststart copy of every sign clip (moov before mdat, so
+playback starts before the download finishes) plus lower-bitrate
+renditions under renditions/<name>/, using ffmpeg.
+
+Usage (from the backend directory):
+    python -m app.cli.optimize_clips app/data/sign_animations --output /data/signs
+    python -m app.cli.optimize_clips SOURCE --output DIR --workers 8
+    python -m app.cli.optimize_clips SOURCE --output DIR --force   # ignore the manifest
+
+Serve the output directory as VIDEOS_DIRECTORY. Clips whose content
+and encoding settings are unchanged since the last run are skipped;
+outputs of deleted clips are removed. Exits with status 1 if any clip
+fails.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from app.repositories.clip_probe import is_faststart
+from app.repositories.video_repository import RENDITIONS_DIRECTORY
+
+MANIFEST_NAME = ".clip_manifest.json"
+MANIFEST_VERSION = 1
+VIDEO_EXTENSION = ".mp4"
+
+
+@dataclass(frozen=True)
+class Rendition:
+    """Encoding settings of one rendition."""
+
+    name: str
+    max_height: int  # Never upscaled
+    video_bitrate: str
+    audio_bitrate: str = "64k"
+
+
+RENDITIONS = (
+    Rendition("low", max_height=240, video_bitrate="150k"),
+    Rendition("medium", max_height=480, video_bitrate="400k"),
+)
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file's content."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def remux_command(ffmpeg: str, source: Path, target: Path) -> list[str]:
+    """ffmpeg arguments to move the moov box to the front without re-encoding."""
+    return [
+        ffmpeg, "-nostdin", "-y", "-loglevel", "error",
+        "-i", str(source),
+        "-map", "0", "-c", "copy",
+        "-movflags", "+faststart",
+        "-f", "mp4", str(target),
+    ]
+
+
+def rendition_command(ffmpeg: str, source: Path, target: Path, rendition: Rendition) -> list[str]:
+    """ffmpeg arguments to encode a faststart H.264 rendition."""
+    # Even height no larger than the source; width follows the aspect ratio
+    scale = f"scale=-2:'trunc(min({rendition.max_height},ih)/2)*2'"
+    return [
+        ffmpeg, "-nostdin", "-y", "-loglevel", "error",
+        "-i", str(source),
+        "-vf", scale,
+        "-c:v", "libx264", "-preset", "slow", "-profile:v", "main", "-pix_fmt", "yuv420p",
+        "-b:v", rendition.video_bitrate,
+        "-maxrate", rendition.video_bitrate, "-bufsize", rendition.video_bitrate,
+        "-c:a", "aac", "-b:a", rendition.audio_bitrate,
+        # One encoder thread per clip; clips are processed in parallel
+        "-threads", "1",
+        "-movflags", "+faststart",
+        "-f", "mp4", str(target),
+    ]
+
+
+def write_atomically(target: Path, write: Callable[[Path], None]) -> None:
+    """Write a file via a temporary name, so readers never see a partial clip."""
+    partial = target.with_name(target.name + ".part")
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        write(partial)
+        os.replace(partial, target)
+    finally:
+        partial.unlink(missing_ok=True)
+
+
+def run_ffmpeg(command: list[str]) -> None:
+    """Run an ffmpeg command, raising RuntimeError with its output on failure."""
+    try:
+        subprocess.run(command, check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(e.stderr.strip() or f"ffmpeg exited with status {e.returncode}") from e
+
+
+def optimize_clip(ffmpeg: str, source: Path, output: Path, renditions: tuple[Rendition, ...]) -> str:
+    """
+    Write the faststart copy and the renditions of one clip.
+
+    Returns:
+        "remuxed", "copied" (already faststart) or "invalid" (not a
+        readable MP4, e.g. a git-lfs pointer; copied as-is, no renditions)
+    """
+    target = output / source.name
+    faststart = is_faststart(source)
+    if faststart is None:
+        write_atomically(target, lambda path: shutil.copyfile(source, path))
+        remove_outputs(output, source.name, renditions, keep_original=True)
+        return "invalid"
+
+    if faststart:
+        write_atomically(target, lambda path: shutil.copyfile(source, path))
+    else:
+        write_atomically(target, lambda path: run_ffmpeg(remux_command(ffmpeg, source, path)))
+
+    for rendition in renditions:
+        write_atomically(
+            output / RENDITIONS_DIRECTORY / rendition.name / source.name,
+            lambda path: run_ffmpeg(rendition_command(ffmpeg, source, path, rendition)),
+        )
+    return "copied" if faststart else "remuxed"
+
+
+def remove_outputs(
+    output: Path,
+    name: str,
+    renditions: tuple[Rendition, ...],
+    keep_original: bool = False,
+) -> None:
+    """Delete the outputs of a clip (its renditions only if keep_original)."""
+    if not keep_original:
+        (output / name).unlink(missing_ok=True)
+    for rendition in renditions:
+        (output / RENDITIONS_DIRECTORY / rendition.name / name).unlink(missing_ok=True)
+
+
+def load_manifest(path: Path, settings_key: str) -> dict[str, str]:
+    """Clip hashes of the last run, or none if the settings changed."""
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get("settings") != settings_key:
+        return {}
+    return manifest.get("clips", {})
+
+
+def save_manifest(path: Path, settings_key: str, clips: dict[str, str]) -> None:
+    """Write the manifest atomically."""
+    partial = path.with_name(path.name + ".part")
+    partial.write_text(
+        json.dumps({"version": MANIFEST_VERSION, "settings": settings_key, "clips": clips}, indent=1),
+        encoding="utf-8",
+    )
+    os.replace(partial, path)
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Remux sign clips to faststart and encode renditions")
+    parser.add_argument("source", type=Path, help="directory of source clips")
+    parser.add_argument("--output", type=Path, required=True, help="directory to write optimised clips to")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="clips processed in parallel")
+    parser.add_argument("--ffmpeg", default="ffmpeg", help="ffmpeg executable")
+    parser.add_argument("--force", action="store_true", help="reprocess clips even if unchanged")
+    args = parser.parse_args()
+
+    ffmpeg = shutil.which(args.ffmpeg)
+    if ffmpeg is None:
+        parser.error(f"ffmpeg not found: {args.ffmpeg}")
+    if args.source.resolve() == args.output.resolve():
+        parser.error("--output must differ from the source directory")
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    manifest_path = args.output / MANIFEST_NAME
+    settings_key = json.dumps([asdict(rendition) for rendition in RENDITIONS])
+    previous = {} if args.force else load_manifest(manifest_path, settings_key)
+
+    sources = sorted(args.source.glob(f"*{VIDEO_EXTENSION}"))
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        hashes = dict(zip(
+            (source.name for source in sources),
+            executor.map(file_hash, sources),
+        ))
+
+        pending = [source for source in sources if previous.get(source.name) != hashes[source.name]]
+        print(f"{len(pending)} of {len(sources)} clips to optimise with {args.workers} workers...")
+        futures = {
+            source.name: executor.submit(optimize_clip, ffmpeg, source, args.output, RENDITIONS)
+            for source in pending
+        }
+
+        clips = {name: digest for name, digest in previous.items() if hashes.get(name) == digest}
+        outcomes: Counter[str] = Counter()
+        for name, future in futures.items():
+            try:
+                outcome = future.result()
+            except (OSError, RuntimeError) as e:
+                print(f"Failed {name}: {e}")
+                outcomes["failed"] += 1
+                continue
+            if outcome == "invalid":
+                print(f"Copied {name} as-is: not a readable MP4 file")
+            clips[name] = hashes[name]
+            outcomes[outcome] += 1
+
+    for name in set(previous) - set(hashes):
+        remove_outputs(args.output, name, RENDITIONS)
+    save_manifest(manifest_path, settings_key, clips)
+
+    summary = ", ".join(f"{count} {outcome}" for outcome, count in sorted(outcomes.items()))
+    print(
+        f"Processed {len(pending)} clips in {time.perf_counter() - started:.1f}s "
+        f"({summary or 'nothing to do'}; {len(sources) - len(pending)} unchanged)"
+    )
+    if outcomes["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""
+Subtitle Translation - Sign tracks for SRT/WebVTT subtitle files.
+Streams a subtitle file cue by cue, translates chunks of cues across a
+process pool (one batched NER call and one batched matching call per
+chunk) and writes a JSONL sign track aligned to the cue timestamps.
+
+Usage (from the backend directory):
+    translate-subtitles movie.srt --output movie.signs.jsonl
+    python -m app.cli.subtitles movie.vtt --format signs --workers 8
+    python -m app.cli.subtitles movie.srt --profile lite > movie.signs.jsonl
+
+Output formats (one JSON object per line):
+    cues   {"cue", "start", "end", "text", "signs": [...], "skipped_count"}
+    signs  {"cue", "start", "end", "type", "word", "url", "letters", "speed"}
+Signs follow each other from the cue start at their natural duration
+(clip duration, or an estimate) and are sped up (speed > 1) to fit
+the cue. Skipped words are left out.
+
+Each worker process loads the models once. Only a bounded window of
+chunks is in flight, so memory stays constant for any file length.
+"""
+
+import argparse
+import html
+import multiprocessing
+import os
+import re
+import resource
+import sys
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import chain, islice
+from pathlib import Path
+from typing import BinaryIO
+
+import orjson
+
+from app.services.translation_service import TranslationItem, TranslationResult, TranslationService
+
+OUTPUT_FORMATS = ("cues", "signs")
+
+# Natural signing time of items without clip metadata
+DEFAULT_SIGN_SECONDS = 1.0
+FINGERSPELL_LETTER_SECONDS = 0.3
+
+_TIMESTAMP = r"(?:(\d+):)?(\d{1,2}):(\d{2})[,.](\d{1,3})"
+_TIMING_PATTERN = re.compile(rf"^\s*{_TIMESTAMP}\s*-->\s*{_TIMESTAMP}")
+# HTML-like tags (<i>, <c.yellow>, <v Speaker>) and SSA overrides ({\an8})
+_MARKUP_PATTERN = re.compile(r"<[^>]*>|\{\\[^}]*\}")
+
+
+@dataclass(frozen=True, slots=True)
+class Cue:
+    """A timed subtitle cue."""
+
+    index: int  # Position in the file, from 0
+    start: float  # Seconds
+    end: float
+    text: str
+
+
+def _seconds(hours: str | None, minutes: str, seconds: str, fraction: str) -> float:
+    """Convert timestamp fields to seconds."""
+    return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds) + int(fraction.ljust(3, "0")) / 1000
+
+
+def _parse_block(lines: list[str], index: int) -> Cue | None:
+    """Parse a blank-line separated block; None if it is not a cue (header, NOTE, STYLE)."""
+    for position, line in enumerate(lines):
+        timing = _TIMING_PATTERN.match(line)
+        if timing is None:
+            continue
+        fields = timing.groups()
+        text = " ".join(_MARKUP_PATTERN.sub("", text_line) for text_line in lines[position + 1:])
+        return Cue(
+            index=index,
+            start=_seconds(*fields[:4]),
+            end=_seconds(*fields[4:]),
+            text=" ".join(html.unescape(text).split()),
+        )
+    return None
+
+
+def iter_cues(lines: Iterable[str]) -> Iterator[Cue]:
+    """
+    Lazily parse SRT or WebVTT cues.
+
+    Args:
+        lines: Lines of the subtitle file
+
+    Yields:
+        Cues in file order
+    """
+    block: list[str] = []
+    index = 0
+
+    for line in chain(lines, [""]):
+        if line.strip():
+            block.append(line.rstrip("\r\n"))
+            continue
+        if block:
+            cue = _parse_block(block, index)
+            if cue is not None:
+                yield cue
+                index += 1
+            block = []
+
+
+def iter_chunks(cues: Iterable[Cue], size: int) -> Iterator[list[Cue]]:
+    """Group cues into lists of at most `size`."""
+    iterator = iter(cues)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def natural_duration(item: TranslationItem) -> float:
+    """Seconds an item takes to sign at normal speed."""
+    if item.type == "fingerspell":
+        return FINGERSPELL_LETTER_SECONDS * len(item.letters or ())
+    return item.duration or DEFAULT_SIGN_SECONDS
+
+
+def schedule_signs(cue: Cue, result: TranslationResult) -> list[dict]:
+    """
+    Place the signs of a cue on the timeline.
+
+    Args:
+        cue: Subtitle cue
+        result: Translation of the cue text
+
+    Returns:
+        Sign events with start/end times in seconds, in order
+    """
+    items = [item for item in result.items if item.type != "skipped"]
+    durations = [natural_duration(item) for item in items]
+    window = cue.end - cue.start
+    total = sum(durations)
+    speed = total / window if window > 0 and total > window else 1.0
+
+    signs = []
+    position = cue.start
+    for item, duration in zip(items, durations):
+        end = position + duration / speed
+        signs.append({
+            "start": round(position, 3),
+            "end": round(end, 3),
+            "type": item.type,
+            "word": item.matched_word or item.original_word,
+            "url": item.url,
+            "letters": item.letters,
+            "speed": round(speed, 3),
+        })
+        position = end
+    return signs
+
+
+def format_chunk(cues: list[Cue], results: list[TranslationResult], output_format: str) -> bytes:
+    """Render the JSONL lines of a translated chunk."""
+    lines = []
+    for cue, result in zip(cues, results):
+        signs = schedule_signs(cue, result)
+        if output_format == "signs":
+            lines.extend(orjson.dumps({"cue": cue.index, **sign}) for sign in signs)
+        else:
+            lines.append(orjson.dumps({
+                "cue": cue.index,
+                "start": cue.start,
+                "end": cue.end,
+                "text": cue.text,
+                "signs": signs,
+                "skipped_count": result.skipped_count,
+            }))
+    return b"".join(line + b"\n" for line in lines)
+
+
+# Translation service of a worker process, loaded once by _init_worker
+_service: TranslationService | None = None
+
+
+def _init_worker(vocabulary: str | None, single_threaded: bool) -> None:
+    """Load the translation service (and its models) of this process."""
+    global _service
+    if single_threaded:
+        # One core per process; parallelism comes from the process pool
+        for name in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+            os.environ.setdefault(name, "1")
+        os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+    from app.api.dependencies import get_vocabulary_registry
+    _service = get_vocabulary_registry().get(vocabulary).translation_service
+
+
+def _translate_chunk(cues: list[Cue], output_format: str) -> bytes:
+    """Translate a chunk of cues with batched calls and render its output."""
+    results = _service.translate_batch([cue.text for cue in cues])
+    return format_chunk(cues, results, output_format)
+
+
+def translate_subtitles(
+    lines: Iterable[str],
+    output: BinaryIO,
+    output_format: str = "cues",
+    workers: int = 1,
+    chunk_cues: int = 64,
+    vocabulary: str | None = None,
+) -> int:
+    """
+    Translate a subtitle file into a sign track.
+
+    Args:
+        lines: Lines of the SRT or WebVTT file
+        output: Binary stream the JSONL is written to
+        output_format: "cues" or "signs"
+        workers: Worker processes (1 = translate in this process)
+        chunk_cues: Cues per batched translation call
+        vocabulary: Sign vocabulary (default if None)
+
+    Returns:
+        Number of cues translated
+    """
+    chunks = iter_chunks(iter_cues(lines), chunk_cues)
+    count = 0
+
+    if workers <= 1:
+        _init_worker(vocabulary, single_threaded=False)
+        for chunk in chunks:
+            output.write(_translate_chunk(chunk, output_format))
+            count += len(chunk)
+        return count
+
+    # spawn: workers must not inherit a forked copy of torch's thread pools
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(vocabulary, True),
+    ) as executor:
+        pending: deque[tuple[int, Future[bytes]]] = deque()
+        try:
+            for chunk in chunks:
+                pending.append((len(chunk), executor.submit(_translate_chunk, chunk, output_format)))
+
+                # Write the oldest chunk once the window is full
+                if len(pending) >= workers * 2:
+                    size, future = pending.popleft()
+                    output.write(future.result())
+                    count += size
+
+            while pending:
+                size, future = pending.popleft()
+                output.write(future.result())
+                count += size
+        finally:
+            for _, future in pending:
+                future.cancel()
+    return count
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Translate SRT/WebVTT subtitles into a timed sign track")
+    parser.add_argument("subtitles", type=Path, help="SRT or WebVTT file")
+    parser.add_argument("--output", "-o", type=Path, help="JSONL file to write (stdout if omitted)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="cues", help="one line per cue or per sign")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--chunk-cues", type=int, default=64, help="cues per batched translation call")
+    parser.add_argument("--vocabulary", help="sign vocabulary (default if omitted)")
+    parser.add_argument("--profile", choices=("full", "stand_in", "lite"), help="service profile (SERVICE_PROFILE)")
+    args = parser.parse_args()
+
+    if args.profile:
+        # Read by the settings of this process and of the spawned workers
+        os.environ["SERVICE_PROFILE"] = args.profile
+
+    started = time.perf_counter()
+    with args.subtitles.open(encoding="utf-8-sig", errors="replace") as lines:
+        if args.output is None:
+            count = translate_subtitles(
+                lines, sys.stdout.buffer, args.format, args.workers, args.chunk_cues, args.vocabulary
+            )
+        else:
+            with args.output.open("wb") as output:
+                count = translate_subtitles(
+                    lines, output, args.format, args.workers, args.chunk_cues, args.vocabulary
+                )
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"Translated {count} cues in {elapsed:.1f}s ({count / elapsed if elapsed else 0:.0f} cues/s, "
+        f"{args.workers} workers, peak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB, "
+        f"per worker {resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024:.0f} MB)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
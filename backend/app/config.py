@@ -3,8 +3,11 @@ Application configuration using Pydantic Settings.
 Follows the Single Responsibility Principle - only handles configuration.
 """
 
+import tempfile
 from functools import lru_cache
 from pathlib import Path
+from typing import Literal
+
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -50,13 +53,116 @@ class Settings(BaseSettings):
     # Paths - defaults to SSbackend's SignAnimations folder
     videos_directory: Path = Path(__file__).parent / "data" / "sign_animations"
 
+    # Sign vocabularies: videos_directory is served as default_vocabulary,
+    # more can be added as a JSON object of name -> clip directory
+    default_vocabulary: str = "default"
+    vocabularies: dict[str, Path] = {}
+    vocabulary_memory_budget_mb: int = 512  # Estimated, excluding shared models
+
+    @field_validator("vocabularies")
+    @classmethod
+    def validate_vocabulary_names(cls, v):
+        # Names become URL path segments (/signs/{name})
+        for name in v:
+            if not name.replace("-", "").replace("_", "").isalnum():
+                raise ValueError(f"Invalid vocabulary name: {name!r}")
+        return v
+
+    # Object storage: serve the default vocabulary from an S3-compatible
+    # bucket instead of videos_directory; clips are downloaded into a
+    # local disk cache on first use
+    videos_s3_bucket: str | None = None
+    videos_s3_prefix: str = ""  # e.g. "asl/"
+    videos_s3_endpoint_url: str | None = None  # e.g. http://localhost:9000 for MinIO; AWS if unset
+    videos_s3_region: str = "us-east-1"
+    videos_s3_access_key_id: str | None = None  # Anonymous requests if unset
+    videos_s3_secret_access_key: str | None = None
+    videos_s3_session_token: str | None = None
+    videos_s3_max_connections: int = 32
+    clip_cache_directory: Path = Path(tempfile.gettempdir()) / "sign_sarthi_clips"
+    clip_cache_max_mb: int = 2048
+
+    # Service profile: "full" loads sentence-transformers and spaCy,
+    # "stand_in" uses deterministic model-free matcher and NER (load testing),
+    # "lite" uses the matcher tiers and rule-based NER only, without ever
+    # importing torch or spaCy (tests, CLI tools, small edge replicas)
+    service_profile: Literal["full", "stand_in", "lite"] = "full"
+
     # Semantic Matching
     embedding_model: str = "all-MiniLM-L6-v2"
     similarity_threshold: float = 0.7
 
+    # Matcher tiers tried before the embedding model
+    matcher_stem_enabled: bool = True
+    matcher_lemma_enabled: bool = False  # Needs the NLTK 'wordnet' corpus
+    matcher_synonyms_path: Path | None = None  # JSON object: word -> sign word
+    matcher_typo_enabled: bool = True  # Before the embedding model with a lexicon, on its misses without
+    matcher_typo_max_distance: int = 2
+    matcher_typo_prefix_length: int = 7
+    matcher_typo_min_word_length: int = 4
+    matcher_typo_max_index_entries: int = 500_000
+    matcher_lexicon_path: Path | None = None  # "word count" lines of correctly spelled words
+    # Multi-word phrase signs ("fell in love" -> "fall in love")
+    matcher_phrases_enabled: bool = True
+    matcher_phrase_threshold: float = 0.8  # For embedded paraphrases; exact/stem spans always match
+    matcher_phrase_max_length: int = 4
+    matcher_phrase_max_candidates: int = 128  # Spans embedded per text
+
     # NER
     spacy_model: str = "en_core_web_sm"
 
+    # Response compression (gzip for responses of at least this many bytes)
+    compression_enabled: bool = False
+    compression_minimum_size: int = 1024
+
+    # Observability
+    metrics_enabled: bool = True
+
+    # Request profiling (cProfile artefacts for sampled requests)
+    profiling_enabled: bool = False
+    profiling_sample_rate: float = 0.01
+    profiling_header_token: str | None = None  # Profile any request sending X-Profile-Token
+    profiling_directory: Path = Path(tempfile.gettempdir()) / "sign_sarthi_profiles"
+    profiling_max_files: int = 200
+
+    # Process-wide result caches, optionally snapshotted to disk and reloaded at startup
+    cache_match_size: int = 50_000  # Word match results; 0 disables
+    cache_sentence_size: int = 5_000  # Translated texts; 0 disables
+    cache_snapshot_enabled: bool = False  # Snapshots hold the raw text of recent requests
+    cache_snapshot_path: Path = Path(tempfile.gettempdir()) / "sign_sarthi_cache" / "snapshot.json"
+    cache_snapshot_interval_seconds: float = 300.0
+    cache_snapshot_max_words: int = 20_000
+    cache_snapshot_max_sentences: int = 2_000
+    cache_snapshot_max_age_seconds: float = 86_400.0
+
+    # Admission control for /api/v1/translate
+    admission_enabled: bool = True
+    max_concurrent_translations: int = 8
+    max_queued_translations: int = 64
+    max_concurrent_documents: int = 4  # Document streams; more are shed with 503
+    request_deadline_seconds: float = 2.0  # Clients may ask for less via X-Request-Deadline-Ms
+    rate_limit_per_second: float = 0.0  # Per client; 0 disables
+    rate_limit_burst: int = 20
+    trust_forwarded_for: bool = False  # Identify clients by X-Forwarded-For (behind a proxy)
+    degraded_mode_enabled: bool = True  # Cheap matching when the deadline is too close
+
+    # GET /api/v1/translate responses are cacheable by browsers and CDNs
+    translate_cache_max_age_seconds: int = 3600  # Revalidated by ETag afterwards
+
+    # Clip manifests for the compact translation format (?format=compact)
+    manifest_cache_max_age_seconds: int = 86_400
+    manifest_cache_size: int = 16  # Manifests (vocabulary x rendition) kept in memory
+
+    # Clip delivery: translations preload their first clips via a Link header
+    preload_clip_count: int = 4  # 0 disables
+    signs_cache_max_age_seconds: int = 86_400
+
+    # Document translation
+    document_max_length: int = 200_000
+    document_workers: int = 4
+    document_chunk_sentences: int = 8
+    document_chunk_max_chars: int = 2000
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -0,0 +1,61 @@
+"""
+Cache - Bounded in-process LRU cache shared by the services.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+from app.core.metrics import CACHE_REQUESTS
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LruCache(Generic[K, V]):
+    """Thread-safe bounded LRU cache with hit/miss metrics."""
+
+    def __init__(self, name: str, max_size: int):
+        """
+        Initialize the cache.
+
+        Args:
+            name: Cache label in the cache_requests_total metric
+            max_size: Maximum number of entries
+        """
+        self._name = name
+        self._max_size = max_size
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def get(self, key: K) -> V | None:
+        """Get an entry and mark it as most recently used."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+        CACHE_REQUESTS.inc(cache=self._name, result="hit" if value is not None else "miss")
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Add or replace an entry, evicting the least recently used ones."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+            self._writes += 1
+
+    def items(self) -> list[tuple[K, V]]:
+        """Entries ordered from most to least recently used."""
+        with self._lock:
+            return list(reversed(self._entries.items()))
+
+    @property
+    def writes(self) -> int:
+        """Number of puts so far; changes whenever the contents may have changed."""
+        return self._writes
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,64 @@
+"""
+Deadlines - Per-request time budgets and latency estimates.
+The admission middleware sets the deadline of a request; handlers use
+the remaining budget to decide whether the full pipeline still fits.
+"""
+
+import threading
+import time
+from contextvars import ContextVar
+
+# Monotonic time by which the current request should be answered
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+def set_deadline(budget_seconds: float) -> None:
+    """Give the current request context `budget_seconds` from now."""
+    _deadline.set(time.monotonic() + budget_seconds)
+
+
+def remaining_seconds() -> float | None:
+    """Time left until the current request's deadline (None if it has none)."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+class LatencyEstimate:
+    """
+    Exponentially weighted moving average of an operation's latency.
+
+    Slow observations are weighted more heavily than fast ones, so the
+    estimate leans towards the tail rather than the mean: a cache hit
+    should not make a cold model call look affordable.
+    """
+
+    def __init__(self, initial_seconds: float, alpha: float = 0.1, slow_alpha: float = 0.3):
+        """
+        Initialize the estimate.
+
+        Args:
+            initial_seconds: Estimate before any observation
+            alpha: Weight of observations faster than the estimate
+            slow_alpha: Weight of observations slower than the estimate
+        """
+        self._value = initial_seconds
+        self._alpha = alpha
+        self._slow_alpha = slow_alpha
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """Fold one observed latency into the estimate."""
+        with self._lock:
+            alpha = self._slow_alpha if seconds > self._value else self._alpha
+            self._value += alpha * (seconds - self._value)
+
+    @property
+    def value(self) -> float:
+        """Current latency estimate in seconds."""
+        return self._value
+
+
+# Latency of a full (non-degraded) /translate call
+FULL_TRANSLATION_LATENCY = LatencyEstimate(initial_seconds=0.05)
@@ -1,15 +1,24 @@
 """Interfaces package - abstract contracts for dependency inversion."""
 
 from app.core.interfaces.text_processor import ITextProcessor
-from app.core.interfaces.video_repository import IVideoRepository
-from app.core.interfaces.embedding_matcher import IEmbeddingMatcher, MatchResult
-from app.core.interfaces.ner_detector import INerDetector, EntityInfo
+from app.core.interfaces.video_repository import ClipMetadata, IAsyncVideoRepository, IVideoRepository
+from app.core.interfaces.embedding_matcher import IAsyncEmbeddingMatcher, IEmbeddingMatcher, MatchResult
+from app.core.interfaces.ner_detector import IAsyncNerDetector, INerDetector, EntityInfo
+from app.core.interfaces.phrase_matcher import IPhraseMatcher, PhraseMatch
+from app.core.interfaces.text_encoder import ITextEncoder
 
 __all__ = [
     "ITextProcessor",
     "IVideoRepository", 
+    "ClipMetadata",
     "IEmbeddingMatcher",
     "MatchResult",
     "INerDetector",
     "EntityInfo",
+    "IPhraseMatcher",
+    "PhraseMatch",
+    "ITextEncoder",
+    "IAsyncVideoRepository",
+    "IAsyncEmbeddingMatcher",
+    "IAsyncNerDetector",
 ]
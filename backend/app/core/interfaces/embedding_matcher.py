@@ -3,9 +3,13 @@ Embedding Matcher Interface.
 Defines contract for semantic word matching using embeddings.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
+# Rough cost of one str -> value dict entry, for memory estimates
+INDEX_ENTRY_BYTES = 160
+
 
 @dataclass
 class MatchResult:
@@ -15,6 +19,7 @@ class MatchResult:
     matched_word: str | None
     similarity: float
     is_match: bool  # True if similarity >= threshold
+    tier: str | None = None  # Matcher tier that resolved the word (exact, stem, ...)
 
 
 class IEmbeddingMatcher(ABC):
@@ -38,7 +43,74 @@ class IEmbeddingMatcher(ABC):
         """
         pass
 
+    def find_best_matches(self, words: list[str]) -> list[MatchResult]:
+        """
+        Find the best matching sign words for a batch of input words.
+        
+        Implementations backed by a model should override this to
+        match the whole batch in a single inference call.
+        
+        Args:
+            words: Input words to match
+            
+        Returns:
+            MatchResult for each word, in input order
+        """
+        return [self.find_best_match(word) for word in words]
+
     @abstractmethod
     def get_vocabulary_size(self) -> int:
         """Get the number of words in the sign vocabulary."""
         pass
+
+    def estimate_memory_bytes(self) -> int:
+        """
+        Approximate memory held by this matcher's vocabulary data.
+        
+        Shared models are not included. Used to budget how many
+        vocabularies stay loaded; implementations holding large
+        per-vocabulary data should override this.
+        """
+        return 0
+
+
+class IAsyncEmbeddingMatcher(ABC):
+    """
+    Async counterpart of IEmbeddingMatcher.
+    
+    For matchers backed by I/O (e.g. a remote model server), so
+    matching can overlap with other pipeline stages.
+    """
+
+    @abstractmethod
+    async def find_best_match(self, word: str) -> MatchResult:
+        """
+        Find the best matching sign word for the input word.
+        
+        Args:
+            word: Input word to match
+            
+        Returns:
+            MatchResult with matched word and similarity score
+        """
+        pass
+
+    async def find_best_matches(self, words: list[str]) -> list[MatchResult]:
+        """
+        Find the best matching sign words for a batch of input words.
+        
+        Matches the words concurrently; implementations backed by a
+        model should override this to send the batch in one call.
+        
+        Args:
+            words: Input words to match
+            
+        Returns:
+            MatchResult for each word, in input order
+        """
+        return list(await asyncio.gather(*(self.find_best_match(word) for word in words)))
+
+    @abstractmethod
+    async def get_vocabulary_size(self) -> int:
+        """Get the number of words in the sign vocabulary."""
+        pass
@@ -3,6 +3,7 @@ NER Detector Interface.
 Defines contract for Named Entity Recognition.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
@@ -51,3 +52,75 @@ class INerDetector(ABC):
             True if word is a named entity
         """
         pass
+
+    @abstractmethod
+    def get_entity_words(self, text: str) -> set[str]:
+        """
+        Get all words that are part of fingerspellable named entities.
+        
+        Args:
+            text: Full text to analyze
+            
+        Returns:
+            Set of words (lowercase) that are named entities
+        """
+        pass
+
+    def get_entity_words_batch(self, texts: list[str]) -> list[set[str]]:
+        """
+        Get the named-entity words for a batch of texts.
+        
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            Set of lowercase entity words for each text, in input order
+        """
+        return [self.get_entity_words(text) for text in texts]
+
+
+class IAsyncNerDetector(ABC):
+    """
+    Async counterpart of INerDetector.
+    
+    For detectors backed by I/O (e.g. a remote NER service), so entity
+    detection can overlap with word matching.
+    """
+
+    @abstractmethod
+    async def detect_entities(self, text: str) -> list[EntityInfo]:
+        """
+        Detect all named entities in the text.
+        
+        Args:
+            text: Full sentence/text to analyze
+            
+        Returns:
+            List of detected entities with labels
+        """
+        pass
+
+    @abstractmethod
+    async def get_entity_words(self, text: str) -> set[str]:
+        """
+        Get all words that are part of fingerspellable named entities.
+        
+        Args:
+            text: Full text to analyze
+            
+        Returns:
+            Set of words (lowercase) that are named entities
+        """
+        pass
+
+    async def get_entity_words_batch(self, texts: list[str]) -> list[set[str]]:
+        """
+        Get the named-entity words for a batch of texts concurrently.
+        
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            Set of lowercase entity words for each text, in input order
+        """
+        return list(await asyncio.gather(*(self.get_entity_words(text) for text in texts)))
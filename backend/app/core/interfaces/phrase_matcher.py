@@ -0,0 +1,88 @@
+"""
+Phrase Matcher Interface.
+Defines contract for matching multi-word spans of a text to the
+phrase signs of the vocabulary (e.g. "fell in love" -> "fall in love").
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class PhraseMatch:
+    """A span of tokens matched to a phrase sign."""
+
+    start: int  # Index of the first token of the span
+    end: int  # Index after the last token of the span
+    phrase: str  # Matched vocabulary phrase
+    similarity: float
+    tier: str  # "exact", "stem" or "embedding"
+
+
+class IPhraseMatcher(ABC):
+    """
+    Abstract interface for phrase matching.
+
+    Returned matches never overlap, so each token belongs to at most
+    one phrase.
+    """
+
+    @abstractmethod
+    def find_phrases_batch(self, token_lists: list[list[str]]) -> list[list[PhraseMatch]]:
+        """
+        Find the phrase signs in a batch of tokenized texts.
+
+        Args:
+            token_lists: Tokens of each text
+
+        Returns:
+            Non-overlapping matches of each text, ordered by start
+        """
+        pass
+
+    @abstractmethod
+    def find_spans(self, tokens: list[str], start: int, end: int) -> list[PhraseMatch]:
+        """
+        Match the candidate spans overlapping part of a tokenized text.
+
+        Args:
+            tokens: Tokens of the text
+            start: Index of the first token of the part
+            end: Index after the last token of the part; with end == start,
+                the spans crossing that position
+
+        Returns:
+            Matches of all candidate spans overlapping tokens[start:end],
+            which may overlap each other (see resolve)
+        """
+        pass
+
+    @abstractmethod
+    def resolve(self, length: int, matches: list[PhraseMatch]) -> list[PhraseMatch]:
+        """
+        Pick the non-overlapping phrase signs of a text among span matches.
+
+        Args:
+            length: Number of tokens of the text
+            matches: Possibly overlapping span matches, e.g. of find_spans
+
+        Returns:
+            Non-overlapping matches, ordered by start
+        """
+        pass
+
+    def find_phrases(self, tokens: list[str]) -> list[PhraseMatch]:
+        """
+        Find the phrase signs in one tokenized text.
+
+        Args:
+            tokens: Tokens of the text
+
+        Returns:
+            Non-overlapping matches, ordered by start
+        """
+        return self.find_phrases_batch([tokens])[0]
+
+    def estimate_memory_bytes(self) -> int:
+        """Approximate memory held by the matcher's indexes (0 if unknown)."""
+        return 0
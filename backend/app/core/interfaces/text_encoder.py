@@ -0,0 +1,30 @@
+"""
+Text Encoder Interface.
+Defines contract for embedding arbitrary texts (e.g. phrases) as vectors.
+"""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class ITextEncoder(ABC):
+    """
+    Abstract interface for text embedding.
+
+    Implemented by embedding matchers whose model can also embed
+    multi-word texts, so other matchers can share the loaded model.
+    """
+
+    @abstractmethod
+    def encode(self, texts: list[str]) -> np.ndarray:
+        """
+        Embed a batch of texts in one call.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            (len(texts), dimensions) array of L2-normalized embeddings
+        """
+        pass
@@ -4,10 +4,23 @@ Follows Repository Pattern - abstracts data access from business logic.
 Follows Dependency Inversion - high-level modules depend on this abstraction.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
 
 
+@dataclass(frozen=True, slots=True)
+class ClipMetadata:
+    """Playback properties of a sign clip; fields are None when unknown."""
+
+    size_bytes: int
+    duration: float | None = None  # Seconds
+    frame_rate: float | None = None
+    width: int | None = None
+    height: int | None = None
+
+
 class VideoLookupResult:
     """Result of a video lookup operation."""
 
@@ -17,11 +30,13 @@ class VideoLookupResult:
         found: bool,
         video_path: Path | None = None,
         url: str | None = None,
+        metadata: ClipMetadata | None = None,
     ):
         self.word = word
         self.found = found
         self.video_path = video_path
         self.url = url
+        self.metadata = metadata
 
 
 class IVideoRepository(ABC):
@@ -69,3 +84,103 @@ class IVideoRepository(ABC):
             List of words that have corresponding videos
         """
         pass
+
+    def find_rendition(self, word: str, rendition: str) -> VideoLookupResult:
+        """
+        Find a lower-bitrate rendition of a word's video.
+        
+        Repositories without renditions always report found=False, so
+        callers fall back to the original video.
+        
+        Args:
+            word: The processed word to look up
+            rendition: Rendition name, e.g. "low" or "medium"
+            
+        Returns:
+            VideoLookupResult with found status and path/url if found
+        """
+        return VideoLookupResult(word=word, found=False)
+
+    @property
+    def metadata_version(self) -> int:
+        """
+        Counter that changes whenever the clip metadata lookups report does.
+        
+        Repositories that learn metadata after listing their clips (e.g.
+        once a clip is downloaded) increase it, so data derived from the
+        lookups can be rebuilt. Always 0 for the others.
+        """
+        return 0
+
+
+class IAsyncVideoRepository(ABC):
+    """
+    Async counterpart of IVideoRepository.
+    
+    For implementations whose lookups do I/O (remote storage, a shared
+    cache service), so they can run concurrently on the event loop.
+    """
+
+    @abstractmethod
+    async def find_video(self, word: str) -> VideoLookupResult:
+        """
+        Find a video file for the given word.
+        
+        Args:
+            word: The processed word to look up
+            
+        Returns:
+            VideoLookupResult with found status and path/url if found
+        """
+        pass
+
+    async def find_videos(self, words: list[str]) -> list[VideoLookupResult]:
+        """
+        Find the video files of several words concurrently.
+        
+        Args:
+            words: The processed words to look up
+            
+        Returns:
+            VideoLookupResult for each word, in input order
+        """
+        return list(await asyncio.gather(*(self.find_video(word) for word in words)))
+
+    @abstractmethod
+    async def video_exists(self, word: str) -> bool:
+        """
+        Check if a video exists for the given word.
+        
+        Args:
+            word: The processed word to check
+            
+        Returns:
+            True if video exists, False otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def get_available_words(self) -> list[str]:
+        """
+        Get list of all available words with videos.
+        
+        Returns:
+            List of words that have corresponding videos
+        """
+        pass
+
+    async def find_renditions(self, words: list[str], rendition: str) -> list[VideoLookupResult]:
+        """
+        Find a lower-bitrate rendition of several words' videos.
+        
+        Repositories without renditions always report found=False, so
+        callers fall back to the original videos.
+        
+        Args:
+            words: The processed words to look up
+            rendition: Rendition name, e.g. "low" or "medium"
+            
+        Returns:
+            VideoLookupResult for each word, in input order
+        """
+        return [VideoLookupResult(word=word, found=False) for word in words]
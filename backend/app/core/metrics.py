@@ -0,0 +1,292 @@
+"""
+Metrics - In-process Prometheus-style counters, gauges and histograms.
+Also tracks per-request stage timings for the Server-Timing header.
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TypeVar
+
+# Latency buckets in seconds, from 50µs (exact lookups) to 10s (cold model calls)
+DEFAULT_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(
+    labelnames: tuple[str, ...],
+    values: tuple[str, ...],
+    le: str | None = None,
+) -> str:
+    """Render a Prometheus label set, optionally with a histogram bound."""
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if le is not None:
+        parts.append(f'le="{le}"')
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """Base class for labelled metrics."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        """Label values in declaration order."""
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def render(self) -> list[str]:
+        """Render the metric in Prometheus text format."""
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self._samples(),
+        ]
+
+    def _samples(self) -> list[str]:
+        """Render the sample lines of the metric."""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: str) -> float:
+        """Current value for a label set."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge for a label set."""
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def get(self, **labels: str) -> float:
+        """Current value for a label set."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., sum, count]
+        self._values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0.0] * (len(self._buckets) + 2)
+            for idx, bound in enumerate(self._buckets):
+                if value <= bound:
+                    state[idx] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((key, list(state)) for key, state in self._values.items())
+
+        lines = []
+        for key, state in items:
+            cumulative = 0.0
+            for bound, count in zip(self._buckets, state):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, le=_format_value(bound))
+                lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")
+            labels = _format_labels(self.labelnames, key, le="+Inf")
+            lines.append(f"{self.name}_bucket{labels} {_format_value(state[-1])}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {repr(state[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {_format_value(state[-1])}")
+        return lines
+
+
+MetricT = TypeVar("MetricT", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together on /metrics."""
+
+    def __init__(self):
+        self._metrics: list[_Metric] = []
+
+    def register(self, metric: MetricT) -> MetricT:
+        """Add a metric to the registry."""
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render all metrics in Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    "translation_stage_seconds",
+    "Time spent per pipeline stage (tokenize, ner, embed, similarity, lookup)",
+    labelnames=("stage",),
+))
+REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route",
+    labelnames=("method", "route", "status"),
+))
+MATCHES = REGISTRY.register(Counter(
+    "matcher_results_total",
+    "Word match results by resolution path (matcher tier or embedding)",
+    labelnames=("path", "result"),
+))
+CACHE_REQUESTS = REGISTRY.register(Counter(
+    "cache_requests_total",
+    "Cache lookups by cache and result (hit or miss)",
+    labelnames=("cache", "result"),
+))
+VOCABULARY_SIZE = REGISTRY.register(Gauge(
+    "sign_vocabulary_size",
+    "Number of words in each loaded sign vocabulary",
+    labelnames=("vocabulary",),
+))
+VOCABULARY_MEMORY_BYTES = REGISTRY.register(Gauge(
+    "sign_vocabulary_memory_bytes",
+    "Estimated memory held by each sign vocabulary (0 once evicted)",
+    labelnames=("vocabulary",),
+))
+MODEL_LOAD_SECONDS = REGISTRY.register(Gauge(
+    "model_load_seconds",
+    "Time taken to load a model or precompute its data",
+    labelnames=("model",),
+))
+ADMISSION_DECISIONS = REGISTRY.register(Counter(
+    "admission_decisions_total",
+    "Admission control outcomes (admitted, rate_limited, shed, timeout)",
+    labelnames=("result",),
+))
+ADMISSION_IN_FLIGHT = REGISTRY.register(Gauge(
+    "admission_in_flight_requests",
+    "Admitted requests currently being served, by gate (translations, documents)",
+    labelnames=("gate",),
+))
+ADMISSION_QUEUE_DEPTH = REGISTRY.register(Gauge(
+    "admission_queued_requests",
+    "Requests waiting for a concurrency slot, by gate",
+    labelnames=("gate",),
+))
+DEGRADED_TRANSLATIONS = REGISTRY.register(Counter(
+    "degraded_translations_total",
+    "Translations served in degraded mode because of their deadline",
+))
+
+
+# Stage durations (seconds) accumulated for the current request
+_request_timings: ContextVar[dict[str, float] | None] = ContextVar(
+    "request_timings", default=None
+)
+# Stages of one request run in several worker threads at once
+_request_timings_lock = threading.Lock()
+
+
+def begin_request_timings() -> dict[str, float]:
+    """Start collecting stage timings for the current request context."""
+    timings: dict[str, float] = {}
+    _request_timings.set(timings)
+    return timings
+
+
+def get_request_timings() -> dict[str, float] | None:
+    """Stage timings of the current request, if collection is active."""
+    return _request_timings.get()
+
+
+def record_stage(stage: str, seconds: float) -> None:
+    """Record a stage duration in the histogram and the request timings."""
+    STAGE_SECONDS.observe(seconds, stage=stage)
+    timings = _request_timings.get()
+    if timings is not None:
+        with _request_timings_lock:
+            timings[stage] = timings.get(stage, 0.0) + seconds
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """Time the enclosed block as a pipeline stage."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, time.perf_counter() - started)
@@ -0,0 +1,95 @@
+"""
+Request Profiling - cProfile of the synchronous work done for a request.
+cProfile only records the thread it is enabled in, and the event loop
+thread interleaves every request in flight, so a request is not
+profiled as a whole. Instead each synchronous call it makes through
+profiled_call (the service calls of the async adapters, in worker
+threads or inline) runs under its own profiler, and the request's
+profile is the merged stats of those calls.
+"""
+
+import cProfile
+import pstats
+import threading
+from collections.abc import Callable
+from contextvars import ContextVar
+from typing import ParamSpec, TypeVar
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class RequestProfile:
+    """Profiles of the calls made for one request (thread-safe)."""
+
+    def __init__(self):
+        self._profilers: list[cProfile.Profile] = []
+        self._profiling_threads: set[int] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def call_count(self) -> int:
+        """Number of profiled calls."""
+        with self._lock:
+            return len(self._profilers)
+
+    def run(self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Call a function under a profiler of the current thread."""
+        thread = threading.get_ident()
+        with self._lock:
+            if thread in self._profiling_threads:
+                # Nested call, already recorded by the enclosing profiler
+                return func(*args, **kwargs)
+            self._profiling_threads.add(thread)
+
+        profiler = cProfile.Profile()
+        try:
+            try:
+                profiler.enable()
+            except ValueError:
+                # Another profiler is active; from Python 3.12 cProfile allows one per process
+                return func(*args, **kwargs)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.disable()
+                with self._lock:
+                    self._profilers.append(profiler)
+        finally:
+            with self._lock:
+                self._profiling_threads.discard(thread)
+
+    def stats(self) -> pstats.Stats:
+        """Merged stats of all profiled calls (empty if there were none)."""
+        with self._lock:
+            profilers = list(self._profilers)
+        stats = pstats.Stats()
+        for profiler in profilers:
+            stats.add(profiler)
+        return stats
+
+
+# Profile of the current request, if it is being profiled
+_request_profile: ContextVar[RequestProfile | None] = ContextVar(
+    "request_profile", default=None
+)
+
+
+def begin_request_profile() -> RequestProfile:
+    """Start profiling the calls of the current request context."""
+    profile = RequestProfile()
+    _request_profile.set(profile)
+    return profile
+
+
+def profiled_call(func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """
+    Call a function, profiling it if the current request is being profiled.
+
+    Worker threads see the request through the context copied by
+    asyncio.to_thread, so run this in the thread doing the work.
+    """
+    profile = _request_profile.get()
+    if profile is None:
+        return func(*args, **kwargs)
+    return profile.run(func, *args, **kwargs)
@@ -3,33 +3,114 @@ FastAPI Application Entry Point.
 Assembles all components and configures the application.
 """
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
 
-from app.api.routes import health, translation
+from app.api.admission import AdmissionControlMiddleware
+from app.api.dependencies import (
+    get_cache_warmer,
+    get_document_service,
+    get_embedding_matcher,
+    get_translation_service,
+    get_video_repository,
+)
+from app.api.middleware import ProfilingMiddleware, ServerTimingMiddleware
+from app.api.routes import health, metrics, translation
+from app.api.static import CachedClipFiles, SignClipFiles
 from app.config import get_settings
+from app.repositories.s3_video_repository import S3VideoRepository
+
+
+def _warm_caches() -> None:
+    """Load the cache snapshot and replay it through the services."""
+    warmer = get_cache_warmer()
+    snapshot = warmer.load_snapshot()
+    if snapshot is None:
+        return
+    
+    try:
+        warmer.warm(snapshot, get_translation_service(), get_embedding_matcher())
+    except Exception as e:
+        print(f"Cache warm-up failed: {e}")
+
+
+async def _snapshot_caches_periodically(interval: float) -> None:
+    """Write a cache snapshot every `interval` seconds."""
+    warmer = get_cache_warmer()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(warmer.save)
+        except OSError as e:
+            print(f"Cache snapshot failed: {e}")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Application lifespan handler.
-    Downloads NLTK data if not present.
+    Downloads NLTK data if not present, lists the clip bucket (if any),
+    warms the result caches from the last snapshot in the background and
+    snapshots them while running.
     """
     # Startup
-    import nltk
-    try:
-        nltk.data.find("tokenizers/punkt")
-    except LookupError:
-        nltk.download("punkt", quiet=True)
+    settings = get_settings()
+    
+    # The lite profile starts without importing nltk (and scipy) and
+    # expects punkt to be installed already
+    if settings.service_profile != "lite":
+        import nltk
+        for resource in ("punkt", "punkt_tab"):
+            try:
+                nltk.data.find(f"tokenizers/{resource}")
+            except LookupError:
+                nltk.download(resource, quiet=True)
+    
+    # List the clip bucket before serving, in a worker thread: the listing
+    # is paginated and blocking, and lookups need the index
+    if settings.videos_s3_bucket:
+        try:
+            await asyncio.to_thread(get_video_repository().get_available_words)
+        except httpx.HTTPError as e:
+            print(f"Clip bucket listing failed, retrying on first use: {e}")
+    
+    background_tasks: list[asyncio.Task] = []
+    warm_up: asyncio.Task | None = None
+    if settings.cache_snapshot_enabled:
+        warm_up = asyncio.create_task(asyncio.to_thread(_warm_caches))
+        background_tasks.append(warm_up)
+        background_tasks.append(asyncio.create_task(
+            _snapshot_caches_periodically(settings.cache_snapshot_interval_seconds)
+        ))
     
     yield
     
     # Shutdown (cleanup if needed)
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError, Exception):
+            await task
+    
+    # A snapshot taken mid warm-up would drop the entries not yet replayed
+    if warm_up is not None and not warm_up.cancelled():
+        try:
+            get_cache_warmer().save()
+        except OSError as e:
+            print(f"Cache snapshot failed: {e}")
+    
+    if get_document_service.cache_info().currsize:
+        get_document_service().shutdown()
+    
+    if get_video_repository.cache_info().currsize:
+        repository = get_video_repository()
+        if isinstance(repository, S3VideoRepository):
+            await repository.aclose()
 
 
 def create_app() -> FastAPI:
@@ -52,6 +133,21 @@ def create_app() -> FastAPI:
         redoc_url="/redoc",
     )
     
+    # Admission control for translations (innermost, so CORS headers,
+    # Server-Timing and metrics also cover 429/503 responses)
+    if settings.admission_enabled:
+        app.add_middleware(
+            AdmissionControlMiddleware,
+            path_prefix="/api/v1/translate",
+            max_concurrent=settings.max_concurrent_translations,
+            max_queue=settings.max_queued_translations,
+            deadline_seconds=settings.request_deadline_seconds,
+            rate_per_second=settings.rate_limit_per_second,
+            burst=settings.rate_limit_burst,
+            trust_forwarded_for=settings.trust_forwarded_for,
+            max_documents=settings.max_concurrent_documents,
+        )
+    
     # Configure CORS
     app.add_middleware(
         CORSMiddleware,
@@ -61,16 +157,63 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    # Optional gzip compression for large responses
+    if settings.compression_enabled:
+        app.add_middleware(
+            GZipMiddleware,
+            minimum_size=settings.compression_minimum_size,
+        )
+    
+    # Sampled request profiling (inside Server-Timing so it sees stage timings)
+    if settings.profiling_enabled:
+        app.add_middleware(
+            ProfilingMiddleware,
+            directory=settings.profiling_directory,
+            sample_rate=settings.profiling_sample_rate,
+            header_token=settings.profiling_header_token,
+            max_files=settings.profiling_max_files,
+        )
+    
+    # Per-stage Server-Timing headers and request latency metrics
+    if settings.metrics_enabled:
+        app.add_middleware(ServerTimingMiddleware)
+    
     # Register API routes
     app.include_router(health.router, prefix="/api/v1")
     app.include_router(translation.router, prefix="/api/v1")
+    if settings.metrics_enabled:
+        app.include_router(metrics.router)
+    
+    # Mount static files for sign videos; named vocabularies first so
+    # /signs/{name} is not shadowed by the default library at /signs
+    for name, directory in settings.vocabularies.items():
+        if directory.exists():
+            app.mount(
+                f"/signs/{name}",
+                SignClipFiles(
+                    directory=str(directory),
+                    max_age=settings.signs_cache_max_age_seconds,
+                ),
+                name=f"signs_{name}",
+            )
     
-    # Mount static files for sign videos
     videos_dir = settings.videos_directory
-    if videos_dir.exists():
+    if settings.videos_s3_bucket:
+        app.mount(
+            "/signs",
+            CachedClipFiles(
+                repository=get_video_repository(),
+                max_age=settings.signs_cache_max_age_seconds,
+            ),
+            name="signs",
+        )
+    elif videos_dir.exists():
         app.mount(
             "/signs",
-            StaticFiles(directory=str(videos_dir)),
+            SignClipFiles(
+                directory=str(videos_dir),
+                max_age=settings.signs_cache_max_age_seconds,
+            ),
             name="signs",
         )
     
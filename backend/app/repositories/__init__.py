@@ -1,5 +1,7 @@
 """Repositories package - data access layer implementations."""
 
+from app.repositories.clip_cache import DiskClipCache
+from app.repositories.s3_video_repository import S3VideoRepository
 from app.repositories.video_repository import FileSystemVideoRepository
 
-__all__ = ["FileSystemVideoRepository"]
+__all__ = ["DiskClipCache", "FileSystemVideoRepository", "S3VideoRepository"]
@@ -0,0 +1,143 @@
+"""
+Clip Cache - Bounded on-disk LRU cache of sign clips.
+Clips fetched from remote storage are stored under one directory with
+the same relative paths as their URLs, so they can be served as static
+files. The least recently used clips are deleted once the cache
+exceeds its size budget.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from app.core.metrics import CACHE_REQUESTS
+
+PARTIAL_SUFFIX = ".part"
+
+
+class DiskClipCache:
+    """
+    Thread-safe size-bounded LRU cache of files under a directory.
+
+    Files left by earlier runs are indexed at startup (least recently
+    accessed first), so a persistent cache directory survives restarts.
+    Files are written under a temporary name and renamed into place,
+    so readers never see a partial clip.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int, name: str = "clips"):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory to store the files in (created if missing)
+            max_bytes: Size budget of all cached files
+            name: Cache label in the cache_requests_total metric
+        """
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._name = name
+        self._entries: OrderedDict[str, int] = OrderedDict()  # Relative path -> size
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+
+        directory.mkdir(parents=True, exist_ok=True)
+        self._scan()
+
+    @property
+    def directory(self) -> Path:
+        """Get the cache directory."""
+        return self._directory
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the cached files."""
+        return self._size_bytes
+
+    def path(self, name: str) -> Path:
+        """Local path of a file (whether or not it is cached)."""
+        return self._directory / name
+
+    def names(self) -> list[str]:
+        """Relative paths of the cached files, least recently used first."""
+        with self._lock:
+            return list(self._entries)
+
+    def get(self, name: str) -> Path | None:
+        """Get the path of a cached file and mark it as most recently used."""
+        path = self.path(name)
+        with self._lock:
+            found = name in self._entries
+            if found and not path.is_file():
+                # Deleted behind our back (e.g. by another worker sharing the directory)
+                self._size_bytes -= self._entries.pop(name)
+                found = False
+            if found:
+                self._entries.move_to_end(name)
+        CACHE_REQUESTS.inc(cache=self._name, result="hit" if found else "miss")
+        return path if found else None
+
+    def partial_path(self, name: str) -> Path:
+        """Temporary path to write a file to before committing it."""
+        path = self.path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path.with_name(f"{path.name}.{os.getpid()}{PARTIAL_SUFFIX}")
+
+    def commit(self, name: str, partial: Path) -> Path:
+        """
+        Move a fully written file into the cache.
+
+        Args:
+            name: Relative path of the file
+            partial: Path returned by partial_path, fully written
+
+        Returns:
+            Path of the cached file
+        """
+        path = self.path(name)
+        os.replace(partial, path)
+        size = path.stat().st_size
+        with self._lock:
+            self._size_bytes += size - self._entries.pop(name, 0)
+            self._entries[name] = size
+            self._evict()
+        return path
+
+    def discard(self, name: str) -> None:
+        """Delete a cached file."""
+        with self._lock:
+            size = self._entries.pop(name, None)
+            if size is None:
+                return
+            self._size_bytes -= size
+        self.path(name).unlink(missing_ok=True)
+
+    def _scan(self) -> None:
+        """Index the files of earlier runs and delete their partial writes."""
+        files: list[tuple[float, str, int]] = []
+        for path in self._directory.rglob("*"):
+            if not path.is_file():
+                continue
+            if path.name.endswith(PARTIAL_SUFFIX):
+                path.unlink(missing_ok=True)
+                continue
+            stat = path.stat()
+            files.append((stat.st_atime, path.relative_to(self._directory).as_posix(), stat.st_size))
+
+        with self._lock:
+            for _, name, size in sorted(files):
+                self._entries[name] = size
+                self._size_bytes += size
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used files until the cache fits its budget."""
+        # The most recently used file is kept even if it alone exceeds the budget
+        while self._size_bytes > self._max_bytes and len(self._entries) > 1:
+            name, size = self._entries.popitem(last=False)
+            self._size_bytes -= size
+            self.path(name).unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,227 @@
+"""
+Clip Probe - Reads playback metadata from MP4 files.
+Walks the ISO-BMFF box tree (moov/trak/mdia) in pure Python; only the
+header boxes are read, the media data is skipped.
+"""
+
+import struct
+from pathlib import Path
+from typing import BinaryIO
+
+from app.core.interfaces.video_repository import ClipMetadata
+
+# Boxes whose payload is a list of child boxes
+_CONTAINER_BOXES = {b"moov", b"trak", b"mdia", b"minf", b"stbl"}
+
+# Upper bound for the moov box we are willing to read into memory
+_MAX_MOOV_BYTES = 16 * 1024 * 1024
+
+_LFS_POINTER_PREFIX = b"version https://git-lfs"
+
+
+def _iter_boxes(data: bytes, start: int = 0, end: int | None = None):
+    """Yield (type, payload_start, payload_end) of the boxes in a buffer."""
+    end = len(data) if end is None else end
+    offset = start
+
+    while offset + 8 <= end:
+        size, box_type = struct.unpack_from(">I4s", data, offset)
+        header = 8
+        if size == 1:
+            if offset + 16 > end:
+                return
+            size = struct.unpack_from(">Q", data, offset + 8)[0]
+            header = 16
+        elif size == 0:
+            size = end - offset
+
+        if size < header or offset + size > end:
+            return
+        yield box_type, offset + header, offset + size
+        offset += size
+
+
+def _iter_top_level_boxes(handle: BinaryIO, file_size: int):
+    """Yield (type, offset, header_size, size) of the top-level boxes of a file."""
+    offset = 0
+
+    while offset + 8 <= file_size:
+        handle.seek(offset)
+        header = handle.read(16)
+        if len(header) < 8:
+            return
+
+        size, box_type = struct.unpack_from(">I4s", header)
+        header_size = 8
+        if size == 1:
+            if len(header) < 16:
+                return
+            size = struct.unpack_from(">Q", header, 8)[0]
+            header_size = 16
+        elif size == 0:
+            size = file_size - offset
+
+        if size < header_size:
+            return
+        yield box_type, offset, header_size, size
+
+        # Skip mdat and everything else without reading it
+        offset += size
+
+
+def _read_moov(handle: BinaryIO, file_size: int) -> bytes | None:
+    """Find the top-level moov box and return its payload."""
+    for box_type, offset, header_size, size in _iter_top_level_boxes(handle, file_size):
+        if box_type == b"moov":
+            payload_size = size - header_size
+            if payload_size > _MAX_MOOV_BYTES:
+                return None
+            handle.seek(offset + header_size)
+            payload = handle.read(payload_size)
+            return payload if len(payload) == payload_size else None
+
+    return None
+
+
+def _parse_duration_header(data: bytes, start: int) -> tuple[int, int]:
+    """Parse the (timescale, duration) of an mvhd or mdhd box payload."""
+    version = data[start]
+    if version == 1:
+        return struct.unpack_from(">IQ", data, start + 20)
+    return struct.unpack_from(">II", data, start + 12)
+
+
+def _parse_track_size(data: bytes, start: int) -> tuple[int, int]:
+    """Parse the presentation width and height of a tkhd box payload."""
+    # Width and height are 16.16 fixed point at the end of the box
+    version = data[start]
+    offset = start + (88 if version == 1 else 76)
+    width, height = struct.unpack_from(">II", data, offset)
+    return width >> 16, height >> 16
+
+
+def _parse_video_track(data: bytes, start: int, end: int) -> ClipMetadata | None:
+    """Extract frame rate and resolution from a trak box, if it is video."""
+    width = height = None
+    timescale = duration = sample_count = None
+    is_video = False
+
+    def walk(box_start: int, box_end: int) -> None:
+        nonlocal width, height, timescale, duration, sample_count, is_video
+        for box_type, payload_start, payload_end in _iter_boxes(data, box_start, box_end):
+            if box_type in _CONTAINER_BOXES:
+                walk(payload_start, payload_end)
+            elif box_type == b"tkhd":
+                width, height = _parse_track_size(data, payload_start)
+            elif box_type == b"mdhd":
+                timescale, duration = _parse_duration_header(data, payload_start)
+            elif box_type == b"hdlr":
+                is_video = data[payload_start + 8:payload_start + 12] == b"vide"
+            elif box_type == b"stts":
+                entry_count = struct.unpack_from(">I", data, payload_start + 4)[0]
+                sample_count = sum(
+                    struct.unpack_from(">I", data, payload_start + 8 + 8 * idx)[0]
+                    for idx in range(entry_count)
+                )
+
+    walk(start, end)
+    if not is_video:
+        return None
+
+    frame_rate = None
+    if timescale and duration and sample_count:
+        frame_rate = round(sample_count * timescale / duration, 3)
+
+    return ClipMetadata(
+        size_bytes=0,
+        duration=duration / timescale if timescale and duration else None,
+        frame_rate=frame_rate,
+        width=width or None,
+        height=height or None,
+    )
+
+
+def _parse_lfs_pointer(path: Path) -> ClipMetadata:
+    """Metadata of a git-lfs pointer file: only the real object size is known."""
+    size = 0
+    for line in path.read_text(encoding="utf-8", errors="replace").splitlines():
+        if line.startswith("size "):
+            size = int(line[5:].strip() or 0)
+    return ClipMetadata(size_bytes=size)
+
+
+def probe_clip(path: Path) -> ClipMetadata | None:
+    """
+    Read the playback metadata of an MP4 clip.
+
+    Duration comes from the movie header, frame rate and resolution from
+    the first video track. Files that are not parseable MP4 (including
+    git-lfs pointers that were never pulled) yield only their byte size.
+
+    Args:
+        path: Path to the clip
+
+    Returns:
+        ClipMetadata, or None if the file cannot be read
+    """
+    try:
+        file_size = path.stat().st_size
+        with path.open("rb") as handle:
+            if handle.read(len(_LFS_POINTER_PREFIX)) == _LFS_POINTER_PREFIX:
+                return _parse_lfs_pointer(path)
+            moov = _read_moov(handle, file_size)
+    except (OSError, ValueError):
+        return None
+
+    if moov is None:
+        return ClipMetadata(size_bytes=file_size)
+
+    try:
+        movie_duration = None
+        track: ClipMetadata | None = None
+
+        for box_type, payload_start, payload_end in _iter_boxes(moov):
+            if box_type == b"mvhd":
+                timescale, duration = _parse_duration_header(moov, payload_start)
+                if timescale:
+                    movie_duration = duration / timescale
+            elif box_type == b"trak" and track is None:
+                track = _parse_video_track(moov, payload_start, payload_end)
+    except (struct.error, IndexError):
+        return ClipMetadata(size_bytes=file_size)
+
+    duration = movie_duration if movie_duration is not None else (track and track.duration)
+    return ClipMetadata(
+        size_bytes=file_size,
+        duration=round(duration, 3) if duration else None,
+        frame_rate=track.frame_rate if track else None,
+        width=track.width if track else None,
+        height=track.height if track else None,
+    )
+
+
+def is_faststart(path: Path) -> bool | None:
+    """
+    Check whether an MP4 clip's moov box precedes its media data, so
+    playback can start before the whole file is downloaded.
+
+    Args:
+        path: Path to the clip
+
+    Returns:
+        True/False, or None if the file is not a readable MP4 (e.g. a git-lfs pointer)
+    """
+    try:
+        file_size = path.stat().st_size
+        with path.open("rb") as handle:
+            if handle.read(len(_LFS_POINTER_PREFIX)) == _LFS_POINTER_PREFIX:
+                return None
+            for box_type, _, _, _ in _iter_top_level_boxes(handle, file_size):
+                if box_type == b"moov":
+                    return True
+                if box_type == b"mdat":
+                    return False
+    except (OSError, struct.error):
+        return None
+
+    return None
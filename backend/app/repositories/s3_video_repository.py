@@ -0,0 +1,440 @@
+"""
+S3 Video Repository.
+Concrete implementation of IVideoRepository for S3-compatible object
+storage (AWS S3, MinIO, R2, ...). The bucket is listed once into an
+in-memory index; clips are downloaded on first use over a pooled
+keep-alive connection into a local DiskClipCache and served from there.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import os
+import threading
+import time
+import xml.etree.ElementTree as ElementTree
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import quote, urlsplit
+
+import httpx
+
+from app.core.interfaces.video_repository import ClipMetadata, IVideoRepository, VideoLookupResult
+from app.core.metrics import CACHE_REQUESTS, MODEL_LOAD_SECONDS, stage_timer
+from app.repositories.clip_cache import DiskClipCache
+from app.repositories.clip_probe import probe_clip
+from app.repositories.video_repository import RENDITIONS_DIRECTORY
+
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+_S3_NAMESPACE = {"s3": "http://s3.amazonaws.com/doc/2006-03-01/"}
+_DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class S3Credentials:
+    """Access key pair (plus session token for temporary credentials)."""
+
+    access_key_id: str
+    secret_access_key: str
+    session_token: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class StoredClip:
+    """A clip object listed in the bucket."""
+
+    key: str
+    size_bytes: int
+    last_modified: float  # Unix time
+
+
+def _uri_encode(value: str, safe: str = "-_.~") -> str:
+    """Percent-encode as required by Signature Version 4."""
+    return quote(value, safe=safe)
+
+
+def sign_request(
+    method: str,
+    host: str,
+    path: str,
+    query: dict[str, str],
+    credentials: S3Credentials,
+    region: str,
+    headers: dict[str, str] | None = None,
+    payload_hash: str = UNSIGNED_PAYLOAD,
+    now: datetime | None = None,
+) -> dict[str, str]:
+    """
+    Sign an S3 request with AWS Signature Version 4.
+
+    Args:
+        method: HTTP method
+        host: Host header value (with the port if not the default)
+        path: Percent-encoded request path, exactly as sent
+        query: Query parameters (not encoded)
+        credentials: Access key pair
+        region: Bucket region
+        headers: Additional headers to sign
+        payload_hash: Hex SHA-256 of the body, or UNSIGNED-PAYLOAD
+        now: Signing time (defaults to the current time)
+
+    Returns:
+        Headers to send, including Authorization
+    """
+    now = now or datetime.now(timezone.utc)
+    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+    scope = f"{amz_date[:8]}/{region}/s3/aws4_request"
+
+    signed = {name.lower(): value.strip() for name, value in (headers or {}).items()}
+    signed.update({"host": host, "x-amz-content-sha256": payload_hash, "x-amz-date": amz_date})
+    if credentials.session_token:
+        signed["x-amz-security-token"] = credentials.session_token
+    signed_names = ";".join(sorted(signed))
+
+    canonical_request = "\n".join([
+        method,
+        path,
+        "&".join(
+            f"{_uri_encode(name)}={_uri_encode(value)}" for name, value in sorted(query.items())
+        ),
+        "".join(f"{name}:{signed[name]}\n" for name in sorted(signed)),
+        signed_names,
+        payload_hash,
+    ])
+    string_to_sign = "\n".join([
+        "AWS4-HMAC-SHA256",
+        amz_date,
+        scope,
+        hashlib.sha256(canonical_request.encode()).hexdigest(),
+    ])
+
+    key = f"AWS4{credentials.secret_access_key}".encode()
+    for part in scope.split("/"):
+        key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+    signature = hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+    signed["authorization"] = (
+        f"AWS4-HMAC-SHA256 Credential={credentials.access_key_id}/{scope}, "
+        f"SignedHeaders={signed_names}, Signature={signature}"
+    )
+    return signed
+
+
+class S3VideoRepository(IVideoRepository):
+    """
+    Repository for accessing video files from an S3-compatible bucket.
+
+    Clips are <prefix><word>.mp4 objects, renditions are
+    <prefix>renditions/<name>/<word>.mp4 (the layout written by
+    app.cli.optimize_clips). The index is built by one paginated
+    listing; lookups never touch the network. fetch_clip downloads a
+    clip into the disk cache on first use. Concurrent requests for the
+    same clip share one download. Requests are signed with Signature
+    Version 4 when credentials are given and anonymous otherwise.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        cache: DiskClipCache,
+        prefix: str = "",
+        endpoint_url: str | None = None,
+        region: str = "us-east-1",
+        credentials: S3Credentials | None = None,
+        base_url: str = "/signs",
+        max_connections: int = 32,
+        timeout_seconds: float = 30.0,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        Initialize the repository.
+
+        Args:
+            bucket: Bucket name
+            cache: Local cache the clips are downloaded into
+            prefix: Key prefix of the clips, e.g. "asl/"
+            endpoint_url: Storage endpoint (AWS S3 of the region if None)
+            region: Bucket region, used for signing
+            credentials: Access key pair (None = anonymous requests)
+            base_url: Base URL path for serving videos
+            max_connections: Size of the download connection pool
+            timeout_seconds: Timeout of each storage request
+            transport: Transport of the listing client (e.g. a local stand-in)
+            async_transport: Transport of the download client
+        """
+        endpoint = urlsplit(endpoint_url or f"https://s3.{region}.amazonaws.com")
+        self._endpoint = f"{endpoint.scheme}://{endpoint.netloc}"
+        self._host = endpoint.netloc
+        self._bucket_path = f"{endpoint.path.rstrip('/')}/{_uri_encode(bucket)}"
+        self._prefix = prefix
+        self._region = region
+        self._credentials = credentials
+        self._cache = cache
+        self._base_url = base_url
+        self._video_extension = ".mp4"
+
+        # Listing happens in worker threads, downloads on the event loop;
+        # each client keeps its connections alive between requests
+        self._client = httpx.Client(timeout=timeout_seconds, transport=transport)
+        self._async_client = httpx.AsyncClient(
+            timeout=timeout_seconds,
+            transport=async_transport,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+        self._clips: dict[str, StoredClip] | None = None  # Relative path -> object
+        self._index_lock = threading.Lock()
+        self._available_words_cache: set[str] = set()
+        self._rendition_words: dict[str, set[str]] = {}
+        self._metadata_cache: dict[str, ClipMetadata] = {}
+        self._metadata_version = 0
+        self._downloads: dict[str, asyncio.Task[Path]] = {}
+
+    @property
+    def cache(self) -> DiskClipCache:
+        """Get the local clip cache."""
+        return self._cache
+
+    @property
+    def metadata_version(self) -> int:
+        """Counter increased by every listing and every clip probed after a download."""
+        return self._metadata_version
+
+    def _clip_name(self, word: str) -> str:
+        """Relative path (and URL suffix) of a word's clip."""
+        return f"{word}{self._video_extension}"
+
+    def _rendition_name(self, word: str, rendition: str) -> str:
+        """Relative path (and URL suffix) of a rendition of a word's clip."""
+        return f"{RENDITIONS_DIRECTORY}/{rendition}/{word}{self._video_extension}"
+
+    def _object_path(self, key: str) -> str:
+        """Percent-encoded request path of an object."""
+        return f"{self._bucket_path}/{_uri_encode(key, safe='-_.~/')}"
+
+    def _headers(self, method: str, path: str, query: dict[str, str]) -> dict[str, str]:
+        """Request headers, signed if the repository has credentials."""
+        if self._credentials is None:
+            return {}
+        return sign_request(method, self._host, path, query, self._credentials, self._region)
+
+    def _get_index(self) -> dict[str, StoredClip]:
+        """Get the bucket index, listing the bucket on first use (once across threads)."""
+        if self._clips is None:
+            with self._index_lock:
+                if self._clips is None:
+                    self._refresh_cache()
+        return self._clips or {}
+
+    def video_exists(self, word: str) -> bool:
+        """Check if a video exists for the given word."""
+        return self._clip_name(word) in self._get_index()
+
+    def find_video(self, word: str) -> VideoLookupResult:
+        """
+        Find a video for the given word.
+
+        video_path is where the clip is (or will be) cached locally.
+        """
+        return self._lookup(word, self._clip_name(word))
+
+    def find_rendition(self, word: str, rendition: str) -> VideoLookupResult:
+        """Find a rendition of a word's video (found=False if there is none)."""
+        return self._lookup(word, self._rendition_name(word, rendition))
+
+    def _lookup(self, word: str, name: str) -> VideoLookupResult:
+        """Build the lookup result of a clip from the index."""
+        clip = self._get_index().get(name)
+        if clip is None:
+            return VideoLookupResult(word=word, found=False)
+
+        return VideoLookupResult(
+            word=word,
+            found=True,
+            video_path=self._cache.path(name),
+            url=f"{self._base_url}/{name}",
+            # Size is known from the listing; the rest once the clip is cached
+            metadata=self._metadata_cache.get(name) or ClipMetadata(size_bytes=clip.size_bytes),
+        )
+
+    def get_renditions(self) -> list[str]:
+        """Names of the renditions available for at least one clip."""
+        self._get_index()
+        return sorted(self._rendition_words)
+
+    def get_available_words(self) -> list[str]:
+        """Get list of all available words with videos."""
+        self._get_index()
+        return list(self._available_words_cache)
+
+    def get_clip_metadata(self, word: str) -> ClipMetadata | None:
+        """Get the playback metadata of a word's clip."""
+        result = self.find_video(word)
+        return result.metadata
+
+    def get_word_count(self) -> int:
+        """Get the total number of available video words."""
+        return len(self.get_available_words())
+
+    async def fetch_clip(self, name: str) -> Path | None:
+        """
+        Get the local path of a clip, downloading it on a cache miss.
+
+        Args:
+            name: Relative path of the clip, as in its URL
+
+        Returns:
+            Path of the cached clip, or None if the bucket has no such clip
+
+        Raises:
+            httpx.HTTPError: If the download failed
+        """
+        index = self._clips
+        if index is None:
+            # A cold index means a paginated listing with the blocking client
+            index = await asyncio.to_thread(self._get_index)
+        clip = index.get(name)
+        if clip is None:
+            return None
+
+        path = self._cache.get(name)
+        if path is not None:
+            if name not in self._metadata_cache:
+                # Cached by an earlier run; the listing only knows its size
+                await self._probe(name, path)
+            return path
+
+        download = self._downloads.get(name)
+        if download is None:
+            download = asyncio.create_task(self._download(name, clip))
+            self._downloads[name] = download
+            download.add_done_callback(self._download_done(name))
+        else:
+            CACHE_REQUESTS.inc(cache="clips", result="coalesced")
+
+        # A cancelled request must not cancel the download other requests wait for
+        return await asyncio.shield(download)
+
+    def _download_done(self, name: str):
+        """Callback forgetting a finished download."""
+        def done(download: asyncio.Task[Path]) -> None:
+            self._downloads.pop(name, None)
+            if not download.cancelled():
+                download.exception()  # Retrieved, even if every waiter was cancelled
+        return done
+
+    async def _download(self, name: str, clip: StoredClip) -> Path:
+        """Download a clip into the cache and probe its metadata."""
+        path = self._object_path(clip.key)
+        partial = self._cache.partial_path(name)
+
+        try:
+            with stage_timer("clip_fetch"):
+                async with self._async_client.stream(
+                    "GET", self._endpoint + path, headers=self._headers("GET", path, {})
+                ) as response:
+                    response.raise_for_status()
+                    # Clips are small; writes go to the page cache
+                    with partial.open("wb") as handle:
+                        async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_BYTES):
+                            handle.write(chunk)
+            # The object's modification time lets later runs validate the file
+            os.utime(partial, (clip.last_modified, clip.last_modified))
+            cached = self._cache.commit(name, partial)
+        finally:
+            partial.unlink(missing_ok=True)
+
+        await self._probe(name, cached)
+        return cached
+
+    async def _probe(self, name: str, path: Path) -> None:
+        """Probe the metadata of a cached clip."""
+        metadata = await asyncio.to_thread(probe_clip, path)
+        if metadata is not None:
+            self._metadata_cache[name] = metadata
+            self._metadata_version += 1
+
+    def _list_objects(self) -> list[StoredClip]:
+        """List all objects under the prefix (ListObjectsV2, paginated)."""
+        clips: list[StoredClip] = []
+        query = {"list-type": "2", "prefix": self._prefix}
+
+        while True:
+            path = f"{self._bucket_path}/"
+            url = self._endpoint + path + "?" + "&".join(
+                f"{_uri_encode(name)}={_uri_encode(value)}" for name, value in sorted(query.items())
+            )
+            response = self._client.get(url, headers=self._headers("GET", path, query))
+            response.raise_for_status()
+            root = ElementTree.fromstring(response.content)
+
+            for contents in root.iterfind("s3:Contents", _S3_NAMESPACE):
+                clips.append(StoredClip(
+                    key=contents.findtext("s3:Key", "", _S3_NAMESPACE),
+                    size_bytes=int(contents.findtext("s3:Size", "0", _S3_NAMESPACE)),
+                    last_modified=datetime.fromisoformat(
+                        contents.findtext("s3:LastModified", "", _S3_NAMESPACE)
+                    ).timestamp(),
+                ))
+
+            token = root.findtext("s3:NextContinuationToken", None, _S3_NAMESPACE)
+            if root.findtext("s3:IsTruncated", "false", _S3_NAMESPACE) != "true" or not token:
+                return clips
+            query["continuation-token"] = token
+
+    def _refresh_cache(self) -> None:
+        """
+        List the bucket into the index.
+        Cached files that no longer match their object are deleted.
+
+        Raises:
+            httpx.HTTPError: If the bucket could not be listed
+        """
+        started = time.perf_counter()
+        index: dict[str, StoredClip] = {}
+        words: set[str] = set()
+        rendition_words: dict[str, set[str]] = {}
+
+        for clip in self._list_objects():
+            parts = clip.key[len(self._prefix):].split("/")
+            if not parts[-1].endswith(self._video_extension):
+                continue
+            word = parts[-1][: -len(self._video_extension)].lower()
+
+            if len(parts) == 1:
+                words.add(word)
+                index[self._clip_name(word)] = clip
+            elif len(parts) == 3 and parts[0] == RENDITIONS_DIRECTORY:
+                rendition_words.setdefault(parts[1], set()).add(word)
+                index[self._rendition_name(word, parts[1])] = clip
+
+        for name in self._cache.names():
+            clip = index.get(name)
+            try:
+                stat = self._cache.path(name).stat()
+            except OSError:
+                stat = None
+            if (
+                clip is None
+                or stat is None
+                or stat.st_size != clip.size_bytes
+                or int(stat.st_mtime) != int(clip.last_modified)
+            ):
+                self._cache.discard(name)
+
+        self._clips = index
+        self._available_words_cache = words
+        self._rendition_words = rendition_words
+        self._metadata_cache = {}
+        self._metadata_version += 1
+        MODEL_LOAD_SECONDS.set(time.perf_counter() - started, model="clip_listing")
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        self._client.close()
+        await self._async_client.aclose()
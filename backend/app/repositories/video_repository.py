@@ -4,10 +4,16 @@ Concrete implementation of IVideoRepository for local file system.
 Follows Open/Closed Principle - can be extended without modification.
 """
 
+import time
 from functools import lru_cache
 from pathlib import Path
 
-from app.core.interfaces.video_repository import IVideoRepository, VideoLookupResult
+from app.core.interfaces.video_repository import ClipMetadata, IVideoRepository, VideoLookupResult
+from app.core.metrics import MODEL_LOAD_SECONDS
+from app.repositories.clip_probe import probe_clip
+
+# Renditions of a library live in <videos_directory>/renditions/<name>/
+RENDITIONS_DIRECTORY = "renditions"
 
 
 class FileSystemVideoRepository(IVideoRepository):
@@ -15,6 +21,10 @@ class FileSystemVideoRepository(IVideoRepository):
     Repository for accessing video files from local file system.
     
     Implements caching for available words to improve performance.
+    Clip metadata (duration, size, frame rate, resolution) is probed once
+    per clip when the word cache is built and refreshed with it.
+    Lower-bitrate renditions (see app.cli.optimize_clips) are found in
+    the renditions/ subdirectory and probed on first use.
     """
 
     def __init__(self, videos_directory: Path, base_url: str = "/signs"):
@@ -31,6 +41,9 @@ class FileSystemVideoRepository(IVideoRepository):
         
         # Cache available words on initialization
         self._available_words_cache: set[str] | None = None
+        self._metadata_cache: dict[str, ClipMetadata] = {}
+        self._rendition_words: dict[str, set[str]] = {}
+        self._rendition_metadata: dict[tuple[str, str], ClipMetadata | None] = {}
 
     @property
     def videos_directory(self) -> Path:
@@ -65,10 +78,39 @@ class FileSystemVideoRepository(IVideoRepository):
                 found=True,
                 video_path=video_path,
                 url=self._get_video_url(word),
+                metadata=self.get_clip_metadata(word),
             )
         
         return VideoLookupResult(word=word, found=False)
 
+    def find_rendition(self, word: str, rendition: str) -> VideoLookupResult:
+        """Find a rendition of a word's video (found=False if there is none)."""
+        if self._available_words_cache is None:
+            self._refresh_cache()
+        
+        if word not in self._rendition_words.get(rendition, ()):
+            return VideoLookupResult(word=word, found=False)
+        
+        key = (rendition, word)
+        video_path = self._videos_dir / RENDITIONS_DIRECTORY / rendition / f"{word}{self._video_extension}"
+        if key not in self._rendition_metadata:
+            self._rendition_metadata[key] = probe_clip(video_path)
+        
+        return VideoLookupResult(
+            word=word,
+            found=True,
+            video_path=video_path,
+            url=f"{self._base_url}/{RENDITIONS_DIRECTORY}/{rendition}/{word}{self._video_extension}",
+            metadata=self._rendition_metadata[key],
+        )
+
+    def get_renditions(self) -> list[str]:
+        """Names of the renditions available for at least one clip."""
+        if self._available_words_cache is None:
+            self._refresh_cache()
+        
+        return sorted(self._rendition_words)
+
     def get_available_words(self) -> list[str]:
         """
         Get list of all available words with videos.
@@ -79,17 +121,56 @@ class FileSystemVideoRepository(IVideoRepository):
         
         return list(self._available_words_cache or [])
 
+    def get_clip_metadata(self, word: str) -> ClipMetadata | None:
+        """
+        Get the playback metadata of a word's clip.
+        Clips added after the cache was built are probed on first use.
+        """
+        if self._available_words_cache is None:
+            self._refresh_cache()
+        
+        metadata = self._metadata_cache.get(word)
+        if metadata is None:
+            metadata = probe_clip(self._get_video_path(word))
+            if metadata is not None:
+                self._metadata_cache[word] = metadata
+        
+        return metadata
+
     def _refresh_cache(self) -> None:
-        """Refresh the cache of available words."""
+        """Refresh the cache of available words and their clip metadata."""
         if not self._videos_dir.exists():
             self._available_words_cache = set()
+            self._metadata_cache = {}
+            self._rendition_words = {}
             return
         
-        self._available_words_cache = {
-            path.stem.lower()
-            for path in self._videos_dir.glob(f"*{self._video_extension}")
-            if path.is_file()
-        }
+        started = time.perf_counter()
+        words: set[str] = set()
+        metadata_cache: dict[str, ClipMetadata] = {}
+        
+        for path in self._videos_dir.glob(f"*{self._video_extension}"):
+            if not path.is_file():
+                continue
+            words.add(path.stem.lower())
+            metadata = probe_clip(path)
+            if metadata is not None:
+                metadata_cache[path.stem] = metadata
+        
+        rendition_words: dict[str, set[str]] = {}
+        renditions_dir = self._videos_dir / RENDITIONS_DIRECTORY
+        if renditions_dir.is_dir():
+            for directory in renditions_dir.iterdir():
+                if directory.is_dir():
+                    rendition_words[directory.name] = {
+                        path.stem for path in directory.glob(f"*{self._video_extension}")
+                    }
+        
+        self._available_words_cache = words
+        self._metadata_cache = metadata_cache
+        self._rendition_words = rendition_words
+        self._rendition_metadata = {}
+        MODEL_LOAD_SECONDS.set(time.perf_counter() - started, model="clip_metadata")
 
     def get_word_count(self) -> int:
         """Get the total number of available video words."""
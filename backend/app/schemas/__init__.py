@@ -2,8 +2,26 @@
 
 from app.schemas.translation import (
     TranslationRequest,
+    IncrementalTranslationRequest,
     TranslationResponse,
     TranslationItemSchema,
+    CompactTranslationResponse,
+    ClipManifestResponse,
+    TranslationDiffResponse,
+    DocumentTranslationRequest,
+    DocumentChunkResponse,
+    DocumentSummaryResponse,
 )
 
-__all__ = ["TranslationRequest", "TranslationResponse", "TranslationItemSchema"]
+__all__ = [
+    "TranslationRequest",
+    "IncrementalTranslationRequest",
+    "TranslationResponse",
+    "TranslationItemSchema",
+    "CompactTranslationResponse",
+    "ClipManifestResponse",
+    "TranslationDiffResponse",
+    "DocumentTranslationRequest",
+    "DocumentChunkResponse",
+    "DocumentSummaryResponse",
+]
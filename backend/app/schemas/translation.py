@@ -16,6 +16,21 @@ class TranslationRequest(BaseModel):
         description="Text to translate to sign language",
         examples=["Hello John, welcome to New York"],
     )
+    vocabulary: str | None = Field(
+        None,
+        description="Sign vocabulary to translate into (default vocabulary if omitted)",
+        examples=["default"],
+    )
+
+
+class IncrementalTranslationRequest(BaseModel):
+    """Message sent by the client over the incremental translation WebSocket."""
+
+    text: str = Field(
+        "",
+        max_length=1000,
+        description="Full current text of the input (may be empty)",
+    )
 
 
 class TranslationItemSchema(BaseModel):
@@ -29,6 +44,11 @@ class TranslationItemSchema(BaseModel):
         None, description="Letters if type is 'fingerspell'"
     )
     similarity: float | None = Field(None, description="Embedding similarity score")
+    duration: float | None = Field(None, description="Clip duration in seconds (video items)")
+    size_bytes: int | None = Field(None, description="Clip size in bytes (video items)")
+    frame_rate: float | None = Field(None, description="Clip frame rate (video items)")
+    width: int | None = Field(None, description="Clip width in pixels (video items)")
+    height: int | None = Field(None, description="Clip height in pixels (video items)")
 
 
 class TranslationResponse(BaseModel):
@@ -42,13 +62,116 @@ class TranslationResponse(BaseModel):
     stats: dict = Field(
         ...,
         description="Translation statistics",
-        examples=[{"video_count": 3, "fingerspell_count": 2, "skipped_count": 1}],
+        examples=[{
+            "video_count": 3,
+            "fingerspell_count": 2,
+            "skipped_count": 1,
+            "total": 6,
+            "total_duration": 4.2,
+        }],
+    )
+    degraded: bool = Field(
+        False,
+        description="True if the request's deadline only allowed cheap matching without NER",
     )
 
 
+class CompactTranslationResponse(BaseModel):
+    """Response body for translation endpoints with ?format=compact."""
+
+    manifest: str = Field(..., description="Version of the clip manifest the clip IDs refer to")
+    original_text: str = Field(..., description="Original input text")
+    items: list[list[int | str]] = Field(
+        ...,
+        description="Packed items [type, original_word, clip_id]: type 0 = video "
+        "(clip ID, or URL if the clip is not in the manifest), 1 = fingerspell "
+        "(the letters of original_word), 2 = skipped (no third element)",
+        examples=[[[0, "Hello", 412], [1, "John"], [2, "the"]]],
+    )
+    stats: dict = Field(..., description="Translation statistics")
+    degraded: bool = Field(
+        False,
+        description="True if the request's deadline only allowed cheap matching without NER",
+    )
+
+
+class ClipManifestResponse(BaseModel):
+    """Response body for the clip manifest endpoint."""
+
+    vocabulary: str = Field(..., description="Vocabulary name")
+    rendition: str | None = Field(None, description="Rendition the clip URLs point to")
+    version: str = Field(..., description="Manifest version (also its ETag)")
+    fields: list[str] = Field(
+        ...,
+        description="Columns of each clip row",
+        examples=[["word", "url", "duration", "size_bytes", "frame_rate", "width", "height"]],
+    )
+    clips: list[list[str | float | int | None]] = Field(
+        ..., description="Clip rows; a clip's ID is the index of its row"
+    )
+
+
+class TranslationDiffResponse(BaseModel):
+    """Message pushed over the incremental translation WebSocket."""
+
+    type: str = Field("diff", description="Message type: 'diff' or 'error'")
+    version: int = Field(..., description="Session version after this update")
+    start: int = Field(..., description="Index of the first replaced translation item")
+    delete_count: int = Field(
+        ..., description="Number of previous items removed at 'start'"
+    )
+    translations: list[TranslationItemSchema] = Field(
+        ..., description="Items inserted at 'start'"
+    )
+    stats: dict = Field(..., description="Translation statistics for the full text")
+
+
+class DocumentTranslationRequest(BaseModel):
+    """Request body for long-document translation."""
+
+    text: str = Field(
+        ...,
+        min_length=1,
+        description="Document text; split into sentences and translated in chunks",
+    )
+    vocabulary: str | None = Field(
+        None,
+        description="Sign vocabulary to translate into (default vocabulary if omitted)",
+        examples=["default"],
+    )
+
+
+class DocumentChunkResponse(BaseModel):
+    """One NDJSON line of a streamed document translation."""
+
+    type: str = Field("chunk", description="Line type: 'chunk', 'summary' or 'error'")
+    index: int = Field(..., description="Chunk index in document order")
+    start: int = Field(..., description="Character offset of the chunk in the document")
+    end: int = Field(..., description="Character offset just past the chunk")
+    original_text: str = Field(..., description="Text of the chunk")
+    translations: list[TranslationItemSchema] = Field(
+        ..., description="Translated items of all sentences in the chunk"
+    )
+    stats: dict = Field(..., description="Translation statistics for the chunk")
+
+
+class DocumentSummaryResponse(BaseModel):
+    """Final NDJSON line of a streamed document translation."""
+
+    type: str = Field("summary", description="Line type")
+    chunk_count: int = Field(..., description="Number of chunks translated")
+    stats: dict = Field(..., description="Translation statistics for the document")
+
+
 class HealthResponse(BaseModel):
     """Response body for health check endpoint."""
 
     status: str = Field("healthy", description="Service status")
     version: str = Field(..., description="API version")
     available_words: int = Field(..., description="Number of available sign videos")
+    vocabularies: list[str] = Field(
+        default_factory=list, description="Configured sign vocabularies"
+    )
+    loaded_vocabularies: list[str] = Field(
+        default_factory=list, description="Vocabularies currently held in memory"
+    )
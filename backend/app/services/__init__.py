@@ -1,6 +1,8 @@
 """Services package - business logic layer."""
 
+from app.services.async_translation_service import AsyncTranslationService
 from app.services.text_processor import PorterStemmerProcessor
+from app.services.tiered_matcher import TieredMatcher
 from app.services.translation_service import TranslationService
 
-__all__ = ["PorterStemmerProcessor", "TranslationService"]
+__all__ = ["AsyncTranslationService", "PorterStemmerProcessor", "TieredMatcher", "TranslationService"]
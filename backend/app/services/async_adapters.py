@@ -0,0 +1,120 @@
+"""
+Async Adapters - Async service interfaces over the synchronous implementations.
+Blocking calls (model inference, file system access) run in the default
+thread pool so the event loop stays free. Implementations that only read
+in-memory data can be called inline with offload=False, which saves the
+thread hop. Either way the call is profiled when its request is.
+"""
+
+import asyncio
+from collections.abc import Callable
+from typing import ParamSpec, TypeVar
+
+from app.core.interfaces.embedding_matcher import IAsyncEmbeddingMatcher, IEmbeddingMatcher, MatchResult
+from app.core.interfaces.ner_detector import EntityInfo, IAsyncNerDetector, INerDetector
+from app.core.interfaces.video_repository import IAsyncVideoRepository, IVideoRepository, VideoLookupResult
+from app.core.profiling import profiled_call
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+async def _call(offload: bool, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """Call a synchronous function in a worker thread, or inline."""
+    if offload:
+        # Copies the context, so stage timings and the profile still reach the current request
+        return await asyncio.to_thread(profiled_call, func, *args, **kwargs)
+    return profiled_call(func, *args, **kwargs)
+
+
+class AsyncEmbeddingMatcherAdapter(IAsyncEmbeddingMatcher):
+    """IAsyncEmbeddingMatcher over an IEmbeddingMatcher."""
+
+    def __init__(self, matcher: IEmbeddingMatcher, offload: bool = True):
+        """
+        Initialize the adapter.
+
+        Args:
+            matcher: Synchronous matcher to wrap
+            offload: Run calls in a worker thread (False = inline)
+        """
+        self._matcher = matcher
+        self._offload = offload
+
+    async def find_best_match(self, word: str) -> MatchResult:
+        """Find the best matching sign word for the input word."""
+        return await _call(self._offload, self._matcher.find_best_match, word)
+
+    async def find_best_matches(self, words: list[str]) -> list[MatchResult]:
+        """Match a batch of words in one call of the wrapped matcher."""
+        return await _call(self._offload, self._matcher.find_best_matches, words)
+
+    async def get_vocabulary_size(self) -> int:
+        """Get the number of words in the sign vocabulary."""
+        return self._matcher.get_vocabulary_size()
+
+
+class AsyncNerDetectorAdapter(IAsyncNerDetector):
+    """IAsyncNerDetector over an INerDetector."""
+
+    def __init__(self, detector: INerDetector, offload: bool = True):
+        """
+        Initialize the adapter.
+
+        Args:
+            detector: Synchronous detector to wrap
+            offload: Run calls in a worker thread (False = inline)
+        """
+        self._detector = detector
+        self._offload = offload
+
+    async def detect_entities(self, text: str) -> list[EntityInfo]:
+        """Detect all named entities in the text."""
+        return await _call(self._offload, self._detector.detect_entities, text)
+
+    async def get_entity_words(self, text: str) -> set[str]:
+        """Get all words that are part of fingerspellable named entities."""
+        return await _call(self._offload, self._detector.get_entity_words, text)
+
+    async def get_entity_words_batch(self, texts: list[str]) -> list[set[str]]:
+        """Get the entity words of a batch of texts in one call of the wrapped detector."""
+        return await _call(self._offload, self._detector.get_entity_words_batch, texts)
+
+
+class AsyncVideoRepositoryAdapter(IAsyncVideoRepository):
+    """IAsyncVideoRepository over an IVideoRepository."""
+
+    def __init__(self, repository: IVideoRepository, offload: bool = True):
+        """
+        Initialize the adapter.
+
+        Args:
+            repository: Synchronous repository to wrap
+            offload: Run calls in a worker thread (False = inline, for
+                repositories answering from an in-memory index)
+        """
+        self._repository = repository
+        self._offload = offload
+
+    async def find_video(self, word: str) -> VideoLookupResult:
+        """Find a video file for the given word."""
+        return await _call(self._offload, self._repository.find_video, word)
+
+    async def find_videos(self, words: list[str]) -> list[VideoLookupResult]:
+        """Find the videos of several words in one worker thread call."""
+        return await _call(self._offload, lambda: [self._repository.find_video(word) for word in words])
+
+    async def video_exists(self, word: str) -> bool:
+        """Check if a video exists for the given word."""
+        return await _call(self._offload, self._repository.video_exists, word)
+
+    async def get_available_words(self) -> list[str]:
+        """Get list of all available words with videos."""
+        return await _call(self._offload, self._repository.get_available_words)
+
+    async def find_renditions(self, words: list[str], rendition: str) -> list[VideoLookupResult]:
+        """Find the renditions of several words in one worker thread call."""
+        return await _call(
+            self._offload,
+            lambda: [self._repository.find_rendition(word, rendition) for word in words],
+        )
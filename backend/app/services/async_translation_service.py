@@ -0,0 +1,221 @@
+"""
+Async Translation Service - Translation with async service components.
+Produces the same results as TranslationService, but awaits its matcher,
+NER detector and repository, so named-entity detection runs concurrently
+with phrase matching, word matching and video lookups.
+"""
+
+import asyncio
+import re
+from collections.abc import Iterable
+from dataclasses import replace
+
+from app.core.cache import LruCache
+from app.core.interfaces.embedding_matcher import IAsyncEmbeddingMatcher, MatchResult
+from app.core.interfaces.ner_detector import IAsyncNerDetector
+from app.core.interfaces.phrase_matcher import IPhraseMatcher, PhraseMatch
+from app.core.interfaces.video_repository import IAsyncVideoRepository, VideoLookupResult
+from app.core.metrics import stage_timer
+from app.core.profiling import profiled_call
+from app.services.translation_service import (
+    TranslationResult,
+    assemble_items,
+    build_result,
+    rendition_item,
+    uncovered_indices,
+    word_item,
+)
+
+
+class AsyncTranslationService:
+    """
+    Service for translating text to sign language video URLs on the event loop.
+
+    Processing Flow (two concurrent branches):
+    - Named entities of the text
+    - Phrase signs, then the best match of every remaining word (one
+      batched call), then the videos of all matches (one batched call)
+    The branches are joined with asyncio.gather and the items are
+    assembled exactly as TranslationService does.
+
+    Synchronous implementations are used through the adapters in
+    app.services.async_adapters.
+    """
+
+    def __init__(
+        self,
+        embedding_matcher: IAsyncEmbeddingMatcher,
+        ner_detector: IAsyncNerDetector,
+        video_repository: IAsyncVideoRepository,
+        result_cache: LruCache[str, TranslationResult] | None = None,
+        degraded_matcher: IAsyncEmbeddingMatcher | None = None,
+        phrase_matcher: IPhraseMatcher | None = None,
+    ):
+        """
+        Initialize the translation service.
+
+        Args:
+            embedding_matcher: Semantic word matcher
+            ner_detector: Named entity detector
+            video_repository: Repository for video lookup
+            result_cache: Optional cache of translated texts (may be
+                shared with a TranslationService of the same vocabulary)
+            degraded_matcher: Cheap matcher for degraded mode; the
+                embedding matcher if None
+            phrase_matcher: Optional matcher of multi-word phrase signs
+                (run in a worker thread, it may call a model)
+        """
+        self._embedding_matcher = embedding_matcher
+        self._ner_detector = ner_detector
+        self._video_repository = video_repository
+        self._result_cache = result_cache
+        self._degraded_matcher = degraded_matcher or embedding_matcher
+        self._phrase_matcher = phrase_matcher
+        self._word_pattern = re.compile(r"[a-zA-Z]+")
+
+    async def translate(self, text: str, degraded: bool = False) -> TranslationResult:
+        """
+        Translate text to sign language video references.
+
+        Args:
+            text: Input text to translate
+            degraded: Use the cheap degraded mode (a cached full result
+                is still returned if there is one)
+
+        Returns:
+            TranslationResult with video URLs, fingerspelling, and skipped words
+        """
+        if self._result_cache is not None:
+            cached = self._result_cache.get(text)
+            if cached is not None:
+                return cached
+
+        if degraded:
+            # Degraded results are never cached; the next request may afford the full path
+            return await self._translate_degraded(text)
+
+        result = await self._translate_uncached(text)
+
+        if self._result_cache is not None:
+            self._result_cache.put(text, result)
+        return result
+
+    async def _translate_uncached(self, text: str) -> TranslationResult:
+        """Translate text without consulting the result cache."""
+        words = self.tokenize(text)
+
+        entity_words, (phrases, matches, videos) = await asyncio.gather(
+            self._get_entity_words(text),
+            self._match_and_look_up(words),
+        )
+
+        items = assemble_items(
+            words, entity_words, phrases, lambda word: matches[word.lower()], videos.__getitem__
+        )
+        return build_result(text, items)
+
+    async def _translate_degraded(self, text: str) -> TranslationResult:
+        """Translate text with the degraded matcher and without NER."""
+        words = self.tokenize(text)
+        matches = await self._match_words(self._degraded_matcher, [word.lower() for word in words])
+        videos = await self._find_videos(self._matched_words(matches.values()))
+
+        items = [word_item(word, set(), matches[word.lower()], videos.__getitem__) for word in words]
+        result = build_result(text, items)
+        result.degraded = True
+        return result
+
+    async def _match_and_look_up(
+        self,
+        words: list[str],
+    ) -> tuple[list[PhraseMatch], dict[str, MatchResult], dict[str, VideoLookupResult]]:
+        """Find the phrases and word matches of a text and look up all their videos."""
+        phrases = await self._find_phrases(words)
+
+        phrase_videos, matches = await asyncio.gather(
+            self._find_videos([phrase.phrase for phrase in phrases]),
+            self._match_words(
+                self._embedding_matcher,
+                [words[idx].lower() for idx in uncovered_indices(len(words), phrases)],
+            ),
+        )
+
+        # Words of a phrase without a video are translated on their own
+        fallback_words = [
+            word.lower()
+            for phrase in phrases
+            if not phrase_videos[phrase.phrase].found
+            for word in words[phrase.start:phrase.end]
+        ]
+        if fallback_words:
+            matches.update(await self._match_words(self._embedding_matcher, fallback_words))
+
+        videos = await self._find_videos(self._matched_words(matches.values()))
+        return phrases, matches, videos | phrase_videos
+
+    async def _get_entity_words(self, text: str) -> set[str]:
+        """Get the lowercase words that are part of named entities in the text."""
+        with stage_timer("ner"):
+            return await self._ner_detector.get_entity_words(text)
+
+    async def _find_phrases(self, words: list[str]) -> list[PhraseMatch]:
+        """Find the phrase signs of a tokenized text (none without a phrase matcher)."""
+        if self._phrase_matcher is None or not words:
+            return []
+        return await asyncio.to_thread(profiled_call, self._phrase_matcher.find_phrases, words)
+
+    @staticmethod
+    async def _match_words(matcher: IAsyncEmbeddingMatcher, words: list[str]) -> dict[str, MatchResult]:
+        """Match each unique word once, in one batched call."""
+        unique_words = list(dict.fromkeys(words))
+        if not unique_words:
+            return {}
+        return dict(zip(unique_words, await matcher.find_best_matches(unique_words)))
+
+    @staticmethod
+    def _matched_words(matches: Iterable[MatchResult]) -> list[str]:
+        """Sign words of the successful matches."""
+        return [match.matched_word for match in matches if match.is_match and match.matched_word]
+
+    async def _find_videos(self, words: list[str]) -> dict[str, VideoLookupResult]:
+        """Look up the video of each unique sign word, in one batched call."""
+        unique_words = list(dict.fromkeys(words))
+        if not unique_words:
+            return {}
+        with stage_timer("lookup"):
+            return dict(zip(unique_words, await self._video_repository.find_videos(unique_words)))
+
+    def tokenize(self, text: str) -> list[str]:
+        """Extract the words that are translated from the text."""
+        with stage_timer("tokenize"):
+            return self._word_pattern.findall(text)
+
+    async def with_rendition(self, result: TranslationResult, rendition: str | None) -> TranslationResult:
+        """
+        Point the video items of a result at a lower-bitrate rendition.
+
+        Returns a copy (see TranslationService.with_rendition); all
+        renditions are looked up in one batched call.
+
+        Args:
+            result: Translation result
+            rendition: Rendition name (None = original videos)
+
+        Returns:
+            TranslationResult with rendition URLs and metadata
+        """
+        if rendition is None or result.video_count == 0:
+            return result
+
+        positions = [
+            idx for idx, item in enumerate(result.items)
+            if item.type == "video" and item.matched_word
+        ]
+        lookups = await self._video_repository.find_renditions(
+            [result.items[idx].matched_word for idx in positions], rendition
+        )
+
+        items = list(result.items)
+        for idx, lookup in zip(positions, lookups):
+            items[idx] = rendition_item(items[idx], lookup)
+        return replace(result, items=items)
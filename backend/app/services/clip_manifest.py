@@ -0,0 +1,132 @@
+"""
+Clip Manifest - Versioned table of a vocabulary's clips.
+Assigns every clip of a vocabulary an integer ID, so compact translation
+responses can reference clips by ID instead of repeating their URL and
+metadata. Clients fetch the manifest once and cache it by its version.
+"""
+
+import hashlib
+from dataclasses import dataclass
+
+import orjson
+
+from app.core.cache import LruCache
+from app.core.interfaces.video_repository import IVideoRepository
+from app.services.translation_service import rendition_item, video_item
+from app.services.vocabulary_registry import LoadedVocabulary
+
+# Columns of a manifest row; a clip's ID is the index of its row
+MANIFEST_FIELDS = ("word", "url", "duration", "size_bytes", "frame_rate", "width", "height")
+
+# Item type codes of the compact translation format
+ITEM_TYPE_CODES = {"video": 0, "fingerspell": 1, "skipped": 2}
+
+
+@dataclass(frozen=True, slots=True)
+class ClipManifest:
+    """Clip IDs of a vocabulary (and rendition), with the serialized manifest."""
+
+    vocabulary: str
+    rendition: str | None
+    version: str  # Hash of the rows; changes whenever an ID, URL or metadata does
+    clip_ids: dict[str, int]  # Sign word -> clip ID
+    body: bytes  # Manifest response body
+
+    @property
+    def etag(self) -> str:
+        """Strong ETag of the manifest."""
+        return f'"{self.version}"'
+
+
+def build_clip_manifest(
+    vocabulary: str,
+    repository: IVideoRepository,
+    rendition: str | None = None,
+) -> ClipManifest:
+    """
+    Build the clip manifest of a vocabulary.
+
+    Clips are numbered in sorted word order, so IDs stay the same while
+    the word list does. With a rendition, rows describe the rendition
+    of each clip that has one, exactly as translation responses would.
+
+    Args:
+        vocabulary: Vocabulary name
+        repository: Clip repository of the vocabulary
+        rendition: Rendition name (None = original clips)
+
+    Returns:
+        ClipManifest
+    """
+    rows = []
+    for word in sorted(repository.get_available_words()):
+        lookup = repository.find_video(word)
+        if not lookup.found:
+            continue
+        item = video_item(word, word, 1.0, lookup)
+        if rendition is not None:
+            item = rendition_item(item, repository.find_rendition(word, rendition))
+        rows.append([word, item.url, item.duration, item.size_bytes, item.frame_rate, item.width, item.height])
+
+    version = hashlib.sha256(orjson.dumps([vocabulary, rows])).hexdigest()[:32]
+    body = orjson.dumps({
+        "vocabulary": vocabulary,
+        "rendition": rendition,
+        "version": version,
+        "fields": MANIFEST_FIELDS,
+        "clips": rows,
+    })
+    return ClipManifest(
+        vocabulary=vocabulary,
+        rendition=rendition,
+        version=version,
+        clip_ids={row[0]: clip_id for clip_id, row in enumerate(rows)},
+        body=body,
+    )
+
+
+class ClipManifestService:
+    """
+    Builds clip manifests on first use and keeps the recent ones.
+
+    Manifests are keyed by vocabulary fingerprint, so a reloaded
+    vocabulary with different words gets a new manifest. A manifest is
+    rebuilt once its repository's metadata_version changes, e.g. when
+    an S3 clip's duration and resolution are known after its download.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Initialize the service.
+
+        Args:
+            max_size: Maximum number of manifests (vocabulary x rendition) kept
+        """
+        # Key -> (metadata version the manifest was built at, manifest)
+        self._cache: LruCache[tuple[str, str, str | None], tuple[int, ClipManifest]] = LruCache(
+            "manifest", max_size
+        )
+
+    def get(self, vocabulary: LoadedVocabulary, rendition: str | None = None) -> ClipManifest:
+        """
+        Get the clip manifest of a vocabulary, building it if needed.
+
+        Builds read the whole clip listing; call from a worker thread.
+
+        Args:
+            vocabulary: Loaded vocabulary
+            rendition: Rendition name (None = original clips)
+
+        Returns:
+            ClipManifest
+        """
+        key = (vocabulary.name, vocabulary.fingerprint, rendition)
+        # Read before building, so metadata learned during the build triggers another
+        metadata_version = vocabulary.video_repository.metadata_version
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == metadata_version:
+            return cached[1]
+
+        manifest = build_clip_manifest(vocabulary.name, vocabulary.video_repository, rendition)
+        self._cache.put(key, (metadata_version, manifest))
+        return manifest
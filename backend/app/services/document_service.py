@@ -0,0 +1,170 @@
+"""
+Document Translation Service - Long-text translation in parallel chunks.
+Segments text into sentences with NLTK punkt and translates sentence
+chunks across a worker pool, yielding results in document order.
+"""
+
+import asyncio
+import contextvars
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+from app.core.profiling import profiled_call
+from app.services.translation_service import TranslationResult, TranslationService
+
+
+@dataclass
+class DocumentChunk:
+    """A run of consecutive sentences translated together."""
+
+    index: int
+    start: int  # Character offset of the chunk in the document
+    end: int
+    sentences: list[str]
+
+
+@dataclass
+class DocumentChunkResult:
+    """Translation of a single document chunk."""
+
+    chunk: DocumentChunk
+    sentences: list[TranslationResult]
+
+
+class DocumentTranslationService:
+    """
+    Service for translating documents longer than a single request.
+
+    Sentences are grouped into chunks, each chunk is translated with one
+    batched NER call and one batched matching call, and chunks run in
+    parallel on a thread pool (spaCy and the transformer release the GIL
+    for most of their work). At most `max_in_flight` chunks are pending
+    at any time, so memory stays bounded regardless of document length.
+    """
+
+    def __init__(
+        self,
+        translation_service: TranslationService,
+        max_workers: int = 4,
+        chunk_sentences: int = 8,
+        chunk_max_chars: int = 2000,
+        max_in_flight: int | None = None,
+        language: str = "english",
+    ):
+        """
+        Initialize the document service.
+
+        Args:
+            translation_service: Service used to translate each chunk
+            max_workers: Number of worker threads
+            chunk_sentences: Maximum number of sentences per chunk
+            chunk_max_chars: Soft character limit per chunk
+            max_in_flight: Maximum chunks submitted but not yet yielded
+            language: Punkt model language
+        """
+        from nltk.tokenize import PunktTokenizer  # nltk imports scipy; load on first use
+        
+        self._translation_service = translation_service
+        self._max_workers = max_workers
+        self._chunk_sentences = chunk_sentences
+        self._chunk_max_chars = chunk_max_chars
+        self._max_in_flight = max_in_flight or max_workers * 2
+        self._sentence_tokenizer = PunktTokenizer(language)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="document-translation",
+        )
+
+    def iter_chunks(self, text: str) -> Iterator[DocumentChunk]:
+        """
+        Lazily split a document into sentence chunks.
+
+        Args:
+            text: Full document text
+
+        Yields:
+            DocumentChunk objects in document order
+        """
+        index = 0
+        sentences: list[str] = []
+        chunk_start = 0
+        chunk_end = 0
+        chunk_chars = 0
+
+        for start, end in self._sentence_tokenizer.span_tokenize(text):
+            sentence = text[start:end]
+            if sentences and (
+                len(sentences) >= self._chunk_sentences
+                or chunk_chars + len(sentence) > self._chunk_max_chars
+            ):
+                yield DocumentChunk(index, chunk_start, chunk_end, sentences)
+                index += 1
+                sentences = []
+
+            if not sentences:
+                chunk_start = start
+                chunk_chars = 0
+            sentences.append(sentence)
+            chunk_end = end
+            chunk_chars += len(sentence)
+
+        if sentences:
+            yield DocumentChunk(index, chunk_start, chunk_end, sentences)
+
+    async def translate_stream(
+        self,
+        text: str,
+        translation_service: TranslationService | None = None,
+    ) -> AsyncIterator[DocumentChunkResult]:
+        """
+        Translate a document, yielding chunk results in order as they finish.
+
+        Chunk results are awaited, so no event loop or thread pool thread
+        is parked while the workers translate. Each chunk runs in a copy
+        of the caller's context, so its stage timings and profile reach
+        the request.
+
+        Args:
+            text: Full document text
+            translation_service: Service to translate with, e.g. of another
+                vocabulary (the service given at construction if None)
+
+        Yields:
+            DocumentChunkResult for each chunk, in document order
+        """
+        service = translation_service or self._translation_service
+        pending: deque[tuple[DocumentChunk, Future[list[TranslationResult]]]] = deque()
+
+        try:
+            for chunk in self.iter_chunks(text):
+                pending.append(
+                    (
+                        chunk,
+                        # A context per job: one context cannot be entered by two threads at once
+                        self._executor.submit(
+                            contextvars.copy_context().run,
+                            profiled_call,
+                            service.translate_batch,
+                            chunk.sentences,
+                        ),
+                    )
+                )
+
+                # Wait for the oldest chunk once the window is full
+                if len(pending) >= self._max_in_flight:
+                    done_chunk, future = pending.popleft()
+                    yield DocumentChunkResult(done_chunk, await asyncio.wrap_future(future))
+
+            while pending:
+                done_chunk, future = pending.popleft()
+                yield DocumentChunkResult(done_chunk, await asyncio.wrap_future(future))
+        finally:
+            # Client went away or a chunk failed - drop queued work
+            for _, future in pending:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
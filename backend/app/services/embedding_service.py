@@ -3,14 +3,35 @@ Embedding Service - Semantic word matching using sentence-transformers.
 Pre-computes embeddings for sign vocabulary for fast similarity search.
 """
 
+import time
+
 import numpy as np
 from functools import lru_cache
 from sentence_transformers import SentenceTransformer
 
-from app.core.interfaces.embedding_matcher import IEmbeddingMatcher, MatchResult
+from app.core.interfaces.embedding_matcher import INDEX_ENTRY_BYTES, IEmbeddingMatcher, MatchResult
+from app.core.interfaces.text_encoder import ITextEncoder
+from app.core.metrics import MATCHES, MODEL_LOAD_SECONDS, stage_timer
+
+
+def load_embedding_model(model_name: str) -> SentenceTransformer:
+    """
+    Load a sentence-transformers model.
+    
+    Args:
+        model_name: Sentence transformer model name
+        
+    Returns:
+        Loaded model, shareable between EmbeddingService instances
+    """
+    print(f"Loading embedding model: {model_name}...")
+    started = time.perf_counter()
+    model = SentenceTransformer(model_name)
+    MODEL_LOAD_SECONDS.set(time.perf_counter() - started, model=model_name)
+    return model
 
 
-class EmbeddingService(IEmbeddingMatcher):
+class EmbeddingService(IEmbeddingMatcher, ITextEncoder):
     """
     Embedding-based semantic word matcher.
     
@@ -23,6 +44,7 @@ class EmbeddingService(IEmbeddingMatcher):
         vocabulary: list[str],
         model_name: str = "all-MiniLM-L6-v2",
         similarity_threshold: float = 0.7,
+        model: SentenceTransformer | None = None,
     ):
         """
         Initialize the embedding service.
@@ -31,22 +53,24 @@ class EmbeddingService(IEmbeddingMatcher):
             vocabulary: List of available sign words
             model_name: Sentence transformer model name
             similarity_threshold: Minimum similarity for a match
+            model: Already loaded model to share (loaded from model_name if None)
         """
         self._vocabulary = [word.lower() for word in vocabulary]
         self._threshold = similarity_threshold
         
-        # Load the model
-        print(f"Loading embedding model: {model_name}...")
-        self._model = SentenceTransformer(model_name)
+        # Load the model unless a shared one is given
+        self._model = model if model is not None else load_embedding_model(model_name)
         
         # Pre-compute embeddings for all vocabulary words
         print(f"Computing embeddings for {len(self._vocabulary)} words...")
+        started = time.perf_counter()
         self._vocab_embeddings = self._model.encode(
             self._vocabulary,
             convert_to_numpy=True,
             normalize_embeddings=True,  # For faster cosine similarity
             show_progress_bar=False,
         )
+        MODEL_LOAD_SECONDS.set(time.perf_counter() - started, model="vocabulary_embeddings")
         print("Embeddings ready!")
         
         # Create word to index mapping for fast lookup
@@ -66,39 +90,128 @@ class EmbeddingService(IEmbeddingMatcher):
         
         # Check for exact match first (fast path)
         if word_lower in self._word_to_idx:
+            MATCHES.inc(path="exact", result="match")
             return MatchResult(
                 query_word=word,
                 matched_word=word_lower,
                 similarity=1.0,
                 is_match=True,
+                tier="exact",
             )
         
         # Compute embedding for query word
-        query_embedding = self._model.encode(
-            word_lower,
-            convert_to_numpy=True,
-            normalize_embeddings=True,
-        )
+        with stage_timer("embed"):
+            query_embedding = self._model.encode(
+                word_lower,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            )
         
         # Compute cosine similarities (dot product since normalized)
-        similarities = np.dot(self._vocab_embeddings, query_embedding)
-        
-        # Find best match
-        best_idx = np.argmax(similarities)
+        with stage_timer("similarity"):
+            similarities = np.dot(self._vocab_embeddings, query_embedding)
+            
+            # Find best match
+            best_idx = np.argmax(similarities)
         best_similarity = float(similarities[best_idx])
         best_word = self._vocabulary[best_idx]
+        MATCHES.inc(
+            path="embedding",
+            result="match" if best_similarity >= self._threshold else "no_match",
+        )
         
         return MatchResult(
             query_word=word,
             matched_word=best_word if best_similarity >= self._threshold else None,
             similarity=best_similarity,
             is_match=best_similarity >= self._threshold,
+            tier="embedding",
         )
 
+    def find_best_matches(self, words: list[str]) -> list[MatchResult]:
+        """
+        Find the best matching sign words for a batch of words.
+        
+        Exact matches are resolved without the model; the remaining
+        unique words are encoded in a single batched call.
+        
+        Args:
+            words: Input words to match
+            
+        Returns:
+            MatchResult for each word, in input order
+        """
+        results: list[MatchResult | None] = [None] * len(words)
+        pending: dict[str, list[int]] = {}
+        
+        for idx, word in enumerate(words):
+            word_lower = word.lower()
+            if word_lower in self._word_to_idx:
+                MATCHES.inc(path="exact", result="match")
+                results[idx] = MatchResult(
+                    query_word=word,
+                    matched_word=word_lower,
+                    similarity=1.0,
+                    is_match=True,
+                    tier="exact",
+                )
+            else:
+                pending.setdefault(word_lower, []).append(idx)
+        
+        if pending:
+            unique_words = list(pending)
+            with stage_timer("embed"):
+                query_embeddings = self._model.encode(
+                    unique_words,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                    show_progress_bar=False,
+                )
+            
+            # (queries x vocabulary) similarity matrix in one product
+            with stage_timer("similarity"):
+                similarities = np.dot(query_embeddings, self._vocab_embeddings.T)
+                best_indices = np.argmax(similarities, axis=1)
+            
+            for row, word_lower in enumerate(unique_words):
+                best_idx = best_indices[row]
+                best_similarity = float(similarities[row, best_idx])
+                is_match = best_similarity >= self._threshold
+                MATCHES.inc(
+                    amount=len(pending[word_lower]),
+                    path="embedding",
+                    result="match" if is_match else "no_match",
+                )
+                
+                for idx in pending[word_lower]:
+                    results[idx] = MatchResult(
+                        query_word=words[idx],
+                        matched_word=self._vocabulary[best_idx] if is_match else None,
+                        similarity=best_similarity,
+                        is_match=is_match,
+                        tier="embedding",
+                    )
+        
+        return results
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        """Embed texts (e.g. phrase candidates) in one batched model call."""
+        with stage_timer("embed"):
+            return self._model.encode(
+                texts,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+            )
+
     def get_vocabulary_size(self) -> int:
         """Get the number of words in the sign vocabulary."""
         return len(self._vocabulary)
 
+    def estimate_memory_bytes(self) -> int:
+        """Approximate memory held by the vocabulary embeddings and index."""
+        return int(self._vocab_embeddings.nbytes) + len(self._vocabulary) * INDEX_ENTRY_BYTES
+
     @property
     def threshold(self) -> float:
         """Get the similarity threshold."""
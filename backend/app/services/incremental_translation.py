@@ -0,0 +1,234 @@
+"""
+Incremental Translation - Per-session state for as-you-type translation.
+Reuses NER, phrase span and match results and the items outside the
+edit, and sends only the changed items.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+
+from app.core.interfaces.embedding_matcher import MatchResult
+from app.core.interfaces.phrase_matcher import PhraseMatch
+from app.core.metrics import CACHE_REQUESTS
+from app.services.translation_service import (
+    TranslationItem,
+    TranslationResult,
+    TranslationService,
+)
+
+
+@dataclass
+class TranslationDiff:
+    """Change to the item list of a session after a text update."""
+
+    version: int
+    start: int  # Index of the first replaced item
+    delete_count: int  # Number of previous items removed at start
+    items: list[TranslationItem]  # Items inserted at start
+    result: TranslationResult  # Full translation after applying the diff
+    ner_reused: bool
+
+    @property
+    def is_empty(self) -> bool:
+        """True if the update did not change any item."""
+        return self.delete_count == 0 and not self.items
+
+
+def moved(span: PhraseMatch, shift: int) -> PhraseMatch:
+    """A phrase span moved by a number of tokens."""
+    return replace(span, start=span.start + shift, end=span.end + shift)
+
+
+def item_count(items: list[TranslationItem], tokens: int) -> int:
+    """Number of leading items covering the first tokens of their text."""
+    covered = 0
+    count = 0
+    while covered < tokens:
+        # Tokens have no spaces, so a phrase item covers one token per word of it
+        covered += items[count].original_word.count(" ") + 1
+        count += 1
+    return count
+
+
+class IncrementalTranslationSession:
+    """
+    Translation state for a single as-you-type client.
+
+    Keeps the previous tokens, their items, the entity words, the
+    phrase span matches and a bounded cache of match results, so an
+    update only matches words it has not seen before. Only phrase
+    candidates overlapping the edited tokens (i.e. within a phrase
+    length of the edit) are matched again; the other span matches are
+    kept, and all of them are resolved over the whole text as
+    TranslationService.translate does, so a phrase completed by the
+    edit ("a lot" after typing "lot") replaces the items of its words.
+    Items are rebuilt only for the edited tokens and the phrases whose
+    resolution changed, unless the entity words changed. The diff is
+    the span of items between the unchanged prefix and suffix of the
+    item list. NER is re-run only when the edit can change entities,
+    i.e. when a capitalized word is inserted or an entity word is
+    removed.
+    """
+
+    def __init__(self, translation_service: TranslationService, max_cached_matches: int = 2048):
+        """
+        Initialize the session.
+
+        Args:
+            translation_service: Service providing tokenization, matching and NER
+            max_cached_matches: Maximum number of match results kept per session
+        """
+        self._service = translation_service
+        self._max_cached_matches = max_cached_matches
+
+        self._version = 0
+        self._tokens: list[str] = []
+        self._items: list[TranslationItem] = []
+        self._spans: list[PhraseMatch] = []
+        self._phrases: list[PhraseMatch] = []
+        self._entity_words: set[str] = set()
+        self._matches: OrderedDict[str, MatchResult] = OrderedDict()
+
+    @property
+    def version(self) -> int:
+        """Number of updates applied to the session."""
+        return self._version
+
+    def update(self, text: str) -> TranslationDiff:
+        """
+        Apply a new version of the text and compute the item diff.
+
+        Args:
+            text: Full current text of the input
+
+        Returns:
+            TranslationDiff describing the replaced item range
+        """
+        old_tokens = self._tokens
+        new_tokens = self._service.tokenize(text)
+
+        # Find the edited tokens between the unchanged prefix and suffix
+        prefix = 0
+        max_prefix = min(len(old_tokens), len(new_tokens))
+        while prefix < max_prefix and old_tokens[prefix] == new_tokens[prefix]:
+            prefix += 1
+
+        suffix = 0
+        max_suffix = max_prefix - prefix
+        while (
+            suffix < max_suffix
+            and old_tokens[len(old_tokens) - 1 - suffix] == new_tokens[len(new_tokens) - 1 - suffix]
+        ):
+            suffix += 1
+
+        old_end = len(old_tokens) - suffix
+        new_end = len(new_tokens) - suffix
+        shift = len(new_tokens) - len(old_tokens)
+
+        # Re-run NER only if the edit can affect entities
+        ner_reused = not self._affects_entities(old_tokens[prefix:old_end], new_tokens[prefix:new_end])
+        old_entity_words = self._entity_words
+        if not ner_reused:
+            self._entity_words = self._service.get_entity_words(text)
+
+        # Span matches beside the edit are kept; only candidates overlapping it are matched
+        before = [span for span in self._spans if span.end <= prefix]
+        after = [moved(span, shift) for span in self._spans if span.start >= old_end]
+        spans = before + self._service.find_phrase_spans(new_tokens, prefix, new_end) + after
+        # Shortest spans first, the order the phrase matcher collects them in
+        spans.sort(key=lambda span: (span.end - span.start, span.start))
+        phrases = self._service.resolve_phrases(len(new_tokens), spans)
+
+        # Tokens whose items change: the edit and every phrase whose resolution changed
+        if self._entity_words != old_entity_words:
+            low, high = 0, len(new_tokens)
+        else:
+            low, high = prefix, new_end
+            kept = set()
+            for phrase in self._phrases:
+                if phrase.end <= prefix:
+                    kept.add(phrase)
+                elif phrase.start >= old_end:
+                    kept.add(moved(phrase, shift))
+                else:
+                    low = min(low, phrase.start)
+                    high = max(high, phrase.end + shift)
+            for phrase in kept.symmetric_difference(phrases):
+                low = min(low, phrase.start)
+                high = max(high, phrase.end)
+
+        old_items = self._items
+        head = item_count(old_items, low)
+        tail = len(old_items) - item_count(old_items, high - shift)
+        items = (
+            old_items[:head]
+            + self._service.translate_words(
+                new_tokens[low:high],
+                self._entity_words,
+                [moved(phrase, -low) for phrase in phrases if low <= phrase.start and phrase.end <= high],
+                self._match,
+            )
+            + old_items[len(old_items) - tail:]
+        )
+
+        # Reused items are unchanged; rebuilt ones may equal the items they replace
+        start = head
+        max_start = min(len(old_items), len(items)) - tail
+        while start < max_start and old_items[start] == items[start]:
+            start += 1
+
+        unchanged_end = tail
+        max_end = max_start + tail - start
+        while (
+            unchanged_end < max_end
+            and old_items[len(old_items) - 1 - unchanged_end] == items[len(items) - 1 - unchanged_end]
+        ):
+            unchanged_end += 1
+
+        self._spans = spans
+        self._phrases = phrases
+        self._items = items
+        self._tokens = new_tokens
+        self._version += 1
+
+        return TranslationDiff(
+            version=self._version,
+            start=start,
+            delete_count=len(old_items) - unchanged_end - start,
+            items=items[start:len(items) - unchanged_end],
+            result=self._service.build_result(text, list(items)),
+            ner_reused=ner_reused,
+        )
+
+    def _affects_entities(self, removed: list[str], inserted: list[str]) -> bool:
+        """Check whether replacing the removed tokens can change entities."""
+        if self._version == 0:
+            return True
+
+        for word in inserted:
+            if not word.islower():
+                return True
+
+        for word in removed:
+            if not word.islower() or word.lower() in self._entity_words:
+                return True
+
+        return False
+
+    def _match(self, word: str) -> MatchResult:
+        """Match a word, reusing results from earlier updates."""
+        key = word.lower()
+        match_result = self._matches.get(key)
+
+        if match_result is not None:
+            CACHE_REQUESTS.inc(cache="session_matches", result="hit")
+            self._matches.move_to_end(key)
+            return match_result
+
+        CACHE_REQUESTS.inc(cache="session_matches", result="miss")
+        match_result = self._service.match_word(word)
+        self._matches[key] = match_result
+        if len(self._matches) > self._max_cached_matches:
+            self._matches.popitem(last=False)
+
+        return match_result
@@ -3,10 +3,13 @@ NER Service - Named Entity Recognition using spaCy.
 Detects named entities for fingerspelling fallback.
 """
 
+import time
+
 import spacy
 from spacy.language import Language
 
 from app.core.interfaces.ner_detector import INerDetector, EntityInfo
+from app.core.metrics import MODEL_LOAD_SECONDS
 
 
 class NerService(INerDetector):
@@ -28,6 +31,7 @@ class NerService(INerDetector):
             model_name: spaCy model name
         """
         print(f"Loading spaCy model: {model_name}...")
+        started = time.perf_counter()
         try:
             self._nlp: Language = spacy.load(model_name)
         except OSError:
@@ -35,6 +39,7 @@ class NerService(INerDetector):
             print(f"Downloading spaCy model: {model_name}...")
             spacy.cli.download(model_name)
             self._nlp = spacy.load(model_name)
+        MODEL_LOAD_SECONDS.set(time.perf_counter() - started, model=model_name)
         print("spaCy model ready!")
 
     def detect_entities(self, text: str) -> list[EntityInfo]:
@@ -101,3 +106,23 @@ class NerService(INerDetector):
                     entity_words.add(word)
         
         return entity_words
+
+    def get_entity_words_batch(self, texts: list[str]) -> list[set[str]]:
+        """
+        Get entity words for many texts using spaCy's batched pipeline.
+        
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            Set of lowercase entity words for each text, in input order
+        """
+        return [
+            {
+                word
+                for ent in doc.ents
+                if ent.label_ in self.FINGERSPELL_ENTITY_TYPES
+                for word in ent.text.lower().split()
+            }
+            for doc in self._nlp.pipe(texts)
+        ]
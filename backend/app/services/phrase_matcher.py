@@ -0,0 +1,271 @@
+"""
+Phrase Matcher - Matches multi-word spans of a text to phrase signs.
+Bounded n-gram candidates are looked up exactly and by inflection; the rest
+are embedded in one batched call and scored against the phrase-only
+rows of the vocabulary. Overlaps are resolved by a dynamic program
+over token spans.
+"""
+
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from app.core.interfaces.embedding_matcher import INDEX_ENTRY_BYTES
+from app.core.interfaces.phrase_matcher import IPhraseMatcher, PhraseMatch
+from app.core.interfaces.text_encoder import ITextEncoder
+from app.core.interfaces.text_processor import ITextProcessor
+from app.core.metrics import MATCHES, stage_timer
+from app.services.tiered_matcher import inflected_forms
+
+# Function words that alone do not make a span worth embedding
+_STOPWORDS = frozenset({
+    "a", "an", "the", "of", "in", "on", "at", "to", "up", "off", "for", "from",
+    "and", "or", "but", "is", "are", "was", "were", "be", "i", "you", "he",
+    "she", "it", "we", "they", "my", "your", "his", "her", "its", "our",
+    "their", "this", "that", "with", "as", "by", "not", "t", "s",
+})
+
+
+class PhraseMatcher(IPhraseMatcher):
+    """
+    Phrase matcher over the multi-word entries of a sign vocabulary.
+
+    Every span of `min_length`..`max_length` tokens is a candidate.
+    A candidate whose tokens (or their base forms) equal a phrase
+    matches with similarity 1.0. Like the stem tier, only regular
+    inflections of phrase words are undone ("falls" -> "fall"), so
+    derivations ("wakeful" / "wake") never match at 1.0. Without an
+    exact match, candidates sharing a content word with some phrase
+    are embedded (at most
+    `max_candidates` per text, all texts in a single encoder call)
+    and match their most similar phrase at `similarity_threshold` or
+    above. Of overlapping matches, the set covering the most tokens,
+    weighted by similarity, is kept.
+    """
+
+    def __init__(
+        self,
+        vocabulary: list[str],
+        encoder: ITextEncoder | None = None,
+        similarity_threshold: float = 0.8,
+        min_length: int = 2,
+        max_length: int = 4,
+        max_candidates: int = 128,
+        processor: ITextProcessor | None = None,
+    ):
+        """
+        Initialize the phrase matcher.
+
+        Args:
+            vocabulary: Sign vocabulary; only entries with spaces are phrases
+            encoder: Text encoder for paraphrases (None = exact and stem only)
+            similarity_threshold: Minimum similarity of an embedded match
+            min_length: Fewest tokens in a candidate span
+            max_length: Most tokens in a candidate span
+            max_candidates: Most candidates embedded per text
+            processor: Stemmer to use instead of undoing inflections
+                (e.g. PorterStemmerProcessor, which needs NLTK)
+        """
+        phrases = sorted({word.lower() for word in vocabulary if " " in word.strip()})
+        # Same tokenization as TranslationService
+        self._word_pattern = re.compile(r"[a-zA-Z]+")
+        self._base_forms: dict[str, str] = {}
+        if processor is not None:
+            self._stem = lru_cache(maxsize=50_000)(processor.process_word)
+        else:
+            phrase_words = {token for phrase in phrases for token in self._word_pattern.findall(phrase)}
+            # Longest base first, as in StemTier: "hoped" goes to "hope" rather than "hop"
+            for base in sorted(phrase_words, key=lambda w: (-len(w), w)):
+                for form in inflected_forms(base):
+                    self._base_forms.setdefault(form, base)
+            self._base_forms.update((word, word) for word in phrase_words)
+            self._stem = self._base_form
+        self._encoder = encoder
+        self._threshold = similarity_threshold
+        self._min_length = min_length
+        self._max_length = max_length
+        self._max_candidates = max_candidates
+
+        self._phrases: list[str] = []
+        self._exact: dict[tuple[str, ...], int] = {}
+        self._stemmed: dict[tuple[str, ...], int] = {}
+        self._content_stems: set[str] = set()
+
+        for phrase in phrases:
+            tokens = tuple(self._word_pattern.findall(phrase))
+            if not min_length <= len(tokens) <= max_length:
+                continue
+            idx = len(self._phrases)
+            self._phrases.append(phrase)
+            self._exact.setdefault(tokens, idx)
+            stems = tuple(self._stem(token) for token in tokens)
+            self._stemmed.setdefault(stems, idx)
+            self._content_stems.update(
+                stem for token, stem in zip(tokens, stems) if token not in _STOPWORDS
+            )
+
+        # Phrase-only sub-matrix of the vocabulary embeddings
+        self._embeddings: np.ndarray | None = None
+        if encoder is not None and self._phrases:
+            self._embeddings = encoder.encode(self._phrases)
+
+    def _base_form(self, word: str) -> str:
+        """The phrase word a token is a regular inflection of, else the token."""
+        return self._base_forms.get(word, word)
+
+    @property
+    def phrase_count(self) -> int:
+        """Number of phrases in the index."""
+        return len(self._phrases)
+
+    def find_phrases_batch(self, token_lists: list[list[str]]) -> list[list[PhraseMatch]]:
+        """Find the phrase signs of several texts with one encoder call."""
+        spans: list[list[PhraseMatch]] = [[] for _ in token_lists]
+        candidates: list[tuple[int, int, int]] = []  # (text, start, end)
+
+        with stage_timer("phrases"):
+            for text_idx, tokens in enumerate(token_lists):
+                candidates.extend(self._collect_spans(text_idx, tokens, spans[text_idx]))
+
+            if candidates:
+                self._score_candidates(token_lists, candidates, spans)
+
+            return [
+                self.resolve(len(tokens), text_spans)
+                for tokens, text_spans in zip(token_lists, spans)
+            ]
+
+    def find_spans(self, tokens: list[str], start: int, end: int) -> list[PhraseMatch]:
+        """Match the candidate spans overlapping tokens[start:end] with one encoder call."""
+        spans: list[list[PhraseMatch]] = [[]]
+
+        with stage_timer("phrases"):
+            candidates = self._collect_spans(0, tokens, spans[0], start, end)
+            if candidates:
+                self._score_candidates([tokens], candidates, spans)
+
+        return spans[0]
+
+    def _collect_spans(
+        self,
+        text_idx: int,
+        tokens: list[str],
+        matches: list[PhraseMatch],
+        window_start: int = 0,
+        window_end: int | None = None,
+    ) -> list[tuple[int, int, int]]:
+        """
+        Add the exact and stem matches of a text; return its candidates to embed.
+
+        Only spans overlapping tokens[window_start:window_end] (all by
+        default) are candidates.
+        """
+        if window_end is None:
+            window_end = len(tokens)
+        # Tokens farther than a span from the window cannot be part of a candidate
+        offset = max(0, window_start - self._max_length)
+        lowered = [token.lower() for token in tokens[offset:window_end + self._max_length]]
+        stems = [self._stem(token) for token in lowered]
+        window_start -= offset
+        window_end -= offset
+        candidates: list[tuple[int, int, int]] = []
+
+        for length in range(self._min_length, self._max_length + 1):
+            first = max(0, window_start - length + 1)
+            for start in range(first, min(window_end, len(lowered) - length + 1)):
+                end = start + length
+                idx = self._exact.get(tuple(lowered[start:end]))
+                tier = "exact"
+                if idx is None:
+                    idx = self._stemmed.get(tuple(stems[start:end]))
+                    tier = "stem"
+                if idx is not None:
+                    matches.append(PhraseMatch(offset + start, offset + end, self._phrases[idx], 1.0, tier))
+                    MATCHES.inc(path=f"phrase_{tier}", result="match")
+                    continue
+
+                if (
+                    self._embeddings is not None
+                    and len(candidates) < self._max_candidates
+                    and any(
+                        stems[pos] in self._content_stems and lowered[pos] not in _STOPWORDS
+                        for pos in range(start, end)
+                    )
+                ):
+                    candidates.append((text_idx, offset + start, offset + end))
+
+        return candidates
+
+    def _score_candidates(
+        self,
+        token_lists: list[list[str]],
+        candidates: list[tuple[int, int, int]],
+        spans: list[list[PhraseMatch]],
+    ) -> None:
+        """Embed all candidates at once and add those close to a phrase."""
+        texts = [
+            " ".join(token_lists[text_idx][start:end]).lower()
+            for text_idx, start, end in candidates
+        ]
+        rows = {text: row for row, text in enumerate(dict.fromkeys(texts))}
+        embeddings = self._encoder.encode(list(rows))
+
+        # (unique candidates x phrases) similarity matrix in one product
+        similarities = np.dot(embeddings, self._embeddings.T)
+        best_indices = np.argmax(similarities, axis=1)
+
+        for text, (text_idx, start, end) in zip(texts, candidates):
+            row = rows[text]
+            best_idx = best_indices[row]
+            similarity = float(similarities[row, best_idx])
+            is_match = similarity >= self._threshold
+            MATCHES.inc(path="phrase_embedding", result="match" if is_match else "no_match")
+            if is_match:
+                spans[text_idx].append(
+                    PhraseMatch(start, end, self._phrases[best_idx], similarity, "embedding")
+                )
+
+    @staticmethod
+    def resolve(length: int, matches: list[PhraseMatch]) -> list[PhraseMatch]:
+        """
+        Pick non-overlapping matches maximizing covered tokens x similarity.
+
+        best[i] is the best score of the first i tokens; each position
+        has at most (max_length - min_length + 1) matches ending there,
+        so this is linear in the number of tokens.
+        """
+        if not matches:
+            return []
+
+        ending_at: dict[int, list[PhraseMatch]] = {}
+        for match in matches:
+            ending_at.setdefault(match.end, []).append(match)
+
+        best = [0.0] * (length + 1)
+        choice: list[PhraseMatch | None] = [None] * (length + 1)
+        for end in range(1, length + 1):
+            best[end] = best[end - 1]
+            for match in ending_at.get(end, ()):
+                score = best[match.start] + match.similarity * (match.end - match.start)
+                if score > best[end]:
+                    best[end] = score
+                    choice[end] = match
+
+        resolved: list[PhraseMatch] = []
+        end = length
+        while end > 0:
+            match = choice[end]
+            if match is None:
+                end -= 1
+            else:
+                resolved.append(match)
+                end = match.start
+        resolved.reverse()
+        return resolved
+
+    def estimate_memory_bytes(self) -> int:
+        """Approximate memory held by the phrase indexes and embeddings."""
+        embeddings = int(self._embeddings.nbytes) if self._embeddings is not None else 0
+        entries = len(self._exact) + len(self._stemmed) + len(self._base_forms)
+        return embeddings + entries * INDEX_ENTRY_BYTES
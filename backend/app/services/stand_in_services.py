@@ -0,0 +1,197 @@
+"""
+Stand-in Services - Deterministic, model-free implementations of the
+matcher and NER interfaces.
+Used to benchmark and load-test the pipeline without downloading or
+loading sentence-transformers and spaCy models.
+"""
+
+import re
+import zlib
+
+import numpy as np
+
+from app.core.interfaces.embedding_matcher import INDEX_ENTRY_BYTES, IEmbeddingMatcher, MatchResult
+from app.core.interfaces.ner_detector import INerDetector, EntityInfo
+from app.core.interfaces.text_encoder import ITextEncoder
+
+
+class HashingEmbeddingMatcher(IEmbeddingMatcher, ITextEncoder):
+    """
+    Embedding matcher using hashed character n-grams instead of a model.
+
+    Words are embedded by hashing their character trigrams into a fixed
+    size vector, so the similarity scan over the vocabulary matrix has
+    the same shape and cost as with the real model, while encoding is
+    cheap and fully deterministic.
+    """
+
+    def __init__(
+        self,
+        vocabulary: list[str],
+        similarity_threshold: float = 0.7,
+        dimensions: int = 384,
+    ):
+        """
+        Initialize the matcher.
+
+        Args:
+            vocabulary: List of available sign words
+            similarity_threshold: Minimum similarity for a match
+            dimensions: Size of the hashed embedding vectors
+        """
+        self._vocabulary = [word.lower() for word in vocabulary]
+        self._threshold = similarity_threshold
+        self._dimensions = dimensions
+        self._word_to_idx = {word: idx for idx, word in enumerate(self._vocabulary)}
+        self._vocab_embeddings = self._encode(self._vocabulary)
+
+    def _encode(self, words: list[str]) -> np.ndarray:
+        """Embed words as L2-normalized hashed trigram count vectors."""
+        embeddings = np.zeros((len(words), self._dimensions), dtype=np.float32)
+
+        for row, word in enumerate(words):
+            padded = f"#{word}#"
+            for i in range(max(len(padded) - 2, 1)):
+                trigram = padded[i:i + 3].encode("utf-8")
+                embeddings[row, zlib.crc32(trigram) % self._dimensions] += 1.0
+
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return embeddings / norms
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        """Embed texts (e.g. phrase candidates) as hashed trigram vectors."""
+        return self._encode([text.lower() for text in texts])
+
+    def find_best_match(self, word: str) -> MatchResult:
+        """Find the best matching sign word by hashed-trigram similarity."""
+        return self.find_best_matches([word])[0]
+
+    def find_best_matches(self, words: list[str]) -> list[MatchResult]:
+        """Match a batch of words with one similarity product."""
+        results: list[MatchResult | None] = [None] * len(words)
+        pending: list[int] = []
+
+        for idx, word in enumerate(words):
+            word_lower = word.lower()
+            if word_lower in self._word_to_idx:
+                results[idx] = MatchResult(
+                    query_word=word,
+                    matched_word=word_lower,
+                    similarity=1.0,
+                    is_match=True,
+                    tier="exact",
+                )
+            else:
+                pending.append(idx)
+
+        if pending and self._vocabulary:
+            query_embeddings = self._encode([words[idx].lower() for idx in pending])
+            similarities = np.dot(query_embeddings, self._vocab_embeddings.T)
+            best_indices = np.argmax(similarities, axis=1)
+
+            for row, idx in enumerate(pending):
+                best_idx = best_indices[row]
+                best_similarity = float(similarities[row, best_idx])
+                is_match = best_similarity >= self._threshold
+                results[idx] = MatchResult(
+                    query_word=words[idx],
+                    matched_word=self._vocabulary[best_idx] if is_match else None,
+                    similarity=best_similarity,
+                    is_match=is_match,
+                    tier="embedding",
+                )
+
+        for idx in pending:
+            if results[idx] is None:
+                results[idx] = MatchResult(
+                    query_word=words[idx],
+                    matched_word=None,
+                    similarity=0.0,
+                    is_match=False,
+                )
+
+        return results
+
+    def get_vocabulary_size(self) -> int:
+        """Get the number of words in the sign vocabulary."""
+        return len(self._vocabulary)
+
+    def estimate_memory_bytes(self) -> int:
+        """Approximate memory held by the vocabulary embeddings and index."""
+        return int(self._vocab_embeddings.nbytes) + len(self._vocabulary) * INDEX_ENTRY_BYTES
+
+    @property
+    def threshold(self) -> float:
+        """Get the similarity threshold."""
+        return self._threshold
+
+
+class RuleBasedNerDetector(INerDetector):
+    """
+    Named entity detector based on capitalization rules.
+
+    Runs of capitalized words are reported as PERSON entities. A
+    capitalized word at the start of a sentence only counts when it is
+    followed by another capitalized word ("New York is big").
+    """
+
+    # Capitalized words that are never entities on their own
+    NON_ENTITY_WORDS = {
+        "i", "a", "an", "the", "my", "we", "he", "she", "it", "they", "you",
+        "this", "that", "what", "when", "where", "why", "how", "who",
+        "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+    }
+
+    def __init__(self):
+        """Initialize the detector."""
+        self._word_pattern = re.compile(r"[A-Za-z]+")
+        self._sentence_end = re.compile(r"[.!?]")
+
+    def detect_entities(self, text: str) -> list[EntityInfo]:
+        """Detect runs of capitalized words as entities."""
+        entities: list[EntityInfo] = []
+        run: list[re.Match] = []
+        run_at_sentence_start = False
+
+        def close_run() -> None:
+            if run and (len(run) > 1 or not run_at_sentence_start):
+                entities.append(
+                    EntityInfo(
+                        text=text[run[0].start():run[-1].end()],
+                        label="PERSON",
+                        start=run[0].start(),
+                        end=run[-1].end(),
+                    )
+                )
+
+        previous_end = 0
+        for match in self._word_pattern.finditer(text):
+            word = match.group()
+            gap = text[previous_end:match.start()]
+            at_sentence_start = previous_end == 0 or self._sentence_end.search(gap) is not None
+            is_candidate = word[0].isupper() and word.lower() not in self.NON_ENTITY_WORDS
+
+            if is_candidate and run and not gap.strip():
+                run.append(match)
+            else:
+                close_run()
+                run = [match] if is_candidate else []
+                run_at_sentence_start = at_sentence_start
+
+            previous_end = match.end()
+
+        close_run()
+        return entities
+
+    def is_named_entity(self, word: str, context: str) -> bool:
+        """Check if a word is part of a detected entity."""
+        return word.lower() in self.get_entity_words(context)
+
+    def get_entity_words(self, text: str) -> set[str]:
+        """Get all lowercase words that are part of detected entities."""
+        return {
+            word
+            for entity in self.detect_entities(text)
+            for word in entity.text.lower().split()
+        }
@@ -6,8 +6,6 @@ Follows Strategy Pattern - can be swapped with other processors.
 
 import re
 
-from nltk.stem import PorterStemmer
-
 from app.core.interfaces.text_processor import ITextProcessor
 
 
@@ -21,6 +19,8 @@ class PorterStemmerProcessor(ITextProcessor):
 
     def __init__(self):
         """Initialize the Porter Stemmer."""
+        from nltk.stem import PorterStemmer  # nltk imports scipy; load on first use
+        
         self._stemmer = PorterStemmer()
         # Pattern to extract words (alphanumeric)
         self._word_pattern = re.compile(r"[a-zA-Z]+")
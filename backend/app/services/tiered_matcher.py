@@ -0,0 +1,621 @@
+"""
+Tiered Matcher - Cheap deterministic lookups in front of the embedding model.
+Resolves words by exact, synonym, stem and lemma indexes over the sign
+vocabulary, then the typo tier, and only sends the residue to the
+fallback matcher.
+"""
+
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from pathlib import Path
+
+from app.core.interfaces.embedding_matcher import INDEX_ENTRY_BYTES, IEmbeddingMatcher, MatchResult
+from app.core.metrics import MATCHES
+
+
+class MatchTier(ABC):
+    """A single deterministic lookup stage of the tiered matcher."""
+
+    name: str = "tier"
+
+    @abstractmethod
+    def lookup(self, word: str) -> str | None:
+        """
+        Resolve a lowercase word to a sign word.
+
+        Args:
+            word: Lowercase input word
+
+        Returns:
+            Matching vocabulary word, or None if this tier has no answer
+        """
+        pass
+
+    def estimate_memory_bytes(self) -> int:
+        """Approximate memory held by the tier's index."""
+        return 0
+
+
+class ExactTier(MatchTier):
+    """Exact vocabulary lookup."""
+
+    name = "exact"
+
+    def __init__(self, vocabulary: list[str]):
+        self._vocabulary = set(vocabulary)
+
+    def lookup(self, word: str) -> str | None:
+        """Return the word itself if it is a sign word."""
+        return word if word in self._vocabulary else None
+
+    def estimate_memory_bytes(self) -> int:
+        """Approximate memory held by the vocabulary set."""
+        return len(self._vocabulary) * INDEX_ENTRY_BYTES
+
+
+_VOWELS = set("aeiou")
+
+
+def inflected_forms(base: str) -> set[str]:
+    """
+    Regular inflections of a word: plural/3rd person (-s, -es), past
+    (-ed, -d, -ied) and progressive (-ing) with the usual spelling
+    changes ("run" -> "running", "make" -> "making", "cry" -> "cries").
+
+    Short bases are only inflected where the result is unambiguous, so
+    that e.g. "a" -> "as", "be" -> "bed" or "she" -> "shed" never appear.
+    """
+    if not base.isalpha():
+        return set()
+    if len(base) < 3:
+        # "go" -> "goes", "going"; "do" -> "does", "doing"
+        return {base + "es", base + "ing"} if base.endswith("o") else set()
+
+    if base.endswith("ie"):
+        forms = {base + "s", base[:-2] + "ying"}
+    elif base.endswith("e"):
+        forms = {base + "s", base + "ing" if base.endswith("ee") else base[:-1] + "ing"}
+    elif base.endswith("y") and base[-2] not in _VOWELS:
+        forms = {base[:-1] + "ies", base[:-1] + "ied", base + "ing"}
+    elif base.endswith(("s", "x", "z", "ch", "sh")):
+        forms = {base + "es", base + "ed", base + "ing"}
+    elif base.endswith("o"):
+        forms = {base + "s", base + "es", base + "ed", base + "ing"}
+    elif base[-1] not in _VOWELS | set("wxy") and base[-2] in _VOWELS and sum(c in _VOWELS for c in base) == 1:
+        # One-syllable words ending consonant-vowel-consonant double: "stop" -> "stopped"
+        forms = {base + "s", base + base[-1] + "ed", base + base[-1] + "ing"}
+    else:
+        forms = {base + "s", base + "ed", base + "ing"}
+
+    # "-e" + "d" only for longer bases ("hope" -> "hoped", but not "see" -> "seed")
+    if base.endswith("e") and len(base) >= 4:
+        forms.add(base + "d")
+    return forms
+
+
+class StemTier(MatchTier):
+    """
+    Lookup by inflection ("running" -> "run", "cats" -> "cat").
+
+    Only regular inflectional suffixes are undone, never derivational
+    ones, so words that merely share a Porter stem with a sign
+    ("animation" / "animal", "universe" / "university") are left to the
+    embedding model. The inflected form -> sign index is precomputed
+    over the single-word vocabulary entries. When several signs inflect
+    to the same form, the longest (then alphabetically first) sign wins,
+    so "hoped" goes to "hope" rather than "hop".
+    """
+
+    name = "stem"
+
+    def __init__(self, vocabulary: list[str]):
+        self._index: dict[str, str] = {}
+
+        for sign_word in sorted(vocabulary, key=lambda w: (-len(w), w)):
+            if " " in sign_word:
+                continue
+            for form in inflected_forms(sign_word):
+                self._index.setdefault(form, sign_word)
+
+    def lookup(self, word: str) -> str | None:
+        """Return the sign word the word is an inflection of."""
+        return self._index.get(word)
+
+    @property
+    def index_size(self) -> int:
+        """Number of inflected forms in the index."""
+        return len(self._index)
+
+    def estimate_memory_bytes(self) -> int:
+        """Approximate memory held by the inflection index."""
+        return len(self._index) * INDEX_ENTRY_BYTES
+
+
+class LemmaTier(MatchTier):
+    """
+    Lookup by WordNet lemma ("ran" -> "run", "children" -> "child").
+
+    Requires the NLTK 'wordnet' corpus.
+    """
+
+    name = "lemma"
+
+    # Parts of speech tried in order: verb, noun, adjective
+    _POS_ORDER = ("v", "n", "a")
+
+    def __init__(self, vocabulary: list[str]):
+        from nltk.stem import WordNetLemmatizer
+
+        self._vocabulary = set(vocabulary)
+        self._lemmatizer = WordNetLemmatizer()
+        # Load the corpus now rather than on the first request
+        self._lemmatizer.lemmatize("warmup")
+
+    def lookup(self, word: str) -> str | None:
+        """Return the first lemma of the word that is a sign word."""
+        for pos in self._POS_ORDER:
+            lemma = self._lemmatizer.lemmatize(word, pos)
+            if lemma in self._vocabulary:
+                return lemma
+        return None
+
+
+class SynonymTier(MatchTier):
+    """Lookup in a curated word -> sign word mapping."""
+
+    name = "synonym"
+
+    def __init__(self, vocabulary: list[str], synonyms: dict[str, str]):
+        vocabulary_set = set(vocabulary)
+        self._index = {
+            word.lower(): sign_word.lower()
+            for word, sign_word in synonyms.items()
+            if sign_word.lower() in vocabulary_set
+        }
+
+    @classmethod
+    def from_file(cls, vocabulary: list[str], path: Path) -> "SynonymTier":
+        """Load the mapping from a JSON object of word -> sign word."""
+        return cls(vocabulary, json.loads(path.read_text(encoding="utf-8")))
+
+    def lookup(self, word: str) -> str | None:
+        """Return the mapped sign word."""
+        return self._index.get(word)
+
+    def estimate_memory_bytes(self) -> int:
+        """Approximate memory held by the synonym mapping."""
+        return len(self._index) * INDEX_ENTRY_BYTES
+
+
+def _osa_distance(source: str, target: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent transpositions).
+
+    Returns max_distance + 1 as soon as the distance is known to exceed it.
+    """
+    if abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+
+    # Common prefixes and suffixes never add edits; trim them before the DP
+    start = 0
+    while start < len(source) and start < len(target) and source[start] == target[start]:
+        start += 1
+    source, target = source[start:], target[start:]
+    while source and target and source[-1] == target[-1]:
+        source, target = source[:-1], target[:-1]
+    if not source or not target:
+        distance = len(source) + len(target)
+        return distance if distance <= max_distance else max_distance + 1
+
+    previous_previous: list[int] = []
+    previous = list(range(len(target) + 1))
+
+    for i in range(1, len(source) + 1):
+        current = [i] + [0] * len(target)
+        for j in range(1, len(target) + 1):
+            cost = 0 if source[i - 1] == target[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (
+                i > 1 and j > 1
+                and source[i - 1] == target[j - 2]
+                and source[i - 2] == target[j - 1]
+            ):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+
+    return previous[-1] if previous[-1] <= max_distance else max_distance + 1
+
+
+def load_lexicon(path: Path) -> dict[str, int]:
+    """
+    Load a word frequency lexicon.
+
+    One entry per line: a word followed by its count, separated by
+    whitespace (the SymSpell frequency dictionary format). Lines without
+    a count get a count of 1.
+    """
+    lexicon: dict[str, int] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        parts = line.split()
+        if not parts:
+            continue
+        count = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 1
+        lexicon[parts[0].lower()] = count
+    return lexicon
+
+
+class TypoTier(MatchTier):
+    """
+    Typo-tolerant lookup with a symmetric-delete index ("helo" -> "hello").
+
+    Every deletion of up to `max_distance` characters from the first
+    `prefix_length` characters of each sign word is precomputed. A query
+    generates its own deletions, collects the signs sharing one, and
+    verifies them with the real edit distance, so no per-word scan of the
+    vocabulary is needed.
+
+    Short words are more easily confused, so the allowed distance grows
+    with the word: one edit per four characters, at least one and at most
+    `max_distance`. With a frequency lexicon, words it lists are known to
+    be spelled correctly and are never corrected, and frequencies break
+    ties between equally distant candidates. Remaining ties go to
+    candidates longer than the query, since dropped letters are the
+    commonest typo.
+
+    Corrections are scored by edit distance, not 1.0: one edit in a
+    five-letter word gives 0.8.
+    """
+
+    name = "typo"
+
+    def __init__(
+        self,
+        vocabulary: list[str],
+        max_distance: int = 2,
+        prefix_length: int = 7,
+        min_word_length: int = 4,
+        max_index_entries: int = 500_000,
+        lexicon: dict[str, int] | None = None,
+    ):
+        """
+        Build the deletion index.
+
+        Args:
+            vocabulary: Sign words with videos
+            max_distance: Maximum edit distance of a corrected typo
+            prefix_length: Characters of each word the deletions are taken from
+            min_word_length: Shorter words are never corrected
+            max_index_entries: Memory bound; the distance is lowered until
+                the index fits
+            lexicon: Optional word -> frequency mapping of correct words
+        """
+        self._prefix_length = prefix_length
+        self._min_word_length = min_word_length
+        self._lexicon = lexicon or {}
+        self._words = sorted(word for word in vocabulary if " " not in word and word.isalpha())
+
+        self._max_distance = max_distance
+        self._index = self._build_index(max_distance)
+        while len(self._index) > max_index_entries and self._max_distance > 1:
+            self._max_distance -= 1
+            print(
+                f"Typo index exceeds {max_index_entries} entries, "
+                f"lowering max distance to {self._max_distance}"
+            )
+            self._index = self._build_index(self._max_distance)
+
+    def _deletes(self, word: str, max_distance: int) -> set[str]:
+        """All strings reachable by deleting up to max_distance characters."""
+        deletes = {word}
+        frontier = {word}
+        for _ in range(max_distance):
+            frontier = {
+                candidate[:idx] + candidate[idx + 1:]
+                for candidate in frontier
+                if len(candidate) > 1
+                for idx in range(len(candidate))
+            } - deletes
+            deletes |= frontier
+        return deletes
+
+    def _build_index(self, max_distance: int) -> dict[str, tuple[str, ...]]:
+        """Map every deletion of every sign word prefix to the sign words."""
+        index: dict[str, list[str]] = {}
+        for word in self._words:
+            for delete in self._deletes(word[:self._prefix_length], max_distance):
+                index.setdefault(delete, []).append(word)
+        return {delete: tuple(words) for delete, words in index.items()}
+
+    def lookup(self, word: str) -> str | None:
+        """Return the closest sign word within the allowed edit distance."""
+        correction = self.correct(word)
+        return correction[0] if correction is not None else None
+
+    def correct(self, word: str) -> tuple[str, float] | None:
+        """
+        Find the closest sign word within the allowed edit distance.
+
+        Args:
+            word: Lowercase input word
+
+        Returns:
+            (sign word, similarity) with similarity = 1 - distance / length
+            of the longer word, or None if no sign word is close enough
+        """
+        if len(word) < self._min_word_length or not word.isalpha() or word in self._lexicon:
+            return None
+
+        max_distance = min(self._max_distance, max(1, len(word) // 4))
+        candidates: set[str] = set()
+        for delete in self._deletes(word[:self._prefix_length], max_distance):
+            candidates.update(self._index.get(delete, ()))
+
+        best: tuple[int, int, bool, int, str] | None = None
+        for candidate in candidates:
+            # Candidates farther than the best so far cannot win
+            bound = best[0] if best is not None else max_distance
+            distance = _osa_distance(word, candidate, bound)
+            if distance > bound:
+                continue
+            # Dropped letters are the commonest typo: prefer longer candidates on ties
+            key = (
+                distance,
+                -self._lexicon.get(candidate, 0),
+                len(candidate) <= len(word),
+                len(candidate),
+                candidate,
+            )
+            if best is None or key < best:
+                best = key
+
+        if best is None:
+            return None
+        distance, candidate = best[0], best[-1]
+        return candidate, round(1.0 - distance / max(len(word), len(candidate)), 4)
+
+    @property
+    def has_lexicon(self) -> bool:
+        """Whether correctly spelled words are known and left alone."""
+        return bool(self._lexicon)
+
+    @property
+    def index_size(self) -> int:
+        """Number of deletion keys in the index."""
+        return len(self._index)
+
+    def estimate_memory_bytes(self) -> int:
+        """Approximate memory held by the deletion index and lexicon."""
+        return (len(self._index) + len(self._lexicon)) * INDEX_ENTRY_BYTES
+
+    @property
+    def max_distance(self) -> int:
+        """Effective maximum edit distance after applying the memory bound."""
+        return self._max_distance
+
+
+class TieredMatcher(IEmbeddingMatcher):
+    """
+    Composite matcher: deterministic tiers and typo correction first,
+    embedding model last.
+
+    Tiers are tried in order and the first answer wins with similarity
+    1.0. With a lexicon, words it does not list are tried as typos next,
+    so a misspelling is corrected without an encode. Words nothing
+    resolves go to the fallback matcher (typically EmbeddingService); in
+    batches, the residue is sent as one batch. A typo tier without a
+    lexicon cannot tell a real word close to a sign ("went" / "wet")
+    from a misspelling, so it only sees the words the fallback misses.
+    Hit counts per tier are kept for monitoring.
+    """
+
+    def __init__(
+        self,
+        tiers: list[MatchTier],
+        fallback: IEmbeddingMatcher | None,
+        vocabulary_size: int,
+        typo: TypoTier | None = None,
+    ):
+        """
+        Initialize the matcher.
+
+        Args:
+            tiers: Lookup tiers, in the order they are tried
+            fallback: Matcher for words no tier resolves (None = no match)
+            vocabulary_size: Number of words in the sign vocabulary
+            typo: Typo tier, tried before the fallback if it has a lexicon
+                and after it otherwise
+        """
+        self._tiers = tiers
+        self._fallback = fallback
+        self._typo = typo
+        self._typo_first = typo is not None and (fallback is None or typo.has_lexicon)
+        self._vocabulary_size = vocabulary_size
+        self._hits: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_vocabulary(
+        cls,
+        vocabulary: list[str],
+        fallback: IEmbeddingMatcher | None,
+        stem: bool = True,
+        lemma: bool = False,
+        synonyms_path: Path | None = None,
+        typo: bool = False,
+        typo_max_distance: int = 2,
+        typo_prefix_length: int = 7,
+        typo_min_word_length: int = 4,
+        typo_max_index_entries: int = 500_000,
+        lexicon_path: Path | None = None,
+    ) -> "TieredMatcher":
+        """
+        Build the standard tier stack over a vocabulary.
+
+        Args:
+            vocabulary: Sign words with videos
+            fallback: Matcher for the residue
+            stem: Add the inflection (stem) tier
+            lemma: Add the WordNet lemma tier
+            synonyms_path: Optional JSON word -> sign word mapping
+            typo: Add the symmetric-delete typo tier
+            typo_max_distance: Maximum edit distance of a corrected typo
+            typo_prefix_length: Word prefix length the typo index is built from
+            typo_min_word_length: Shortest word the typo tier corrects
+            typo_max_index_entries: Memory bound of the typo index
+            lexicon_path: Word frequency lexicon; with one, correctly
+                spelled words (and names it lists) are never "corrected"
+                to a sign and typos are corrected before the fallback.
+                Without one, the typo tier only sees fallback misses
+
+        Returns:
+            TieredMatcher with exact, synonym, stem, lemma and typo tiers as enabled
+        """
+        vocabulary = [word.lower() for word in vocabulary]
+        tiers: list[MatchTier] = [ExactTier(vocabulary)]
+
+        if synonyms_path is not None:
+            tiers.append(SynonymTier.from_file(vocabulary, synonyms_path))
+        if stem:
+            tiers.append(StemTier(vocabulary))
+        if lemma:
+            tiers.append(LemmaTier(vocabulary))
+        typo_tier = None
+        if typo:
+            typo_tier = TypoTier(
+                vocabulary,
+                max_distance=typo_max_distance,
+                prefix_length=typo_prefix_length,
+                min_word_length=typo_min_word_length,
+                max_index_entries=typo_max_index_entries,
+                lexicon=load_lexicon(lexicon_path) if lexicon_path is not None else None,
+            )
+
+        return cls(tiers=tiers, fallback=fallback, vocabulary_size=len(vocabulary), typo=typo_tier)
+
+    def _lookup_tiers(self, word: str) -> MatchResult | None:
+        """Try the deterministic tiers for a word."""
+        word_lower = word.lower()
+
+        for tier in self._tiers:
+            sign_word = tier.lookup(word_lower)
+            if sign_word is not None:
+                self._record(tier.name)
+                MATCHES.inc(path=tier.name, result="match")
+                return MatchResult(
+                    query_word=word,
+                    matched_word=sign_word,
+                    similarity=1.0,
+                    is_match=True,
+                    tier=tier.name,
+                )
+
+        return None
+
+    def _correct_typo(self, word: str) -> MatchResult | None:
+        """Try a word the tiers missed as a typo."""
+        correction = self._typo.correct(word.lower()) if self._typo is not None else None
+        if correction is None:
+            return None
+
+        sign_word, similarity = correction
+        self._record(TypoTier.name)
+        MATCHES.inc(path=TypoTier.name, result="match")
+        return MatchResult(
+            query_word=word,
+            matched_word=sign_word,
+            similarity=similarity,
+            is_match=True,
+            tier=TypoTier.name,
+        )
+
+    def _no_match(self, word: str) -> MatchResult:
+        """Result for a word nothing resolves."""
+        self._record("none")
+        return MatchResult(query_word=word, matched_word=None, similarity=0.0, is_match=False)
+
+    def _record(self, tier: str, count: int = 1) -> None:
+        """Count words resolved by a tier."""
+        with self._lock:
+            self._hits[tier] += count
+
+    def find_best_match(self, word: str) -> MatchResult:
+        """Resolve a word by the tiers, falling back to the embedding matcher."""
+        result = self._lookup_tiers(word)
+        if result is None and self._typo_first:
+            result = self._correct_typo(word)
+        if result is not None:
+            return result
+
+        if self._fallback is None:
+            return self._no_match(word)
+
+        self._record("fallback")
+        result = self._fallback.find_best_match(word)
+        if result.is_match or self._typo_first:
+            return result
+        return self._correct_typo(word) or result
+
+    def find_best_matches(self, words: list[str]) -> list[MatchResult]:
+        """Resolve a batch; the residue goes to the fallback as one batch."""
+        results: list[MatchResult | None] = [self._lookup_tiers(word) for word in words]
+        if self._typo_first:
+            results = [
+                result if result is not None else self._correct_typo(word)
+                for word, result in zip(words, results)
+            ]
+        residue = [idx for idx, result in enumerate(results) if result is None]
+
+        if residue:
+            if self._fallback is None:
+                for idx in residue:
+                    results[idx] = self._no_match(words[idx])
+            else:
+                self._record("fallback", len(residue))
+                fallback_results = self._fallback.find_best_matches([words[idx] for idx in residue])
+                for idx, result in zip(residue, fallback_results):
+                    if not result.is_match and not self._typo_first:
+                        result = self._correct_typo(words[idx]) or result
+                    results[idx] = result
+
+        return results
+
+    def restricted_to(self, tier_names: set[str]) -> "TieredMatcher":
+        """
+        A matcher sharing this one's indexes but using only some tiers
+        and no fallback, e.g. for a cheap degraded mode.
+
+        Args:
+            tier_names: Names of the tiers to keep
+
+        Returns:
+            TieredMatcher without fallback
+        """
+        return TieredMatcher(
+            tiers=[tier for tier in self._tiers if tier.name in tier_names],
+            fallback=None,
+            vocabulary_size=self._vocabulary_size,
+            typo=self._typo if TypoTier.name in tier_names else None,
+        )
+
+    def get_tier_stats(self) -> dict[str, int]:
+        """Number of words resolved by each tier, the fallback and nothing."""
+        with self._lock:
+            return dict(self._hits)
+
+    def get_vocabulary_size(self) -> int:
+        """Get the number of words in the sign vocabulary."""
+        return self._vocabulary_size
+
+    def estimate_memory_bytes(self) -> int:
+        """Approximate memory held by the tiers and the fallback."""
+        tiers = sum(tier.estimate_memory_bytes() for tier in self._tiers + [self._typo] if tier is not None)
+        return tiers + (self._fallback.estimate_memory_bytes() if self._fallback else 0)
+
+    @property
+    def tier_names(self) -> list[str]:
+        """Names of the configured tiers, in order."""
+        return [tier.name for tier in self._tiers] + ([self._typo.name] if self._typo is not None else [])
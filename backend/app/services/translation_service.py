@@ -4,14 +4,18 @@ Uses embedding similarity for word matching and NER for fingerspelling.
 """
 
 import re
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 
-from app.core.interfaces.embedding_matcher import IEmbeddingMatcher
+from app.core.cache import LruCache
+from app.core.interfaces.embedding_matcher import IEmbeddingMatcher, MatchResult
 from app.core.interfaces.ner_detector import INerDetector
-from app.core.interfaces.video_repository import IVideoRepository
+from app.core.interfaces.phrase_matcher import IPhraseMatcher, PhraseMatch
+from app.core.interfaces.video_repository import IVideoRepository, VideoLookupResult
+from app.core.metrics import stage_timer
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationItem:
     """Represents a single translated item."""
 
@@ -21,9 +25,15 @@ class TranslationItem:
     url: str | None = None
     letters: list[str] | None = None
     similarity: float | None = None
+    # Clip metadata for video items, for client prefetch scheduling
+    duration: float | None = None  # Seconds
+    size_bytes: int | None = None
+    frame_rate: float | None = None
+    width: int | None = None
+    height: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationResult:
     """Complete translation result."""
 
@@ -32,6 +42,187 @@ class TranslationResult:
     video_count: int
     fingerspell_count: int
     skipped_count: int
+    total_duration: float = 0.0  # Seconds of sign video playback
+    degraded: bool = False  # Cheap matching only, no NER
+
+
+def video_item(
+    original_word: str,
+    matched_word: str,
+    similarity: float,
+    video_result: VideoLookupResult,
+) -> TranslationItem:
+    """Build the video item of a word or phrase from its found video."""
+    metadata = video_result.metadata
+    return TranslationItem(
+        original_word=original_word,
+        matched_word=matched_word,
+        type="video",
+        url=video_result.url,
+        similarity=similarity,
+        duration=metadata.duration if metadata else None,
+        size_bytes=metadata.size_bytes if metadata else None,
+        frame_rate=metadata.frame_rate if metadata else None,
+        width=metadata.width if metadata else None,
+        height=metadata.height if metadata else None,
+    )
+
+
+def word_item(
+    word: str,
+    entity_words: set[str],
+    match_result: MatchResult,
+    find_video: Callable[[str], VideoLookupResult],
+) -> TranslationItem:
+    """
+    Turn a word and its match result into a translation item.
+    
+    Args:
+        word: Original word from the input
+        entity_words: Lowercase named-entity words of the surrounding text
+        match_result: Result of matching the word against the vocabulary
+        find_video: Returns the video lookup of a sign word
+        
+    Returns:
+        TranslationItem of type video, fingerspell or skipped
+    """
+    # Step 1: Use the semantic match if there is one (names are never typo-corrected)
+    is_typo_of_entity = match_result.tier == "typo" and word.lower() in entity_words
+    if match_result.is_match and match_result.matched_word and not is_typo_of_entity:
+        # Found a good match - look up the video
+        video_result = find_video(match_result.matched_word)
+        if video_result.found:
+            return video_item(word, match_result.matched_word, match_result.similarity, video_result)
+    
+    # Step 2: No match - check if it's a named entity
+    if word.lower() in entity_words:
+        # Fingerspell named entities
+        return TranslationItem(
+            original_word=word,
+            matched_word=None,
+            type="fingerspell",
+            letters=[char.lower() for char in word if char.isalpha()],
+            similarity=match_result.similarity,
+        )
+    
+    # Step 3: Skip non-matching, non-entity words
+    return TranslationItem(
+        original_word=word,
+        matched_word=None,
+        type="skipped",
+        similarity=match_result.similarity,
+    )
+
+
+def phrase_item(
+    words: list[str],
+    phrase: PhraseMatch,
+    find_video: Callable[[str], VideoLookupResult],
+) -> TranslationItem | None:
+    """
+    Turn a phrase match into a video item.
+    
+    Args:
+        words: Original words of the span
+        phrase: Phrase match of the span
+        find_video: Returns the video lookup of a sign word
+        
+    Returns:
+        TranslationItem of type video, or None if the phrase has no video
+    """
+    video_result = find_video(phrase.phrase)
+    if not video_result.found:
+        return None
+    return video_item(" ".join(words), phrase.phrase, phrase.similarity, video_result)
+
+
+def assemble_items(
+    words: list[str],
+    entity_words: set[str],
+    phrases: list[PhraseMatch],
+    match: Callable[[str], MatchResult],
+    find_video: Callable[[str], VideoLookupResult],
+) -> list[TranslationItem]:
+    """
+    Turn the words of a text into translation items.
+    
+    Each phrase span with a video becomes one video item; the other
+    words are matched one by one.
+    
+    Args:
+        words: Tokens of the text
+        entity_words: Lowercase named-entity words of the text
+        phrases: Non-overlapping phrase matches over the tokens
+        match: Returns the match result of a word
+        find_video: Returns the video lookup of a sign word
+        
+    Returns:
+        TranslationItems in text order
+    """
+    phrase_at = {phrase.start: phrase for phrase in phrases}
+    items: list[TranslationItem] = []
+    idx = 0
+    
+    while idx < len(words):
+        phrase = phrase_at.get(idx)
+        if phrase is not None:
+            item = phrase_item(words[phrase.start:phrase.end], phrase, find_video)
+            if item is not None:
+                items.append(item)
+                idx = phrase.end
+                continue
+        
+        items.append(word_item(words[idx], entity_words, match(words[idx]), find_video))
+        idx += 1
+    
+    return items
+
+
+def uncovered_indices(length: int, phrases: list[PhraseMatch]) -> list[int]:
+    """Indices of the tokens outside all phrase spans."""
+    covered = {idx for phrase in phrases for idx in range(phrase.start, phrase.end)}
+    return [idx for idx in range(length) if idx not in covered]
+
+
+def build_result(text: str, items: list[TranslationItem]) -> TranslationResult:
+    """Assemble a TranslationResult with per-type counts and playback time."""
+    video_count = 0
+    fingerspell_count = 0
+    skipped_count = 0
+    total_duration = 0.0
+    
+    for item in items:
+        if item.type == "video":
+            video_count += 1
+            total_duration += item.duration or 0.0
+        elif item.type == "fingerspell":
+            fingerspell_count += 1
+        else:
+            skipped_count += 1
+    
+    return TranslationResult(
+        original_text=text,
+        items=items,
+        video_count=video_count,
+        fingerspell_count=fingerspell_count,
+        skipped_count=skipped_count,
+        total_duration=round(total_duration, 3),
+    )
+
+
+def rendition_item(item: TranslationItem, lookup: VideoLookupResult) -> TranslationItem:
+    """Point a video item at its rendition (unchanged if there is none)."""
+    if not lookup.found:
+        return item
+    metadata = lookup.metadata
+    return replace(
+        item,
+        url=lookup.url,
+        size_bytes=metadata.size_bytes if metadata else None,
+        frame_rate=metadata.frame_rate if metadata else item.frame_rate,
+        width=metadata.width if metadata else None,
+        height=metadata.height if metadata else None,
+    )
 
 
 class TranslationService:
@@ -40,10 +231,17 @@ class TranslationService:
     
     Processing Flow:
     1. Tokenize text into words
-    2. For each word, find best embedding match
-    3. If similarity >= threshold → use matched sign video
-    4. If no match, check NER → if named entity → fingerspell
-    5. Otherwise → skip word
+    2. Replace spans matching a phrase sign with its video (if a phrase
+       matcher is configured)
+    3. For each remaining word, find best embedding match
+    4. If similarity >= threshold → use matched sign video
+    5. If no match, check NER → if named entity → fingerspell
+    6. Otherwise → skip word
+    
+    In degraded mode (used when a request's deadline cannot fit the full
+    pipeline) words are matched by the cheap degraded matcher only, and
+    phrase matching and NER are skipped, so unmatched words are skipped
+    rather than spelled.
     
     Follows Dependency Inversion - depends on abstractions.
     """
@@ -53,6 +251,9 @@ class TranslationService:
         embedding_matcher: IEmbeddingMatcher,
         ner_detector: INerDetector,
         video_repository: IVideoRepository,
+        result_cache: LruCache[str, TranslationResult] | None = None,
+        degraded_matcher: IEmbeddingMatcher | None = None,
+        phrase_matcher: IPhraseMatcher | None = None,
     ):
         """
         Initialize the translation service.
@@ -61,93 +262,218 @@ class TranslationService:
             embedding_matcher: Semantic word matcher
             ner_detector: Named entity detector
             video_repository: Repository for video lookup
+            result_cache: Optional cache of translated texts
+            degraded_matcher: Cheap matcher for degraded mode (e.g. exact
+                and stem lookups only); the embedding matcher if None
+            phrase_matcher: Optional matcher of multi-word phrase signs
         """
         self._embedding_matcher = embedding_matcher
         self._ner_detector = ner_detector
         self._video_repository = video_repository
+        self._result_cache = result_cache
+        self._degraded_matcher = degraded_matcher or embedding_matcher
+        self._phrase_matcher = phrase_matcher
         self._word_pattern = re.compile(r"[a-zA-Z]+")
 
-    def translate(self, text: str) -> TranslationResult:
+    def translate(self, text: str, degraded: bool = False) -> TranslationResult:
         """
         Translate text to sign language video references.
         
         Args:
             text: Input text to translate
+            degraded: Use the cheap degraded mode (a cached full result
+                is still returned if there is one)
             
         Returns:
             TranslationResult with video URLs, fingerspelling, and skipped words
         """
+        if self._result_cache is not None:
+            cached = self._result_cache.get(text)
+            if cached is not None:
+                return cached
+        
+        if degraded:
+            # Degraded results are never cached; the next request may afford the full path
+            return self._translate_degraded(text)
+        
+        result = self._translate_uncached(text)
+        
+        if self._result_cache is not None:
+            self._result_cache.put(text, result)
+        return result
+
+    def _translate_uncached(self, text: str) -> TranslationResult:
+        """Translate text without consulting the result cache."""
         # Extract words from text
-        words = self._word_pattern.findall(text)
+        words = self.tokenize(text)
         
         # Get named entities for the full text (for context)
-        entity_words = self._ner_detector.get_entity_words(text)
+        entity_words = self.get_entity_words(text)
         
-        items: list[TranslationItem] = []
-        video_count = 0
-        fingerspell_count = 0
-        skipped_count = 0
+        phrases = self.find_phrases_batch([words])[0]
+        items = self.translate_words(words, entity_words, phrases, self.match_word)
         
-        for word in words:
-            word_lower = word.lower()
-            
-            # Step 1: Try semantic matching
-            match_result = self._embedding_matcher.find_best_match(word_lower)
-            
-            if match_result.is_match and match_result.matched_word:
-                # Found a good match - look up the video
-                video_result = self._video_repository.find_video(match_result.matched_word)
-                
-                if video_result.found:
-                    items.append(
-                        TranslationItem(
-                            original_word=word,
-                            matched_word=match_result.matched_word,
-                            type="video",
-                            url=video_result.url,
-                            similarity=match_result.similarity,
-                        )
-                    )
-                    video_count += 1
-                    continue
-            
-            # Step 2: No match - check if it's a named entity
-            if word_lower in entity_words:
-                # Fingerspell named entities
-                letters = self._create_fingerspell_sequence(word)
-                items.append(
-                    TranslationItem(
-                        original_word=word,
-                        matched_word=None,
-                        type="fingerspell",
-                        letters=letters,
-                        similarity=match_result.similarity,
-                    )
-                )
-                fingerspell_count += 1
-            else:
-                # Step 3: Skip non-matching, non-entity words
-                items.append(
-                    TranslationItem(
-                        original_word=word,
-                        matched_word=None,
-                        type="skipped",
-                        similarity=match_result.similarity,
-                    )
-                )
-                skipped_count += 1
-        
-        return TranslationResult(
-            original_text=text,
-            items=items,
-            video_count=video_count,
-            fingerspell_count=fingerspell_count,
-            skipped_count=skipped_count,
+        return self.build_result(text, items)
+
+    def _translate_degraded(self, text: str) -> TranslationResult:
+        """Translate text with the degraded matcher and without NER."""
+        words = self.tokenize(text)
+        unique_words = list(dict.fromkeys(word.lower() for word in words))
+        matches = dict(zip(unique_words, self._degraded_matcher.find_best_matches(unique_words)))
+        
+        items = [self.translate_word(word, set(), matches[word.lower()]) for word in words]
+        result = self.build_result(text, items)
+        result.degraded = True
+        return result
+
+    def translate_batch(self, texts: list[str]) -> list[TranslationResult]:
+        """
+        Translate several texts with batched NER and matching calls.
+
+        Each unique word across the batch is matched once; texts found
+        in the result cache are not translated again.
+
+        Args:
+            texts: Input texts to translate
+
+        Returns:
+            TranslationResult for each text, in input order
+        """
+        results: list[TranslationResult | None] = [
+            self._result_cache.get(text) if self._result_cache is not None else None
+            for text in texts
+        ]
+        pending = [text for text, result in zip(texts, results) if result is None]
+        if not pending:
+            return results
+
+        token_lists = [self.tokenize(text) for text in pending]
+        with stage_timer("ner"):
+            entity_word_sets = self._ner_detector.get_entity_words_batch(pending)
+        phrase_lists = self.find_phrases_batch(token_lists)
+
+        # Words inside a phrase span are not matched on their own
+        unique_words = list(dict.fromkeys(
+            tokens[idx].lower()
+            for tokens, phrases in zip(token_lists, phrase_lists)
+            for idx in uncovered_indices(len(tokens), phrases)
+        ))
+        matches = dict(
+            zip(unique_words, self._embedding_matcher.find_best_matches(unique_words))
         )
 
-    def _create_fingerspell_sequence(self, word: str) -> list[str]:
-        """Create list of letters for fingerspelling."""
-        return [char.lower() for char in word if char.isalpha()]
+        translated = iter([
+            self.build_result(
+                text,
+                self.translate_words(
+                    tokens,
+                    entity_words,
+                    phrases,
+                    # Words of a phrase without a video were not matched up front
+                    lambda word: matches.get(word.lower()) or self.match_word(word),
+                ),
+            )
+            for text, tokens, entity_words, phrases in zip(
+                pending, token_lists, entity_word_sets, phrase_lists
+            )
+        ])
+
+        for idx, result in enumerate(results):
+            if result is None:
+                results[idx] = next(translated)
+                if self._result_cache is not None:
+                    self._result_cache.put(texts[idx], results[idx])
+        return results
+
+    def tokenize(self, text: str) -> list[str]:
+        """Extract the words that are translated from the text."""
+        with stage_timer("tokenize"):
+            return self._word_pattern.findall(text)
+
+    def get_entity_words(self, text: str) -> set[str]:
+        """Get the lowercase words that are part of named entities in the text."""
+        with stage_timer("ner"):
+            return self._ner_detector.get_entity_words(text)
+
+    def find_phrases_batch(self, token_lists: list[list[str]]) -> list[list[PhraseMatch]]:
+        """Find the phrase signs of tokenized texts (none without a phrase matcher)."""
+        if self._phrase_matcher is None:
+            return [[] for _ in token_lists]
+        return self._phrase_matcher.find_phrases_batch(token_lists)
+
+    def find_phrase_spans(self, tokens: list[str], start: int, end: int) -> list[PhraseMatch]:
+        """Match the phrase candidates overlapping tokens[start:end] (see IPhraseMatcher.find_spans)."""
+        if self._phrase_matcher is None:
+            return []
+        return self._phrase_matcher.find_spans(tokens, start, end)
+
+    def resolve_phrases(self, length: int, spans: list[PhraseMatch]) -> list[PhraseMatch]:
+        """Pick the non-overlapping phrase signs of a text among span matches."""
+        if self._phrase_matcher is None:
+            return []
+        return self._phrase_matcher.resolve(length, spans)
+
+    def translate_words(
+        self,
+        words: list[str],
+        entity_words: set[str],
+        phrases: list[PhraseMatch],
+        match: Callable[[str], MatchResult],
+    ) -> list[TranslationItem]:
+        """Turn the words of a text into translation items (see assemble_items)."""
+        return assemble_items(words, entity_words, phrases, match, self._find_video)
+
+    def translate_phrase(self, words: list[str], phrase: PhraseMatch) -> TranslationItem | None:
+        """Turn a phrase match into a video item (None if the phrase has no video)."""
+        return phrase_item(words, phrase, self._find_video)
+
+    def match_word(self, word: str) -> MatchResult:
+        """Find the best sign match for a single word."""
+        return self._embedding_matcher.find_best_match(word.lower())
+
+    def translate_word(
+        self,
+        word: str,
+        entity_words: set[str],
+        match_result: MatchResult,
+    ) -> TranslationItem:
+        """Turn a word and its match result into a translation item (see word_item)."""
+        return word_item(word, entity_words, match_result, self._find_video)
+
+    def _find_video(self, word: str) -> VideoLookupResult:
+        """Look up the video of a sign word."""
+        with stage_timer("lookup"):
+            return self._video_repository.find_video(word)
+
+    def build_result(self, text: str, items: list[TranslationItem]) -> TranslationResult:
+        """Assemble a TranslationResult with per-type counts and playback time."""
+        return build_result(text, items)
+
+    def with_rendition(self, result: TranslationResult, rendition: str | None) -> TranslationResult:
+        """
+        Point the video items of a result at a lower-bitrate rendition.
+        
+        Results are cached rendition-independent; this returns a copy
+        and leaves the given result untouched. Clips without the
+        rendition keep their original video.
+        
+        Args:
+            result: Translation result
+            rendition: Rendition name (None = original videos)
+            
+        Returns:
+            TranslationResult with rendition URLs and metadata
+        """
+        if rendition is None or result.video_count == 0:
+            return result
+        
+        items = [
+            rendition_item(item, self._video_repository.find_rendition(item.matched_word, rendition))
+            if item.type == "video" and item.matched_word
+            else item
+            for item in result.items
+        ]
+        return replace(result, items=items)
 
     def get_available_word_count(self) -> int:
         """Get the number of words with available videos."""
@@ -0,0 +1,151 @@
+"""
+Vocabulary Registry - Named sign vocabularies served from one process.
+Loads vocabularies (clip library, matcher indexes, translation service)
+on first use and evicts the least recently used ones to stay within a
+memory budget.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from app.core.interfaces.video_repository import IVideoRepository
+from app.core.metrics import MODEL_LOAD_SECONDS, VOCABULARY_MEMORY_BYTES, VOCABULARY_SIZE
+from app.services.async_translation_service import AsyncTranslationService
+from app.services.translation_service import TranslationService
+
+
+@dataclass
+class LoadedVocabulary:
+    """A sign vocabulary ready to translate with."""
+
+    name: str
+    translation_service: TranslationService
+    async_translation_service: AsyncTranslationService  # Same components, awaited on the event loop
+    video_repository: IVideoRepository
+    memory_bytes: int  # Estimated per-vocabulary memory; shared models excluded
+    fingerprint: str = ""  # Version of everything but the text a translation depends on
+    pinned: bool = False  # Pinned vocabularies are never evicted
+
+
+class UnknownVocabularyError(KeyError):
+    """Raised when a request names a vocabulary that is not configured."""
+
+
+class VocabularyRegistry:
+    """
+    Lazily loaded, memory-budgeted set of named vocabularies.
+
+    Each vocabulary is built by the loader on first use. After a load,
+    least recently used vocabularies are evicted until the estimated
+    total fits the budget; pinned vocabularies and the one just loaded
+    are kept. Evicted vocabularies are rebuilt on their next request,
+    while requests already holding one finish normally.
+    """
+
+    def __init__(
+        self,
+        names: list[str],
+        default: str,
+        loader: Callable[[str], LoadedVocabulary],
+        memory_budget_bytes: int,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            names: Configured vocabulary names
+            default: Vocabulary used when a request names none
+            loader: Builds a vocabulary by name
+            memory_budget_bytes: Estimated memory all loaded vocabularies may hold
+        """
+        if default not in names:
+            raise ValueError(f"Default vocabulary '{default}' is not configured")
+
+        self._names = list(names)
+        self._default = default
+        self._loader = loader
+        self._memory_budget_bytes = memory_budget_bytes
+        self._loaded: OrderedDict[str, LoadedVocabulary] = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks = {name: threading.Lock() for name in names}
+
+    @property
+    def names(self) -> list[str]:
+        """Configured vocabulary names."""
+        return list(self._names)
+
+    @property
+    def default(self) -> str:
+        """Name of the default vocabulary."""
+        return self._default
+
+    def loaded_names(self) -> list[str]:
+        """Names of the vocabularies currently in memory, least recently used first."""
+        with self._lock:
+            return list(self._loaded)
+
+    def memory_bytes(self) -> int:
+        """Estimated memory held by all loaded vocabularies."""
+        with self._lock:
+            return sum(vocabulary.memory_bytes for vocabulary in self._loaded.values())
+
+    def get(self, name: str | None = None) -> LoadedVocabulary:
+        """
+        Get a vocabulary, loading it if needed.
+
+        Args:
+            name: Vocabulary name (the default vocabulary if None)
+
+        Returns:
+            LoadedVocabulary
+
+        Raises:
+            UnknownVocabularyError: If the name is not configured
+        """
+        name = name or self._default
+        if name not in self._load_locks:
+            raise UnknownVocabularyError(name)
+
+        with self._lock:
+            vocabulary = self._loaded.get(name)
+            if vocabulary is not None:
+                self._loaded.move_to_end(name)
+                return vocabulary
+
+        # Load outside the registry lock so other vocabularies stay available
+        with self._load_locks[name]:
+            with self._lock:
+                vocabulary = self._loaded.get(name)
+            if vocabulary is not None:
+                return vocabulary
+
+            started = time.perf_counter()
+            vocabulary = self._loader(name)
+            MODEL_LOAD_SECONDS.set(time.perf_counter() - started, model=f"vocabulary:{name}")
+            VOCABULARY_SIZE.set(
+                vocabulary.translation_service.get_available_word_count(), vocabulary=name
+            )
+            VOCABULARY_MEMORY_BYTES.set(vocabulary.memory_bytes, vocabulary=name)
+
+            with self._lock:
+                self._loaded[name] = vocabulary
+                self._evict(keep=name)
+            return vocabulary
+
+    def _evict(self, keep: str) -> None:
+        """Drop least recently used vocabularies until the budget is met (lock held)."""
+        total = sum(vocabulary.memory_bytes for vocabulary in self._loaded.values())
+
+        for name in list(self._loaded):
+            if total <= self._memory_budget_bytes:
+                break
+            vocabulary = self._loaded[name]
+            if name == keep or vocabulary.pinned:
+                continue
+            del self._loaded[name]
+            total -= vocabulary.memory_bytes
+            VOCABULARY_MEMORY_BYTES.set(0, vocabulary=name)
+            print(f"Evicted vocabulary '{name}' ({vocabulary.memory_bytes / 2**20:.1f} MiB)")
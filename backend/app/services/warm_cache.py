@@ -0,0 +1,251 @@
+"""
+Warm Cache - Process-wide result caches that survive restarts.
+Keeps bounded LRU caches of word matches and translated sentences, and
+snapshots the hottest entries to disk so new processes start warm.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from app.core.cache import LruCache
+from app.core.interfaces.embedding_matcher import INDEX_ENTRY_BYTES, IEmbeddingMatcher, MatchResult
+from app.services.translation_service import TranslationResult, TranslationService
+
+SNAPSHOT_VERSION = 1
+
+
+class CachingMatcher(IEmbeddingMatcher):
+    """
+    Matcher decorator that memoizes match results in an LruCache.
+
+    A read-only instance uses the cache but never stores its own results,
+    so a cheaper, less accurate matcher can share the cache of a full one.
+    """
+
+    def __init__(
+        self,
+        matcher: IEmbeddingMatcher,
+        cache: LruCache[str, MatchResult],
+        read_only: bool = False,
+    ):
+        self._matcher = matcher
+        self._cache = cache
+        self._read_only = read_only
+
+    def find_best_match(self, word: str) -> MatchResult:
+        """Return the cached match, computing it on a miss."""
+        result = self._cache.get(word)
+        if result is None:
+            result = self._matcher.find_best_match(word)
+            if not self._read_only:
+                self._cache.put(word, result)
+        return result
+
+    def find_best_matches(self, words: list[str]) -> list[MatchResult]:
+        """Return cached matches; misses are computed in one batch."""
+        cached = [self._cache.get(word) for word in words]
+        missing = list(dict.fromkeys(
+            word for word, result in zip(words, cached) if result is None
+        ))
+        if not missing:
+            return cached
+
+        computed = dict(zip(missing, self._matcher.find_best_matches(missing)))
+        if not self._read_only:
+            for word, result in computed.items():
+                self._cache.put(word, result)
+        return [
+            result if result is not None else computed[word]
+            for word, result in zip(words, cached)
+        ]
+
+    def get_vocabulary_size(self) -> int:
+        """Get the number of words in the sign vocabulary."""
+        return self._matcher.get_vocabulary_size()
+
+    def estimate_memory_bytes(self) -> int:
+        """Approximate memory held by the wrapped matcher and the cache."""
+        return self._matcher.estimate_memory_bytes() + len(self._cache) * INDEX_ENTRY_BYTES
+
+
+def compute_fingerprint(vocabulary: list[str], *parts: object) -> str:
+    """
+    Fingerprint of everything a cached match result depends on.
+
+    Args:
+        vocabulary: Sign words with videos
+        parts: Model names, thresholds and matcher settings
+
+    Returns:
+        Hex digest that changes whenever cached results may be stale
+    """
+    digest = hashlib.sha256()
+    for word in sorted(vocabulary):
+        digest.update(word.encode("utf-8") + b"\n")
+    digest.update(repr(parts).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class CacheWarmer:
+    """
+    Snapshots the hottest cache entries to disk and restores them.
+
+    The snapshot holds the most recently used match results (input word,
+    sign word, similarity, tier) and the raw text of the most recently
+    translated sentences, so it is as sensitive as the requests
+    themselves. It is written owner-only (0600) in a directory created
+    owner-only (0700). On load, match results are restored directly when the snapshot's
+    fingerprint matches the running configuration; otherwise only their
+    words are replayed through the matcher. Sentences are always replayed
+    through the translation service, which also warms the models.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        fingerprint: str,
+        match_cache: LruCache[str, MatchResult] | None,
+        sentence_cache: LruCache[str, TranslationResult] | None,
+        max_words: int = 20_000,
+        max_sentences: int = 2_000,
+        max_age_seconds: float = 86_400,
+    ):
+        """
+        Initialize the warmer.
+
+        Args:
+            path: Snapshot file
+            fingerprint: Fingerprint of the running vocabulary and models
+            match_cache: Cache of word match results
+            sentence_cache: Cache of translated sentences
+            max_words: Maximum number of match results in a snapshot
+            max_sentences: Maximum number of sentences in a snapshot
+            max_age_seconds: Older snapshots are ignored
+        """
+        self._path = path
+        self._fingerprint = fingerprint
+        self._match_cache = match_cache
+        self._sentence_cache = sentence_cache
+        self._max_words = max_words
+        self._max_sentences = max_sentences
+        self._max_age_seconds = max_age_seconds
+        self._saved_writes: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+
+    def _writes(self) -> tuple[int, int]:
+        """Write counters of both caches."""
+        return (
+            self._match_cache.writes if self._match_cache is not None else 0,
+            self._sentence_cache.writes if self._sentence_cache is not None else 0,
+        )
+
+    def save(self) -> bool:
+        """
+        Write the hottest entries to the snapshot file.
+
+        Returns:
+            False if the caches are empty or unchanged since the last snapshot
+        """
+        with self._lock:
+            writes = self._writes()
+            if writes == self._saved_writes:
+                return False
+
+            matches = []
+            if self._match_cache is not None:
+                for word, result in self._match_cache.items()[:self._max_words]:
+                    matches.append(
+                        [word, result.matched_word, result.similarity, result.is_match, result.tier]
+                    )
+            sentences = []
+            if self._sentence_cache is not None:
+                sentences = [text for text, _ in self._sentence_cache.items()[:self._max_sentences]]
+            if not matches and not sentences:
+                # Never replace a useful snapshot with an empty one
+                return False
+
+            snapshot = {
+                "version": SNAPSHOT_VERSION,
+                "fingerprint": self._fingerprint,
+                "created_at": time.time(),
+                "matches": matches,
+                "sentences": sentences,
+            }
+
+            # Write to a temporary file first so a crash never leaves a partial snapshot.
+            # Sentences are user text: create the file owner-only rather than chmod it later
+            self._path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            temporary = self._path.with_suffix(self._path.suffix + ".tmp")
+            temporary.unlink(missing_ok=True)
+            descriptor = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                json.dump(snapshot, handle)
+            os.replace(temporary, self._path)
+
+            self._saved_writes = writes
+            return True
+
+    def load_snapshot(self) -> dict | None:
+        """Read the snapshot file if it is present, valid and fresh enough."""
+        try:
+            snapshot = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+            return None
+        if time.time() - snapshot.get("created_at", 0) > self._max_age_seconds:
+            print(f"Ignoring cache snapshot older than {self._max_age_seconds:.0f}s")
+            return None
+        return snapshot
+
+    def warm(
+        self,
+        snapshot: dict,
+        translation_service: TranslationService,
+        matcher: IEmbeddingMatcher,
+    ) -> None:
+        """
+        Pre-populate the caches from a snapshot.
+
+        Args:
+            snapshot: Snapshot returned by load_snapshot
+            translation_service: Service the sentences are replayed through
+            matcher: Matcher the words are replayed through when the
+                match results cannot be restored directly
+        """
+        started = time.perf_counter()
+        entries = snapshot.get("matches", [])[:self._max_words]
+        sentences = snapshot.get("sentences", [])[:self._max_sentences]
+
+        if snapshot.get("fingerprint") == self._fingerprint and self._match_cache is not None:
+            # Least recently used first, so the LRU order is preserved
+            for word, matched_word, similarity, is_match, tier in reversed(entries):
+                self._match_cache.put(
+                    word,
+                    MatchResult(
+                        query_word=word,
+                        matched_word=matched_word,
+                        similarity=similarity,
+                        is_match=is_match,
+                        tier=tier,
+                    ),
+                )
+            restored = "restored"
+        else:
+            matcher.find_best_matches([entry[0] for entry in reversed(entries)])
+            restored = "replayed"
+
+        for text in reversed(sentences):
+            translation_service.translate(text)
+
+        # The caches now match the snapshot; no need to write it back unchanged
+        self._saved_writes = self._writes()
+        print(
+            f"Cache warm-up: {restored} {len(entries)} matches, replayed {len(sentences)} "
+            f"sentences in {time.perf_counter() - started:.2f}s"
+        )
@@ -0,0 +1 @@
+"""Benchmarks package - reproducible performance measurements for the pipeline."""
@@ -0,0 +1,289 @@
+"""
+Translation API Load Test.
+Replays the benchmark corpus against /api/v1/translate and the /signs clips
+at a configurable concurrency or arrival rate, and reports throughput,
+latency percentiles and error rates per endpoint.
+
+Usage (from the backend directory):
+    # Start a model-free server (stand-in matcher and NER) and load it
+    python -m benchmarks.loadtest --spawn-server --duration 30 --concurrency 32
+
+    # Same, with the server's result caches on (the corpus repeats, so
+    # this mostly measures cache hits)
+    python -m benchmarks.loadtest --spawn-server --caches warm
+
+    # Load an already running server at a fixed arrival rate
+    python -m benchmarks.loadtest --url http://localhost:7860 --rate 200 --duration 60
+
+A model-free server can also be started by hand with
+    SERVICE_PROFILE=stand_in uvicorn app.main:app --port 7860
+so framework and serialization overhead can be measured apart from model cost.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+
+from benchmarks.run import CORPUS_PATH, load_corpus, percentile
+
+TRANSLATE_PATH = "/api/v1/translate"
+HEALTH_PATH = "/api/v1/health"
+
+
+@dataclass
+class EndpointStats:
+    """Collected samples for one endpoint."""
+
+    latencies_ms: list[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    errors: int = 0
+
+    def record(self, latency_ms: float, status: int | None) -> None:
+        """Record one request outcome (status None for transport errors)."""
+        self.latencies_ms.append(latency_ms)
+        if status is None or status >= 400:
+            self.errors += 1
+        self.statuses[str(status) if status is not None else "error"] += 1
+
+    def summary(self, elapsed: float) -> dict:
+        """Throughput, latency percentiles and error rate."""
+        latencies = sorted(self.latencies_ms)
+        count = len(latencies)
+        if not count:
+            return {"requests": 0}
+        return {
+            "requests": count,
+            "throughput_rps": round(count / elapsed, 1),
+            "p50_ms": round(percentile(latencies, 0.50), 3),
+            "p95_ms": round(percentile(latencies, 0.95), 3),
+            "p99_ms": round(percentile(latencies, 0.99), 3),
+            "max_ms": round(latencies[-1], 3),
+            "error_rate": round(self.errors / count, 4),
+            "statuses": dict(self.statuses),
+        }
+
+
+class LoadGenerator:
+    """
+    Issues translate and clip requests against a server.
+
+    With `rate` set, requests start on a fixed schedule (open loop) and
+    at most `concurrency` are in flight; otherwise `concurrency` workers
+    send requests back to back (closed loop). Clip URLs returned by
+    translations make up roughly `signs_ratio` of the requests.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        sentences: list[str],
+        concurrency: int,
+        rate: float | None,
+        signs_ratio: float,
+    ):
+        self._client = client
+        self._sentences = sentences
+        self._concurrency = concurrency
+        self._rate = rate
+        self._signs_ratio = signs_ratio
+        self._clip_urls: list[str] = []
+        self._counter = 0
+        self.dropped = 0
+        self.stats: dict[str, EndpointStats] = defaultdict(EndpointStats)
+
+    async def _timed(self, name: str, method: str, url: str, **kwargs) -> httpx.Response | None:
+        """Send one request and record its latency and status."""
+        started = time.perf_counter()
+        try:
+            response = await self._client.request(method, url, **kwargs)
+            await response.aread()
+        except httpx.HTTPError:
+            self.stats[name].record((time.perf_counter() - started) * 1000, None)
+            return None
+        self.stats[name].record((time.perf_counter() - started) * 1000, response.status_code)
+        return response
+
+    async def _one_request(self) -> None:
+        """Send the next request of the deterministic mix."""
+        index = self._counter
+        self._counter += 1
+
+        # Every n-th request is a clip fetch once clip URLs are known
+        if self._clip_urls and self._signs_ratio > 0 and index % round(1 / self._signs_ratio) == 0:
+            url = self._clip_urls[index % len(self._clip_urls)]
+            await self._timed("signs", "GET", url)
+            return
+
+        sentence = self._sentences[index % len(self._sentences)]
+        response = await self._timed("translate", "POST", TRANSLATE_PATH, json={"text": sentence})
+        if response is not None and response.status_code == 200 and len(self._clip_urls) < 1000:
+            for item in response.json().get("translations", []):
+                if item.get("url") and item["url"] not in self._clip_urls:
+                    self._clip_urls.append(item["url"])
+
+    async def run(self, duration: float) -> float:
+        """Generate load for `duration` seconds; returns the elapsed time."""
+        started = time.perf_counter()
+        deadline = started + duration
+
+        if self._rate is None:
+            async def worker() -> None:
+                while time.perf_counter() < deadline:
+                    await self._one_request()
+
+            await asyncio.gather(*(worker() for _ in range(self._concurrency)))
+            return time.perf_counter() - started
+
+        semaphore = asyncio.Semaphore(self._concurrency)
+        tasks: set[asyncio.Task] = set()
+        interval = 1 / self._rate
+        next_start = started
+
+        async def limited() -> None:
+            async with semaphore:
+                await self._one_request()
+
+        while next_start < deadline:
+            delay = next_start - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if semaphore.locked():
+                # All slots busy: the server cannot keep up with the arrival rate
+                self.dropped += 1
+            else:
+                task = asyncio.create_task(limited())
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            next_start += interval
+
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - started
+
+
+def spawn_server(port: int, caches: str = "cold") -> subprocess.Popen:
+    """
+    Start uvicorn with the model-free stand-in profile.
+
+    Cache snapshots are always off. With caches="cold", the match and
+    sentence caches are disabled too, so every request runs the pipeline.
+    """
+    env = {**os.environ, "SERVICE_PROFILE": "stand_in", "CACHE_SNAPSHOT_ENABLED": "false"}
+    if caches == "cold":
+        env.update(CACHE_MATCH_SIZE="0", CACHE_SENTENCE_SIZE="0")
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=Path(__file__).parent.parent,
+        env=env,
+    )
+
+
+async def wait_until_healthy(client: httpx.AsyncClient, timeout: float) -> None:
+    """Poll the health endpoint until the server answers."""
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            response = await client.get(HEALTH_PATH)
+            if response.status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        if time.perf_counter() > deadline:
+            raise RuntimeError("Server did not become healthy in time")
+        await asyncio.sleep(0.2)
+
+
+async def run_load_test(args: argparse.Namespace) -> dict:
+    """Run the load test and build the report."""
+    sentences = load_corpus(args.corpus)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=args.timeout) as client:
+        await wait_until_healthy(client, args.startup_timeout)
+
+        generator = LoadGenerator(
+            client,
+            sentences,
+            concurrency=args.concurrency,
+            rate=args.rate,
+            signs_ratio=args.signs_ratio,
+        )
+        if args.warmup > 0:
+            await generator.run(args.warmup)
+            generator.stats.clear()
+            generator.dropped = 0
+
+        elapsed = await generator.run(args.duration)
+
+    return {
+        "url": args.url,
+        "duration_s": round(elapsed, 3),
+        "concurrency": args.concurrency,
+        "rate": args.rate,
+        "caches": args.caches if args.spawn_server else None,
+        "dropped_arrivals": generator.dropped,
+        "endpoints": {name: stats.summary(elapsed) for name, stats in sorted(generator.stats.items())},
+    }
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Load test the translation API")
+    parser.add_argument("--url", default="http://127.0.0.1:7860", help="server base URL")
+    parser.add_argument("--duration", type=float, default=30.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=3.0, help="unmeasured warm-up seconds")
+    parser.add_argument("--concurrency", type=int, default=16, help="maximum requests in flight")
+    parser.add_argument("--rate", type=float, help="arrival rate in requests/s (open loop)")
+    parser.add_argument("--signs-ratio", type=float, default=0.25, help="fraction of requests fetching clips")
+    parser.add_argument("--corpus", type=Path, default=CORPUS_PATH, help="sentence corpus")
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-request timeout in seconds")
+    parser.add_argument("--startup-timeout", type=float, default=60.0, help="seconds to wait for /health")
+    parser.add_argument("--spawn-server", action="store_true", help="start a stand-in profile server")
+    parser.add_argument("--port", type=int, default=7860, help="port for --spawn-server")
+    parser.add_argument(
+        "--caches",
+        choices=("cold", "warm"),
+        default="cold",
+        help="result caches of the --spawn-server server (cold = disabled)",
+    )
+    parser.add_argument("--output", type=Path, help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    server = None
+    if args.spawn_server:
+        server = spawn_server(args.port, args.caches)
+        args.url = f"http://127.0.0.1:{args.port}"
+
+    try:
+        report = asyncio.run(run_load_test(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    if report["dropped_arrivals"]:
+        print(f"Dropped arrivals (concurrency limit reached): {report['dropped_arrivals']}")
+    for name, summary in report["endpoints"].items():
+        if not summary["requests"]:
+            continue
+        print(
+            f"{name:10s} {summary['requests']:7d} req  {summary['throughput_rps']:8.1f} req/s  "
+            f"p50={summary['p50_ms']:8.2f}ms  p95={summary['p95_ms']:8.2f}ms  "
+            f"p99={summary['p99_ms']:8.2f}ms  errors={summary['error_rate']:.2%}"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+"""
+Translation Pipeline Benchmarks.
+Measures matcher, NER, repository and end-to-end translation latency over
+the checked-in corpus and compares the results with a stored baseline.
+
+Usage (from the backend directory):
+    python -m benchmarks.run                    # stand-in matcher and NER, runs offline
+    python -m benchmarks.run --real             # sentence-transformers and spaCy models
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --update-baseline  # store results as the new baseline
+
+Each benchmark is run several times (--repeats) and the median of each
+statistic is reported, so a single noisy run cannot fail the gate.
+Exits with status 1 if any benchmark regresses beyond the tolerance.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import re
+import resource
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from app.config import get_settings
+from app.core.interfaces.embedding_matcher import IEmbeddingMatcher
+from app.core.interfaces.ner_detector import INerDetector
+from app.core.interfaces.text_encoder import ITextEncoder
+from app.repositories.video_repository import FileSystemVideoRepository
+from app.services.phrase_matcher import PhraseMatcher
+from app.services.tiered_matcher import TieredMatcher
+from app.services.translation_service import TranslationService
+
+BENCHMARKS_DIR = Path(__file__).parent
+CORPUS_PATH = BENCHMARKS_DIR / "corpus.txt"
+BASELINES = {
+    "stand_in": BENCHMARKS_DIR / "baseline.json",
+    "real": BENCHMARKS_DIR / "baseline_real.json",
+}
+TRACKED_PACKAGES = ["sentence-transformers", "torch", "spacy", "numpy", "nltk", "fastapi"]
+
+
+@dataclass
+class BenchmarkResult:
+    """Latency statistics of a single benchmark."""
+
+    name: str
+    iterations: int
+    mean_us: float
+    p50_us: float
+    p95_us: float
+    p99_us: float
+    ops_per_sec: float
+    peak_rss_mb: float
+
+
+def load_corpus(path: Path = CORPUS_PATH) -> list[str]:
+    """Load benchmark sentences, skipping blank lines and comments."""
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KiB on Linux
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return peak / divisor
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of pre-sorted values."""
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _time_run(func: Callable[[Any], Any], inputs: list[Any], iterations: int) -> tuple[list[float], float]:
+    """Time one run of `iterations` calls; sorted latencies (us) and calls per second."""
+    gc.collect()
+    timings_ns: list[int] = []
+    started = time.perf_counter_ns()
+    for i in range(iterations):
+        value = inputs[i % len(inputs)]
+        t0 = time.perf_counter_ns()
+        func(value)
+        timings_ns.append(time.perf_counter_ns() - t0)
+    elapsed_ns = time.perf_counter_ns() - started
+    return sorted(t / 1000 for t in timings_ns), iterations / (elapsed_ns / 1e9)
+
+
+def run_benchmark(
+    name: str,
+    func: Callable[[Any], Any],
+    inputs: list[Any],
+    iterations: int,
+    warmup: int,
+    repeats: int = 1,
+) -> BenchmarkResult:
+    """
+    Time `func` over `inputs`, cycling through them in a fixed order.
+
+    Args:
+        name: Benchmark name
+        func: Operation to time, called with one input
+        inputs: Inputs to cycle through
+        iterations: Number of timed calls per run
+        warmup: Number of untimed calls before measuring
+        repeats: Number of timed runs; each statistic is the median over runs
+
+    Returns:
+        BenchmarkResult with latency percentiles and throughput
+    """
+    for i in range(warmup):
+        func(inputs[i % len(inputs)])
+
+    runs = [_time_run(func, inputs, iterations) for _ in range(max(1, repeats))]
+
+    def median(statistic: Callable[[list[float]], float]) -> float:
+        return round(statistics.median(statistic(timings_us) for timings_us, _ in runs), 3)
+
+    return BenchmarkResult(
+        name=name,
+        iterations=iterations,
+        mean_us=median(statistics.fmean),
+        p50_us=median(lambda timings_us: percentile(timings_us, 0.50)),
+        p95_us=median(lambda timings_us: percentile(timings_us, 0.95)),
+        p99_us=median(lambda timings_us: percentile(timings_us, 0.99)),
+        ops_per_sec=round(statistics.median(ops for _, ops in runs), 1),
+        peak_rss_mb=round(peak_rss_mb(), 1),
+    )
+
+
+def build_components(
+    real: bool,
+    repository: FileSystemVideoRepository,
+) -> tuple[IEmbeddingMatcher, INerDetector]:
+    """Create the matcher and NER detector for the selected mode."""
+    settings = get_settings()
+    vocabulary = repository.get_available_words()
+
+    if real:
+        from app.services.embedding_service import EmbeddingService
+        from app.services.ner_service import NerService
+
+        return (
+            EmbeddingService(
+                vocabulary=vocabulary,
+                model_name=settings.embedding_model,
+                similarity_threshold=settings.similarity_threshold,
+            ),
+            NerService(model_name=settings.spacy_model),
+        )
+
+    from app.services.stand_in_services import HashingEmbeddingMatcher, RuleBasedNerDetector
+
+    return (
+        HashingEmbeddingMatcher(
+            vocabulary=vocabulary,
+            similarity_threshold=settings.similarity_threshold,
+        ),
+        RuleBasedNerDetector(),
+    )
+
+
+def run_suite(real: bool, iterations: int, repeats: int = 1) -> dict:
+    """Run all benchmarks and return the JSON report."""
+    settings = get_settings()
+    sentences = load_corpus()
+
+    load_started = time.perf_counter()
+    repository = FileSystemVideoRepository(settings.videos_directory, base_url="/signs")
+    matcher, ner_detector = build_components(real, repository)
+    load_seconds = time.perf_counter() - load_started
+
+    # End-to-end translation uses the production tier stack in front of the matcher
+    tiered_matcher = TieredMatcher.from_vocabulary(
+        vocabulary=repository.get_available_words(),
+        fallback=matcher,
+        stem=settings.matcher_stem_enabled,
+        lemma=settings.matcher_lemma_enabled,
+        synonyms_path=settings.matcher_synonyms_path,
+        typo=settings.matcher_typo_enabled,
+        typo_max_distance=settings.matcher_typo_max_distance,
+        typo_prefix_length=settings.matcher_typo_prefix_length,
+        typo_min_word_length=settings.matcher_typo_min_word_length,
+        typo_max_index_entries=settings.matcher_typo_max_index_entries,
+        lexicon_path=settings.matcher_lexicon_path,
+    )
+    phrase_matcher = None
+    if settings.matcher_phrases_enabled:
+        phrase_matcher = PhraseMatcher(
+            vocabulary=repository.get_available_words(),
+            encoder=matcher if isinstance(matcher, ITextEncoder) else None,
+            similarity_threshold=settings.matcher_phrase_threshold,
+            max_length=settings.matcher_phrase_max_length,
+            max_candidates=settings.matcher_phrase_max_candidates,
+        )
+    service = TranslationService(
+        embedding_matcher=tiered_matcher,
+        ner_detector=ner_detector,
+        video_repository=repository,
+        phrase_matcher=phrase_matcher,
+    )
+
+    vocabulary = sorted(repository.get_available_words())
+    corpus_words = sorted(
+        {word.lower() for sentence in sentences for word in re.findall(r"[a-zA-Z]+", sentence)}
+    )
+    vocabulary_set = set(vocabulary)
+    miss_words = [word for word in corpus_words if word not in vocabulary_set]
+    # Every k-th vocabulary word, so the sample is spread over the alphabet
+    exact_words = vocabulary[:: max(1, len(vocabulary) // 500)] or ["hello"]
+    lookup_words = exact_words + miss_words
+
+    # Model-backed calls are orders of magnitude slower; scale their counts down
+    model_iterations = max(50, iterations // 10) if real else iterations
+    sentence_iterations = max(len(sentences), model_iterations // 4)
+
+    benchmarks = [
+        ("embedding.find_best_match.exact", matcher.find_best_match, exact_words, iterations),
+        ("embedding.find_best_match.miss", matcher.find_best_match, miss_words, model_iterations),
+        ("tiered.find_best_match.miss", tiered_matcher.find_best_match, miss_words, model_iterations),
+        ("ner.get_entity_words", ner_detector.get_entity_words, sentences, sentence_iterations),
+        ("repository.find_video", repository.find_video, lookup_words, iterations),
+        ("translation.translate", service.translate, sentences, sentence_iterations),
+    ]
+
+    results = []
+    for name, func, inputs, count in benchmarks:
+        result = run_benchmark(name, func, inputs, count, warmup=max(1, count // 10), repeats=repeats)
+        print(
+            f"{name:36s} p50={result.p50_us:10.1f}us  p95={result.p95_us:10.1f}us  "
+            f"p99={result.p99_us:10.1f}us  {result.ops_per_sec:10.1f} ops/s"
+        )
+        results.append(asdict(result))
+
+    packages = {}
+    for package in TRACKED_PACKAGES:
+        try:
+            packages[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            packages[package] = None
+
+    return {
+        "mode": "real" if real else "stand_in",
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "packages": packages,
+            "embedding_model": settings.embedding_model if real else None,
+            "spacy_model": settings.spacy_model if real else None,
+            "similarity_threshold": settings.similarity_threshold,
+            "vocabulary_size": len(vocabulary),
+            "corpus_sentences": len(sentences),
+        },
+        "repeats": repeats,
+        "load_seconds": round(load_seconds, 3),
+        "benchmarks": results,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Compare a report with a baseline.
+
+    A benchmark regresses when its (median) p95 latency grows, or its
+    throughput drops, by more than `tolerance` (a fraction) relative to
+    the baseline.
+
+    Returns:
+        Human-readable descriptions of the regressions
+    """
+    if baseline.get("mode") != report["mode"]:
+        print(f"Baseline mode {baseline.get('mode')!r} differs from {report['mode']!r}; skipping")
+        return []
+
+    previous = {entry["name"]: entry for entry in baseline.get("benchmarks", [])}
+    regressions = []
+
+    for entry in report["benchmarks"]:
+        base = previous.get(entry["name"])
+        if base is None:
+            continue
+
+        p95_change = entry["p95_us"] / base["p95_us"] - 1 if base["p95_us"] else 0.0
+        ops_change = entry["ops_per_sec"] / base["ops_per_sec"] - 1 if base["ops_per_sec"] else 0.0
+        print(f"{entry['name']:36s} p95 {p95_change:+7.1%}  ops/s {ops_change:+7.1%}")
+
+        if p95_change > tolerance or ops_change < -tolerance:
+            regressions.append(
+                f"{entry['name']}: p95 {base['p95_us']}us -> {entry['p95_us']}us, "
+                f"ops/s {base['ops_per_sec']} -> {entry['ops_per_sec']}"
+            )
+
+    return regressions
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the translation pipeline")
+    parser.add_argument("--real", action="store_true", help="use the real embedding and NER models")
+    parser.add_argument("--iterations", type=int, default=5000, help="timed calls per micro-benchmark run")
+    parser.add_argument("--repeats", type=int, default=5, help="runs per benchmark; the median is reported")
+    parser.add_argument("--output", type=Path, help="write the JSON report to this file")
+    parser.add_argument("--baseline", type=Path, help="baseline to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown")
+    parser.add_argument("--update-baseline", action="store_true", help="overwrite the baseline")
+    args = parser.parse_args()
+
+    report = run_suite(real=args.real, iterations=args.iterations, repeats=args.repeats)
+    baseline_path = args.baseline or BASELINES[report["mode"]]
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Report written to {args.output}")
+
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline updated: {baseline_path}")
+        return
+
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}; run with --update-baseline to create one")
+        return
+
+    regressions = compare(
+        report,
+        json.loads(baseline_path.read_text(encoding="utf-8")),
+        args.tolerance,
+    )
+    if regressions:
+        print("Regressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+    print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
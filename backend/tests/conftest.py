@@ -0,0 +1,136 @@
+"""
+Shared test fixtures.
+Tests run against the lite service profile (matcher tiers and rule-based
+NER, no models) with result caches and snapshots disabled.
+"""
+
+import os
+
+os.environ.setdefault("SERVICE_PROFILE", "lite")
+os.environ.setdefault("CACHE_SNAPSHOT_ENABLED", "false")
+os.environ.setdefault("CACHE_MATCH_SIZE", "0")
+os.environ.setdefault("CACHE_SENTENCE_SIZE", "0")
+
+from pathlib import Path
+
+import pytest
+
+from app.repositories.video_repository import FileSystemVideoRepository
+from app.services.async_adapters import AsyncEmbeddingMatcherAdapter, AsyncNerDetectorAdapter, AsyncVideoRepositoryAdapter
+from app.services.async_translation_service import AsyncTranslationService
+from app.services.phrase_matcher import PhraseMatcher
+from app.services.stand_in_services import RuleBasedNerDetector
+from app.services.tiered_matcher import TieredMatcher
+from app.services.translation_service import TranslationService
+
+SIGN_WORDS = [
+    "hello", "welcome", "to", "a", "a lot", "all day", "day", "fun", "have",
+    "we", "of", "all", "love", "cat", "run", "thank you", "you", "school",
+]
+
+
+@pytest.fixture
+def clips_directory(tmp_path: Path) -> Path:
+    """Directory with an (empty) clip per sign word."""
+    for word in SIGN_WORDS:
+        (tmp_path / f"{word}.mp4").write_bytes(b"")
+    return tmp_path
+
+
+@pytest.fixture
+def video_repository(clips_directory: Path) -> FileSystemVideoRepository:
+    """Repository over the test clips."""
+    return FileSystemVideoRepository(videos_directory=clips_directory, base_url="/signs")
+
+
+@pytest.fixture
+def translation_service(video_repository: FileSystemVideoRepository) -> TranslationService:
+    """Model-free translation service over the test clips, with phrase matching."""
+    vocabulary = video_repository.get_available_words()
+    return TranslationService(
+        embedding_matcher=TieredMatcher.from_vocabulary(vocabulary, fallback=None),
+        ner_detector=RuleBasedNerDetector(),
+        video_repository=video_repository,
+        phrase_matcher=PhraseMatcher(vocabulary),
+    )
+
+
+@pytest.fixture
+def async_translation_service(translation_service: TranslationService) -> AsyncTranslationService:
+    """Async translation service over the components of translation_service."""
+    return AsyncTranslationService(
+        embedding_matcher=AsyncEmbeddingMatcherAdapter(translation_service._embedding_matcher),
+        ner_detector=AsyncNerDetectorAdapter(translation_service._ner_detector),
+        video_repository=AsyncVideoRepositoryAdapter(translation_service._video_repository),
+        phrase_matcher=translation_service._phrase_matcher,
+    )
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client of the application (lite profile, bundled clips)."""
+    from fastapi.testclient import TestClient
+
+    from app.api.dependencies import get_vocabulary_registry
+    from app.main import app
+
+    with TestClient(app) as client:
+        # Load the default vocabulary now; a first request doing it would run out of deadline and degrade
+        get_vocabulary_registry().get()
+        yield client
+
+
+@pytest.fixture
+def serve_clips(client):
+    """
+    Serve the default vocabulary of the test client from a clip directory,
+    with fresh manifests, as a newly started process would.
+    """
+    from app.api.dependencies import (
+        DEGRADED_TIERS,
+        build_async_translation_service,
+        get_clip_manifest_service,
+        get_vocabulary_registry,
+        translation_fingerprint,
+    )
+    from app.config import get_settings
+    from app.main import app
+    from app.services.clip_manifest import ClipManifestService
+    from app.services.vocabulary_registry import LoadedVocabulary, VocabularyRegistry
+
+    name = get_settings().default_vocabulary
+
+    def serve(directory: Path) -> LoadedVocabulary:
+        repository = FileSystemVideoRepository(videos_directory=directory, base_url="/signs")
+        vocabulary = repository.get_available_words()
+        matcher = TieredMatcher.from_vocabulary(vocabulary, fallback=None)
+        degraded_matcher = matcher.restricted_to(DEGRADED_TIERS)
+        phrase_matcher = PhraseMatcher(vocabulary)
+        loaded = LoadedVocabulary(
+            name=name,
+            translation_service=TranslationService(
+                embedding_matcher=matcher,
+                ner_detector=RuleBasedNerDetector(),
+                video_repository=repository,
+                degraded_matcher=degraded_matcher,
+                phrase_matcher=phrase_matcher,
+            ),
+            async_translation_service=build_async_translation_service(
+                matcher=matcher,
+                degraded_matcher=degraded_matcher,
+                repository=repository,
+                phrase_matcher=phrase_matcher,
+            ),
+            video_repository=repository,
+            memory_bytes=0,
+            fingerprint=translation_fingerprint(vocabulary),
+            pinned=True,
+        )
+        registry = VocabularyRegistry([name], name, lambda _: loaded, memory_budget_bytes=2**30)
+        manifests = ClipManifestService(max_size=8)
+        app.dependency_overrides[get_vocabulary_registry] = lambda: registry
+        app.dependency_overrides[get_clip_manifest_service] = lambda: manifests
+        return loaded
+
+    yield serve
+    app.dependency_overrides.clear()
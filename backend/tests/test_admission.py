@@ -0,0 +1,157 @@
+"""Tests for admission control: rate limiting, concurrency gate and slots."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.api.admission import AdmissionControlMiddleware, ConcurrencyGate, TokenBucketLimiter, admit, admit_document
+
+
+def test_token_bucket_allows_bursts_then_paces(monkeypatch: pytest.MonkeyPatch):
+    now = [100.0]
+    monkeypatch.setattr("app.api.admission.time.monotonic", lambda: now[0])
+    limiter = TokenBucketLimiter(rate=2.0, burst=3)
+
+    assert [limiter.acquire("a") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire("a") == pytest.approx(0.5)
+    # Other clients have their own bucket
+    assert limiter.acquire("b") == 0.0
+
+    now[0] += 0.5
+    assert limiter.acquire("a") == 0.0
+    assert limiter.acquire("a") > 0
+
+
+def test_token_bucket_forgets_least_recent_clients(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("app.api.admission.time.monotonic", lambda: 100.0)
+    limiter = TokenBucketLimiter(rate=1.0, burst=1, max_clients=2)
+
+    limiter.acquire("a")
+    limiter.acquire("b")
+    limiter.acquire("c")
+
+    # "a" was dropped and starts with a full bucket again
+    assert limiter.acquire("a") == 0.0
+    assert limiter.acquire("c") > 0
+
+
+def test_concurrency_gate_queues_then_sheds():
+    async def scenario() -> list[str]:
+        gate = ConcurrencyGate(max_concurrent=1, max_queue=1)
+        assert await gate.acquire(timeout=None) == "admitted"
+
+        queued = asyncio.create_task(gate.acquire(timeout=1.0))
+        await asyncio.sleep(0)
+        shed = await gate.acquire(timeout=1.0)
+        gate.release()
+        admitted = await queued
+
+        timed_out = await gate.acquire(timeout=0.01)
+        gate.release()
+        return [shed, admitted, timed_out, str(gate._in_flight)]
+
+    assert asyncio.run(scenario()) == ["shed", "admitted", "timeout", "0"]
+
+
+def _app(max_concurrent: int, rate_per_second: float = 0.0, max_documents: int = 1) -> AdmissionControlMiddleware:
+    api = FastAPI()
+
+    @api.get("/translate")
+    async def translate(request: Request) -> dict:
+        if request.headers.get("if-none-match"):
+            return {"revalidated": True, "in_flight": middleware._gate._in_flight}
+        await admit(request)
+        return {"in_flight": middleware._gate._in_flight}
+
+    @api.get("/translate/manifest")
+    async def manifest() -> dict:
+        return {"in_flight": middleware._gate._in_flight}
+
+    @api.post("/translate/document")
+    async def document(request: Request) -> StreamingResponse:
+        await admit_document(request)
+
+        async def stream():
+            # Still held while the body streams
+            yield f"{middleware._document_gate._in_flight},{middleware._gate._in_flight}".encode()
+
+        return StreamingResponse(stream())
+
+    @api.get("/health")
+    async def health() -> dict:
+        return {"status": "ok"}
+
+    middleware = AdmissionControlMiddleware(
+        api, path_prefix="/translate", max_concurrent=max_concurrent, max_queue=0,
+        deadline_seconds=0.05, rate_per_second=rate_per_second, burst=2, max_documents=max_documents,
+    )
+    return middleware
+
+
+def test_only_translating_handlers_take_a_slot():
+    middleware = _app(max_concurrent=1)
+
+    with TestClient(middleware) as client:
+        assert client.get("/translate").json() == {"in_flight": 1}
+        assert client.get("/translate/manifest").json() == {"in_flight": 0}
+        assert client.get("/translate", headers={"If-None-Match": '"x"'}).json()["in_flight"] == 0
+
+    assert middleware._gate._in_flight == 0
+
+
+def test_translations_are_shed_when_no_slot_is_free():
+    middleware = _app(max_concurrent=0)
+
+    with TestClient(middleware) as client:
+        response = client.get("/translate")
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        # Requests that do not translate are still served
+        assert client.get("/translate/manifest").status_code == 200
+        assert client.get("/translate", headers={"If-None-Match": '"x"'}).status_code == 200
+
+
+def test_document_streams_hold_a_document_slot():
+    middleware = _app(max_concurrent=0)
+
+    with TestClient(middleware) as client:
+        assert client.post("/translate/document").text == "1,0"
+
+    assert middleware._document_gate._in_flight == 0
+
+
+def test_documents_are_shed_when_no_document_slot_is_free():
+    middleware = _app(max_concurrent=1, max_documents=0)
+
+    with TestClient(middleware) as client:
+        response = client.post("/translate/document")
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        assert client.get("/translate").status_code == 200
+
+
+def test_rate_limit_covers_the_prefix_only():
+    middleware = _app(max_concurrent=1, rate_per_second=0.01)
+
+    with TestClient(middleware) as client:
+        assert client.get("/translate").status_code == 200
+        assert client.get("/translate/manifest").status_code == 200
+        response = client.get("/translate")
+        assert response.status_code == 429
+        assert int(response.headers["retry-after"]) > 0
+        assert client.get("/health").status_code == 200
+
+
+def test_admit_without_middleware_is_a_no_op():
+    api = FastAPI()
+
+    @api.get("/translate")
+    async def translate(request: Request) -> dict:
+        await admit(request)
+        return {"ok": True}
+
+    with TestClient(api) as client:
+        assert client.get("/translate").json() == {"ok": True}
@@ -0,0 +1,37 @@
+"""Tests that the async translation service matches the synchronous one."""
+
+import asyncio
+
+import pytest
+
+from app.services.async_translation_service import AsyncTranslationService
+from app.services.translation_service import TranslationService
+
+
+@pytest.mark.parametrize("text", [
+    "Hello, welcome to school",
+    "We have a lot of fun all day",
+    "Thank you Priya",
+    "I love my cats and dogs",
+    "hello hello HELLO",
+    "",
+    "!!!",
+])
+def test_async_translation_matches_sync(
+    translation_service: TranslationService,
+    async_translation_service: AsyncTranslationService,
+    text: str,
+):
+    assert asyncio.run(async_translation_service.translate(text)) == translation_service.translate(text)
+
+
+def test_degraded_translation_matches_sync(
+    translation_service: TranslationService,
+    async_translation_service: AsyncTranslationService,
+):
+    text = "Thank you Priya, we love cats"
+
+    expected = translation_service.translate(text, degraded=True)
+
+    assert asyncio.run(async_translation_service.translate(text, degraded=True)) == expected
+    assert expected.degraded
@@ -0,0 +1,44 @@
+"""Tests for the benchmark runner's statistics and regression gate."""
+
+from benchmarks.run import compare, percentile, run_benchmark
+
+
+def _report(p95_us: float, ops_per_sec: float, name: str = "translation.translate") -> dict:
+    return {
+        "mode": "stand_in",
+        "benchmarks": [{"name": name, "p95_us": p95_us, "ops_per_sec": ops_per_sec}],
+    }
+
+
+def test_percentile_is_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.95) == 95.0
+    assert percentile([7.0], 0.99) == 7.0
+
+
+def test_run_benchmark_reports_medians_over_repeats():
+    calls = []
+
+    result = run_benchmark("noop", calls.append, [1, 2, 3], iterations=10, warmup=2, repeats=3)
+
+    assert len(calls) == 2 + 3 * 10
+    assert result.iterations == 10
+    assert 0 < result.p50_us <= result.p95_us <= result.p99_us
+    assert result.ops_per_sec > 0
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = _report(p95_us=100.0, ops_per_sec=1000.0)
+
+    assert compare(_report(120.0, 900.0), baseline, tolerance=0.25) == []
+    assert len(compare(_report(130.0, 1000.0), baseline, tolerance=0.25)) == 1
+    assert len(compare(_report(100.0, 700.0), baseline, tolerance=0.25)) == 1
+
+
+def test_compare_skips_new_benchmarks_and_other_modes():
+    baseline = _report(p95_us=100.0, ops_per_sec=1000.0)
+
+    assert compare(_report(500.0, 10.0, name="new.benchmark"), baseline, tolerance=0.25) == []
+    assert compare(_report(500.0, 10.0), {**baseline, "mode": "real"}, tolerance=0.25) == []
@@ -0,0 +1,51 @@
+"""Tests for choosing clip renditions from client hints."""
+
+from pathlib import Path
+
+import pytest
+from starlette.datastructures import Headers
+
+from app.api.client_hints import select_rendition
+
+
+@pytest.mark.parametrize("headers, expected", [
+    ({}, None),
+    ({"Save-Data": "on"}, "low"),
+    ({"Save-Data": " ON "}, "low"),
+    ({"Save-Data": "off", "ECT": "4g"}, None),
+    ({"ECT": "slow-2g"}, "low"),
+    ({"ECT": "2g"}, "low"),
+    ({"ECT": "3g"}, "medium"),
+    ({"ECT": "4g", "Downlink": "0.5"}, "low"),
+    ({"Downlink": "0.5"}, "low"),
+    ({"Downlink": "2.5"}, "medium"),
+    ({"Downlink": "10"}, None),
+    ({"Downlink": "fast"}, None),
+    # Save-Data wins over a fast connection
+    ({"Save-Data": "on", "ECT": "4g", "Downlink": "50"}, "low"),
+])
+def test_select_rendition(headers: dict[str, str], expected: str | None):
+    assert select_rendition(Headers(headers=headers)) == expected
+
+
+def test_translations_point_at_the_hinted_rendition(tmp_path: Path, client, serve_clips):
+    for word in ("hello", "cat"):
+        (tmp_path / f"{word}.mp4").write_bytes(bytes(100))
+    (tmp_path / "renditions" / "low").mkdir(parents=True)
+    (tmp_path / "renditions" / "low" / "hello.mp4").write_bytes(bytes(10))
+    serve_clips(tmp_path)
+
+    original = client.post("/api/v1/translate", json={"text": "hello cat"})
+    low = client.post("/api/v1/translate", json={"text": "hello cat"}, headers={"Save-Data": "on"})
+
+    assert [item["url"] for item in original.json()["translations"]] == ["/signs/hello.mp4", "/signs/cat.mp4"]
+    hello, cat = low.json()["translations"]
+    assert (hello["url"], hello["size_bytes"]) == ("/signs/renditions/low/hello.mp4", 10)
+    # Clips without the rendition fall back to the original
+    assert cat["url"] == "/signs/cat.mp4"
+
+
+def test_cacheable_translations_vary_on_the_hints(client):
+    response = client.get("/api/v1/translate", params={"text": "hello"})
+
+    assert {"Save-Data", "ECT", "Downlink"} <= {value.strip() for value in response.headers["vary"].split(",")}
@@ -0,0 +1,65 @@
+"""Tests for clip preload links and cached, byte-range clip serving."""
+
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.responses import preload_links
+from app.api.static import SignClipFiles
+from app.services.translation_service import TranslationService
+
+
+def test_preload_links_list_distinct_clips_in_order(translation_service: TranslationService):
+    result = translation_service.translate("hello cat hello Zed fun")
+
+    assert preload_links(result, 2) == (
+        "</signs/hello.mp4>; rel=preload; as=video, </signs/cat.mp4>; rel=preload; as=video"
+    )
+    assert preload_links(result, 10).count("rel=preload") == 3
+
+
+def test_preload_links_quote_urls_and_skip_clipless_results(translation_service: TranslationService):
+    assert preload_links(translation_service.translate("thank you"), 4) == (
+        "</signs/thank%20you.mp4>; rel=preload; as=video"
+    )
+    assert preload_links(translation_service.translate("Zed xyzzy"), 4) is None
+
+
+def test_translations_send_a_link_header(client):
+    response = client.post("/api/v1/translate", json={"text": "hello"})
+
+    assert response.headers["link"] == "</signs/hello.mp4>; rel=preload; as=video"
+
+
+def _clip_client(directory: Path) -> TestClient:
+    app = FastAPI()
+    app.mount("/signs", SignClipFiles(directory=str(directory), max_age=600), name="signs")
+    return TestClient(app)
+
+
+def test_clips_are_cacheable_and_revalidate(tmp_path: Path):
+    (tmp_path / "hello.mp4").write_bytes(bytes(range(100)))
+    client = _clip_client(tmp_path)
+
+    response = client.get("/signs/hello.mp4")
+    revalidated = client.get("/signs/hello.mp4", headers={"If-None-Match": response.headers["etag"]})
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=600"
+    assert response.headers["accept-ranges"] == "bytes"
+    assert revalidated.status_code == 304
+    assert revalidated.headers["cache-control"] == "public, max-age=600"
+
+
+def test_clips_serve_byte_ranges(tmp_path: Path):
+    (tmp_path / "hello.mp4").write_bytes(bytes(range(100)))
+    client = _clip_client(tmp_path)
+
+    response = client.get("/signs/hello.mp4", headers={"Range": "bytes=10-19"})
+
+    assert response.status_code == 206
+    assert response.content == bytes(range(10, 20))
+    assert response.headers["content-range"] == "bytes 10-19/100"
+    assert response.headers["cache-control"] == "public, max-age=600"
+    assert client.get("/signs/missing.mp4").status_code == 404
@@ -0,0 +1,118 @@
+"""Tests for clip manifests and compact translation responses."""
+
+from pathlib import Path
+
+from app.api.responses import compact_translation_payload
+from app.core.interfaces.video_repository import ClipMetadata
+from app.repositories.video_repository import FileSystemVideoRepository
+from app.services.clip_manifest import ClipManifestService, build_clip_manifest
+from app.services.translation_service import TranslationItem, TranslationService, build_result
+from app.services.vocabulary_registry import LoadedVocabulary
+
+
+class LearningRepository(FileSystemVideoRepository):
+    """Repository that learns clip metadata after listing, as S3 does on download."""
+
+    def __init__(self, videos_directory: Path):
+        super().__init__(videos_directory=videos_directory, base_url="/signs")
+        self._learned: dict[str, ClipMetadata] = {}
+        self._version = 0
+
+    @property
+    def metadata_version(self) -> int:
+        return self._version
+
+    def get_clip_metadata(self, word: str) -> ClipMetadata | None:
+        return self._learned.get(word) or super().get_clip_metadata(word)
+
+    def learn(self, word: str, metadata: ClipMetadata) -> None:
+        self._learned[word] = metadata
+        self._version += 1
+
+
+def loaded(repository: FileSystemVideoRepository, translation_service: TranslationService) -> LoadedVocabulary:
+    return LoadedVocabulary(
+        name="isl",
+        translation_service=translation_service,
+        async_translation_service=None,
+        video_repository=repository,
+        memory_bytes=0,
+        fingerprint="fp",
+    )
+
+
+def test_clips_are_numbered_in_word_order(video_repository: FileSystemVideoRepository):
+    manifest = build_clip_manifest("isl", video_repository)
+
+    words = sorted(video_repository.get_available_words())
+    assert manifest.clip_ids == {word: clip_id for clip_id, word in enumerate(words)}
+    assert manifest.etag == f'"{manifest.version}"'
+    assert build_clip_manifest("isl", video_repository).version == manifest.version
+    assert build_clip_manifest("asl", video_repository).version != manifest.version
+
+
+def test_manifest_is_rebuilt_when_metadata_is_learned(
+    clips_directory: Path, translation_service: TranslationService
+):
+    repository = LearningRepository(clips_directory)
+    vocabulary = loaded(repository, translation_service)
+    manifests = ClipManifestService(max_size=4)
+
+    first = manifests.get(vocabulary)
+    assert manifests.get(vocabulary) is first
+
+    repository.learn("hello", ClipMetadata(size_bytes=10, duration=1.5, frame_rate=25.0, width=640, height=480))
+    second = manifests.get(vocabulary)
+
+    assert second.version != first.version
+    assert manifests.get(vocabulary) is second
+    assert b"1.5" in second.body
+
+
+def test_compact_payload_references_manifest_ids(video_repository: FileSystemVideoRepository):
+    manifest = build_clip_manifest("isl", video_repository)
+    result = build_result("hello ana huh bye", [
+        TranslationItem(original_word="hello", matched_word="hello", type="video", url="/signs/hello.mp4"),
+        TranslationItem(original_word="ana", matched_word=None, type="fingerspell", letters=["A", "N", "A"]),
+        TranslationItem(original_word="huh", matched_word=None, type="skipped"),
+        TranslationItem(original_word="bye", matched_word="bye", type="video", url="/signs/bye.mp4"),
+    ])
+
+    payload = compact_translation_payload(result, manifest)
+
+    assert payload["manifest"] == manifest.version
+    assert payload["items"] == [
+        [0, "hello", manifest.clip_ids["hello"]],
+        [1, "ana"],
+        [2, "huh"],
+        # Clips missing from the manifest are sent by URL
+        [0, "bye", "/signs/bye.mp4"],
+    ]
+    assert payload["stats"]["video_count"] == 2
+
+
+def test_compact_translation_resolves_through_the_manifest(client, serve_clips, clips_directory: Path):
+    serve_clips(clips_directory)
+
+    compact = client.get("/api/v1/translate", params={"text": "hello school", "format": "compact"}).json()
+    manifest = client.get("/api/v1/translate/manifest").json()
+
+    assert compact["manifest"] == manifest["version"]
+    url = manifest["fields"].index("url")
+    assert [manifest["clips"][item[2]][url] for item in compact["items"]] == [
+        "/signs/hello.mp4",
+        "/signs/school.mp4",
+    ]
+
+
+def test_matching_manifest_etag_gets_304(client, serve_clips, clips_directory: Path):
+    serve_clips(clips_directory)
+    first = client.get("/api/v1/translate/manifest")
+
+    revalidated = client.get("/api/v1/translate/manifest", headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.headers["cache-control"].startswith("public")
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == first.headers["etag"]
+    assert revalidated.content == b""
+    assert client.get("/api/v1/translate/manifest", headers={"If-None-Match": '"old"'}).status_code == 200
@@ -0,0 +1,151 @@
+"""Tests for the MP4 box parser and clip metadata in translations."""
+
+import struct
+from pathlib import Path
+
+from app.repositories.clip_probe import probe_clip
+from app.repositories.video_repository import FileSystemVideoRepository
+from app.services.stand_in_services import RuleBasedNerDetector
+from app.services.tiered_matcher import TieredMatcher
+from app.services.translation_service import TranslationService
+
+
+def box(box_type: bytes, payload: bytes = b"") -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def large_box(box_type: bytes, payload: bytes) -> bytes:
+    """Box with a 64-bit size header."""
+    return struct.pack(">I4sQ", 1, box_type, 16 + len(payload)) + payload
+
+
+def mvhd(timescale: int, duration: int, version: int = 0) -> bytes:
+    if version == 1:
+        return box(b"mvhd", bytes([1, 0, 0, 0]) + bytes(16) + struct.pack(">IQ", timescale, duration) + bytes(80))
+    return box(b"mvhd", bytes(4) + bytes(8) + struct.pack(">II", timescale, duration) + bytes(80))
+
+
+def tkhd(width: int, height: int) -> bytes:
+    return box(b"tkhd", bytes(76) + struct.pack(">II", width << 16, height << 16))
+
+
+def mdhd(timescale: int, duration: int) -> bytes:
+    return box(b"mdhd", bytes(4) + bytes(8) + struct.pack(">II", timescale, duration) + bytes(4))
+
+
+def hdlr(handler: bytes) -> bytes:
+    return box(b"hdlr", bytes(4) + bytes(4) + handler + bytes(12))
+
+
+def stts(*entries: tuple[int, int]) -> bytes:
+    payload = bytes(4) + struct.pack(">I", len(entries))
+    for count, delta in entries:
+        payload += struct.pack(">II", count, delta)
+    return box(b"stts", payload)
+
+
+def trak(handler: bytes, width: int, height: int, timescale: int, duration: int, samples: int) -> bytes:
+    stbl = box(b"stbl", stts((samples, duration // samples)))
+    minf = box(b"minf", stbl)
+    mdia = box(b"mdia", mdhd(timescale, duration) + hdlr(handler) + minf)
+    return box(b"trak", tkhd(width, height) + mdia)
+
+
+def mp4(*boxes: bytes) -> bytes:
+    return box(b"ftyp", b"isom" + bytes(4)) + b"".join(boxes)
+
+
+def video_clip() -> bytes:
+    """Two second, 25 fps, 640x480 clip with an audio track listed first."""
+    moov = box(
+        b"moov",
+        mvhd(1000, 2000)
+        + trak(b"soun", 0, 0, 48000, 96000, 94)
+        + trak(b"vide", 640, 480, 12800, 25600, 50),
+    )
+    return mp4(moov, box(b"mdat", bytes(64)))
+
+
+def test_probe_reads_duration_frame_rate_and_resolution(tmp_path: Path):
+    path = tmp_path / "hello.mp4"
+    path.write_bytes(video_clip())
+
+    metadata = probe_clip(path)
+
+    assert metadata.size_bytes == path.stat().st_size
+    assert metadata.duration == 2.0
+    assert metadata.frame_rate == 25.0
+    assert (metadata.width, metadata.height) == (640, 480)
+
+
+def test_probe_finds_moov_after_mdat_and_64_bit_sizes(tmp_path: Path):
+    moov = box(b"moov", mvhd(600, 900, version=1) + trak(b"vide", 320, 240, 30000, 45000, 45))
+    path = tmp_path / "hello.mp4"
+    path.write_bytes(mp4(large_box(b"mdat", bytes(128)), moov))
+
+    metadata = probe_clip(path)
+
+    assert metadata.duration == 1.5
+    assert metadata.frame_rate == 30.0
+    assert (metadata.width, metadata.height) == (320, 240)
+
+
+def test_probe_without_video_track_reports_duration_only(tmp_path: Path):
+    path = tmp_path / "hello.mp4"
+    path.write_bytes(mp4(box(b"moov", mvhd(1000, 1500) + trak(b"soun", 0, 0, 48000, 72000, 70))))
+
+    metadata = probe_clip(path)
+
+    assert metadata.duration == 1.5
+    assert metadata.frame_rate is None
+    assert metadata.width is None
+
+
+def test_probe_of_unparseable_files_reports_size_only(tmp_path: Path):
+    empty = tmp_path / "empty.mp4"
+    empty.write_bytes(b"")
+    truncated = tmp_path / "truncated.mp4"
+    truncated.write_bytes(video_clip()[:40])
+    garbage = tmp_path / "garbage.mp4"
+    garbage.write_bytes(mp4(box(b"moov", box(b"mvhd", b"\x00"))))
+
+    assert probe_clip(empty).size_bytes == 0
+    assert probe_clip(truncated).duration is None
+    assert probe_clip(truncated).size_bytes == 40
+    assert probe_clip(garbage).duration is None
+    assert probe_clip(tmp_path / "missing.mp4") is None
+
+
+def test_probe_of_lfs_pointer_reports_object_size(tmp_path: Path):
+    path = tmp_path / "hello.mp4"
+    path.write_text(
+        "version https://git-lfs.github.com/spec/v1\n"
+        "oid sha256:0123456789abcdef\n"
+        "size 123456\n",
+        encoding="utf-8",
+    )
+
+    metadata = probe_clip(path)
+
+    assert metadata.size_bytes == 123456
+    assert metadata.duration is None
+
+
+def test_translation_items_carry_clip_metadata(tmp_path: Path):
+    (tmp_path / "hello.mp4").write_bytes(video_clip())
+    (tmp_path / "welcome.mp4").write_bytes(video_clip())
+    repository = FileSystemVideoRepository(videos_directory=tmp_path, base_url="/signs")
+    service = TranslationService(
+        embedding_matcher=TieredMatcher.from_vocabulary(repository.get_available_words(), fallback=None),
+        ner_detector=RuleBasedNerDetector(),
+        video_repository=repository,
+    )
+
+    result = service.translate("hello welcome")
+
+    item = result.items[0]
+    assert item.duration == 2.0
+    assert item.frame_rate == 25.0
+    assert (item.width, item.height) == (640, 480)
+    assert item.size_bytes == len(video_clip())
+    assert result.total_duration == 4.0
@@ -0,0 +1,89 @@
+"""Tests for long-document translation."""
+
+import asyncio
+import re
+
+import nltk.tokenize
+import pytest
+
+from app.core.metrics import begin_request_timings
+from app.services.document_service import DocumentChunkResult, DocumentTranslationService
+from app.services.translation_service import TranslationService
+
+
+class _SentenceTokenizer:
+    """Splits after '.', standing in for punkt (whose data may not be installed)."""
+
+    def __init__(self, language: str):
+        pass
+
+    def span_tokenize(self, text: str):
+        for match in re.finditer(r"[^.]+\.?", text):
+            start = match.start() + len(match.group()) - len(match.group().lstrip())
+            if start < match.end():
+                yield start, match.end()
+
+
+@pytest.fixture
+def document_service(monkeypatch, translation_service: TranslationService):
+    monkeypatch.setattr(nltk.tokenize, "PunktTokenizer", _SentenceTokenizer)
+    service = DocumentTranslationService(
+        translation_service, max_workers=2, chunk_sentences=2, chunk_max_chars=40, max_in_flight=2
+    )
+    yield service
+    service.shutdown()
+
+
+async def collect(document_service: DocumentTranslationService, text: str) -> list[DocumentChunkResult]:
+    return [result async for result in document_service.translate_stream(text)]
+
+
+def test_chunks_respect_sentence_and_character_limits(document_service: DocumentTranslationService):
+    text = "Hello cat. We run. Welcome to school. " + "A" * 50 + ". Fun."
+
+    chunks = list(document_service.iter_chunks(text))
+
+    assert [chunk.sentences for chunk in chunks] == [
+        ["Hello cat.", "We run."],
+        ["Welcome to school."],
+        ["A" * 50 + "."],
+        ["Fun."],
+    ]
+    assert [chunk.index for chunk in chunks] == [0, 1, 2, 3]
+    for chunk in chunks:
+        assert text[chunk.start:chunk.end].startswith(chunk.sentences[0])
+        assert text[chunk.start:chunk.end].endswith(chunk.sentences[-1])
+
+
+def test_stream_yields_chunks_in_document_order(
+    document_service: DocumentTranslationService,
+    translation_service: TranslationService,
+):
+    sentences = [f"Hello cat {idx}." for idx in range(20)]
+
+    results = asyncio.run(collect(document_service, " ".join(sentences)))
+
+    assert [result.chunk.index for result in results] == list(range(10))
+    translated = [sentence for result in results for sentence in result.sentences]
+    assert [result.original_text for result in translated] == sentences
+    assert translated[0].items == translation_service.translate(sentences[0]).items
+
+
+def test_chunk_stage_timings_reach_the_request(document_service: DocumentTranslationService):
+    async def translate() -> dict[str, float]:
+        timings = begin_request_timings()
+        await collect(document_service, "Hello cat. We run. Welcome to school.")
+        return timings
+
+    assert "tokenize" in asyncio.run(translate())
+
+
+def test_punkt_splits_abbreviations(translation_service: TranslationService):
+    try:
+        service = DocumentTranslationService(translation_service, max_workers=1)
+    except LookupError:
+        pytest.skip("NLTK punkt data is not installed")
+
+    chunk, = service.iter_chunks("Dr. Smith went home. He slept.")
+    assert chunk.sentences == ["Dr. Smith went home.", "He slept."]
+    service.shutdown()
@@ -0,0 +1,71 @@
+"""Tests for ETags and 304 revalidation of cacheable translations."""
+
+from pathlib import Path
+
+import pytest
+
+from app.api.responses import etag_matches, strong_etag
+
+
+def test_strong_etag_depends_on_every_part():
+    etag = strong_etag("isl", "fp", "", "hello")
+
+    assert etag == strong_etag("isl", "fp", "", "hello")
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag != strong_etag("isl", "fp", "low", "hello")
+    # Parts are delimited, not concatenated
+    assert strong_etag("ab", "c") != strong_etag("a", "bc")
+
+
+@pytest.mark.parametrize("if_none_match, expected", [
+    (None, False),
+    ("", False),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"xyz", "abc"', True),
+    ('"xyz"', False),
+    ("*", True),
+])
+def test_etag_matches(if_none_match, expected):
+    assert etag_matches(if_none_match, '"abc"') is expected
+
+
+def test_matching_if_none_match_gets_304(client):
+    first = client.get("/api/v1/translate", params={"text": "hello  world"})
+    etag = first.headers["etag"]
+
+    revalidated = client.get(
+        "/api/v1/translate", params={"text": "hello world"}, headers={"If-None-Match": etag}
+    )
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"].startswith("public")
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert revalidated.content == b""
+
+
+def test_formats_have_different_etags(client):
+    full = client.get("/api/v1/translate", params={"text": "hello"})
+    compact = client.get("/api/v1/translate", params={"text": "hello", "format": "compact"})
+
+    assert full.headers["etag"] != compact.headers["etag"]
+
+
+def test_reencoded_clips_change_the_etag(tmp_path: Path, client, serve_clips):
+    clip = tmp_path / "hello.mp4"
+    clip.write_bytes(bytes(100))
+    serve_clips(tmp_path)
+    before = client.get("/api/v1/translate", params={"text": "hello"})
+
+    # Same words after a restart, new encoding: bodies carry the new size
+    clip.write_bytes(bytes(50))
+    serve_clips(tmp_path)
+    after = client.get(
+        "/api/v1/translate", params={"text": "hello"}, headers={"If-None-Match": before.headers["etag"]}
+    )
+
+    assert before.json()["translations"][0]["size_bytes"] == 100
+    assert after.status_code == 200
+    assert after.json()["translations"][0]["size_bytes"] == 50
+    assert after.headers["etag"] != before.headers["etag"]
@@ -0,0 +1,169 @@
+"""Tests for incremental as-you-type translation."""
+
+from contextlib import suppress
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import WebSocketRoute
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+from app.api.admission import AdmissionControlMiddleware
+from app.services.incremental_translation import IncrementalTranslationSession
+from app.services.translation_service import TranslationService
+
+
+def _summary(items) -> list[tuple]:
+    return [(item.original_word, item.type, item.matched_word) for item in items]
+
+
+def test_first_update_translates_everything(translation_service: TranslationService):
+    session = IncrementalTranslationSession(translation_service)
+
+    diff = session.update("hello cat")
+
+    assert (diff.version, diff.start, diff.delete_count) == (1, 0, 0)
+    assert _summary(diff.items) == [("hello", "video", "hello"), ("cat", "video", "cat")]
+
+
+def test_edit_replaces_only_the_changed_span(translation_service: TranslationService):
+    session = IncrementalTranslationSession(translation_service)
+    session.update("hello cat school")
+
+    diff = session.update("hello cats run school")
+
+    assert (diff.start, diff.delete_count) == (1, 1)
+    assert _summary(diff.items) == [("cats", "video", "cat"), ("run", "video", "run")]
+    assert diff.ner_reused
+
+
+def test_unchanged_text_gives_empty_diff(translation_service: TranslationService):
+    session = IncrementalTranslationSession(translation_service)
+    session.update("hello cat")
+
+    diff = session.update("hello  cat!")
+
+    assert diff.is_empty
+    assert diff.version == 2
+
+
+def test_capitalized_insert_reruns_ner(translation_service: TranslationService):
+    session = IncrementalTranslationSession(translation_service)
+    session.update("hello")
+
+    diff = session.update("hello Zorblax")
+
+    assert not diff.ner_reused
+    assert _summary(diff.items) == [("Zorblax", "fingerspell", None)]
+
+
+@pytest.mark.parametrize("edits", [
+    ["hello", "hello cat", "hello cat run", "hello run", ""],
+    ["welcome to school", "welcome Zed to school", "welcome Zed Quux to school", "welcome to school"],
+    ["we love cats", "We love cats", "we love cats Bob", "we Bob love cats"],
+    ["have fun all", "have fun all day", "have a lot of fun all day", "have a of fun all day"],
+])
+def test_session_matches_full_translation(translation_service: TranslationService, edits: list[str]):
+    session = IncrementalTranslationSession(translation_service)
+    items = []
+
+    for text in edits:
+        diff = session.update(text)
+        items[diff.start:diff.start + diff.delete_count] = diff.items
+        assert _summary(items) == _summary(translation_service.translate(text).items)
+        assert _summary(diff.result.items) == _summary(items)
+
+
+def test_typing_completes_phrase_signs(translation_service: TranslationService):
+    session = IncrementalTranslationSession(translation_service)
+    items = []
+    text = ""
+
+    for word in "we had a lot of fun all day".split():
+        text = f"{text} {word}".strip()
+        diff = session.update(text)
+        items[diff.start:diff.start + diff.delete_count] = diff.items
+
+    assert _summary(items) == _summary(translation_service.translate(text).items)
+    assert ("a lot", "video", "a lot") in _summary(items)
+    assert ("all day", "video", "all day") in _summary(items)
+    # Typing "day" replaced the single-word "all" with the phrase
+    assert (diff.start, diff.delete_count) == (len(items) - 1, 1)
+
+
+def test_edit_matches_only_the_phrase_candidates_it_overlaps(
+    monkeypatch: pytest.MonkeyPatch, translation_service: TranslationService
+):
+    session = IncrementalTranslationSession(translation_service)
+    session.update("we have a lot of fun all day")
+    windows = []
+    find_spans = translation_service.find_phrase_spans
+
+    def record(tokens, start, end):
+        windows.append((start, end))
+        return find_spans(tokens, start, end)
+
+    monkeypatch.setattr(translation_service, "find_phrase_spans", record)
+    monkeypatch.setattr(translation_service, "find_phrases_batch", None)
+    translated = []
+    translate_words = translation_service.translate_words
+
+    def record_words(words, *args):
+        translated.append(words)
+        return translate_words(words, *args)
+
+    monkeypatch.setattr(translation_service, "translate_words", record_words)
+
+    diff = session.update("we have a lot of cat fun all day")
+
+    assert windows == [(5, 6)]
+    # Only the inserted word is translated again; the phrases around it are reused
+    assert translated == [["cat"]]
+    assert (diff.start, diff.delete_count) == (4, 0)
+    assert _summary(diff.items) == [("cat", "video", "cat")]
+
+
+def test_websocket_reports_invalid_frames_and_keeps_going(client):
+    with client.websocket_connect("/api/v1/translate/ws") as websocket:
+        websocket.send_text("not json")
+        assert websocket.receive_json() == {"type": "error", "detail": "Invalid JSON message"}
+
+        websocket.send_bytes(b'{"text": "hello"}')
+        assert websocket.receive_json()["type"] == "error"
+
+        websocket.send_json({"text": 5})
+        assert websocket.receive_json()["type"] == "error"
+
+        websocket.send_json({"text": "hello"})
+        message = websocket.receive_json()
+        assert message["type"] == "diff"
+        assert message["translations"][0]["matched_word"] == "hello"
+
+
+def test_websocket_unknown_vocabulary(client):
+    with client.websocket_connect("/api/v1/translate/ws?vocabulary=nope") as websocket:
+        assert websocket.receive_json()["type"] == "error"
+
+
+def test_admission_gates_websocket_messages():
+    async def echo_in_flight(websocket: WebSocket) -> None:
+        await websocket.accept()
+        with suppress(WebSocketDisconnect):
+            while True:
+                text = await websocket.receive_text()
+                await websocket.send_text(f"{text}:{middleware._gate._in_flight}")
+
+    middleware = AdmissionControlMiddleware(
+        Starlette(routes=[WebSocketRoute("/translate/ws", echo_in_flight)]),
+        path_prefix="/translate", max_concurrent=1, max_queue=0,
+        deadline_seconds=1.0, rate_per_second=1000.0, burst=1,
+    )
+
+    with TestClient(middleware) as client:
+        with client.websocket_connect("/translate/ws") as websocket:
+            for text in ("a", "b", "c"):
+                websocket.send_text(text)
+                # A slot is held while the handler works on a message
+                assert websocket.receive_text() == f"{text}:1"
+
+    assert middleware._gate._in_flight == 0
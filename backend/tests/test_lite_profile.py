@@ -0,0 +1,48 @@
+"""Tests that the lite profile never imports the model libraries."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIRECTORY = Path(__file__).resolve().parent.parent
+
+# Start the app, translate once and report which model libraries got imported
+_PROBE = """
+import json, sys
+from fastapi.testclient import TestClient
+from app.main import app
+
+with TestClient(app) as client:
+    response = client.post("/api/v1/translate", json={"text": "hello friends"})
+    response.raise_for_status()
+
+heavy = ("torch", "sentence_transformers", "spacy", "transformers", "nltk", "scipy", "sklearn")
+print(json.dumps(sorted(name for name in heavy if name in sys.modules)))
+"""
+
+
+def test_lite_profile_imports_no_models():
+    env = {**os.environ, "SERVICE_PROFILE": "lite"}
+
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=BACKEND_DIRECTORY,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+
+    assert json.loads(completed.stdout.strip().splitlines()[-1]) == []
+
+
+def test_lite_profile_skips_words_no_tier_resolves(client):
+    response = client.post("/api/v1/translate", json={"text": "hello xylophonist"})
+
+    assert response.status_code == 200
+    hello, unknown = response.json()["translations"]
+    assert (hello["type"], hello["matched_word"]) == ("video", "hello")
+    assert unknown["type"] == "skipped"
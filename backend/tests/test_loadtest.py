@@ -0,0 +1,42 @@
+"""Tests for the load-test harness."""
+
+import subprocess
+
+import pytest
+
+from benchmarks import loadtest
+
+
+class _RecordingPopen:
+    def __init__(self, args, cwd, env):
+        self.env = env
+
+
+@pytest.mark.parametrize("caches, disabled", [("cold", True), ("warm", False)])
+def test_spawned_server_cache_mode(monkeypatch, caches: str, disabled: bool):
+    monkeypatch.setattr(subprocess, "Popen", _RecordingPopen)
+    # Set for the test process by conftest
+    monkeypatch.delenv("CACHE_MATCH_SIZE", raising=False)
+    monkeypatch.delenv("CACHE_SENTENCE_SIZE", raising=False)
+
+    env = loadtest.spawn_server(7999, caches).env
+
+    assert env["SERVICE_PROFILE"] == "stand_in"
+    assert env["CACHE_SNAPSHOT_ENABLED"] == "false"
+    assert (env.get("CACHE_MATCH_SIZE") == "0") is disabled
+    assert (env.get("CACHE_SENTENCE_SIZE") == "0") is disabled
+
+
+def test_endpoint_stats_summary():
+    stats = loadtest.EndpointStats()
+    for latency in range(1, 101):
+        stats.record(float(latency), 200)
+    stats.record(5.0, 503)
+    stats.record(5.0, None)
+
+    summary = stats.summary(elapsed=2.0)
+
+    assert summary["requests"] == 102
+    assert summary["throughput_rps"] == 51.0
+    assert stats.statuses == {"200": 100, "503": 1, "error": 1}
+    assert summary["error_rate"] == pytest.approx(2 / 102, abs=1e-4)
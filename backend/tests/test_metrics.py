@@ -0,0 +1,81 @@
+"""Tests for pipeline metrics, stage timings and the Server-Timing header."""
+
+import asyncio
+
+import pytest
+
+from app.api.middleware import format_server_timing
+from app.core.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    begin_request_timings,
+    get_request_timings,
+    record_stage,
+)
+
+
+def test_counter_and_gauge_render_per_label_set():
+    counter = Counter("test_total", "Test counter", ("kind",))
+    counter.inc(kind="a")
+    counter.inc(2, kind="a")
+    counter.inc(kind='say "hi"')
+    gauge = Gauge("test_gauge", "Test gauge")
+    gauge.set(1.5)
+
+    assert counter.get(kind="a") == 3
+    assert counter.render() == [
+        "# HELP test_total Test counter",
+        "# TYPE test_total counter",
+        'test_total{kind="a"} 3',
+        'test_total{kind="say \\"hi\\""} 1',
+    ]
+    assert gauge.render()[-1] == "test_gauge 1.5"
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("test_seconds", "Test histogram", ("stage",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value, stage="ner")
+
+    assert histogram.render()[2:] == [
+        'test_seconds_bucket{stage="ner",le="0.1"} 1',
+        'test_seconds_bucket{stage="ner",le="1"} 3',
+        'test_seconds_bucket{stage="ner",le="+Inf"} 4',
+        'test_seconds_sum{stage="ner"} 4.05',
+        'test_seconds_count{stage="ner"} 4',
+    ]
+
+
+def test_stage_timings_accumulate_per_request():
+    timings = begin_request_timings()
+    record_stage("lookup", 0.002)
+    record_stage("lookup", 0.003)
+
+    assert get_request_timings() is timings
+    assert timings == {"lookup": 0.005}
+    assert format_server_timing(timings, 0.01) == "lookup;dur=5.000, total;dur=10.000"
+
+
+def test_stage_timings_from_worker_threads_are_not_lost():
+    def record_many() -> None:
+        for _ in range(2000):
+            record_stage("lookup", 0.001)
+
+    async def scenario() -> dict[str, float]:
+        timings = begin_request_timings()
+        await asyncio.gather(*(asyncio.to_thread(record_many) for _ in range(8)))
+        return timings
+
+    assert asyncio.run(scenario())["lookup"] == pytest.approx(16.0)
+
+
+def test_responses_carry_server_timing_and_metrics_are_exposed(client):
+    response = client.post("/api/v1/translate", json={"text": "hello world"})
+
+    assert "total;dur=" in response.headers["server-timing"]
+    assert "tokenize;dur=" in response.headers["server-timing"]
+
+    metrics = client.get("/metrics").text
+    assert 'translation_stage_seconds_count{stage="tokenize"}' in metrics
+    assert 'http_request_duration_seconds_count{method="POST",route="translate_text",status="200"}' in metrics
@@ -0,0 +1,70 @@
+"""Tests for phrase sign matching and overlap resolution."""
+
+import pytest
+
+from app.core.interfaces.phrase_matcher import PhraseMatch
+from app.services.phrase_matcher import PhraseMatcher
+
+VOCABULARY = ["thank you", "a lot", "all day", "wake up", "ice cream", "ice", "fall in love", "in love"]
+
+
+def span(start: int, end: int, similarity: float = 1.0, phrase: str = "p") -> PhraseMatch:
+    return PhraseMatch(start, end, phrase, similarity, "exact")
+
+
+@pytest.mark.parametrize("length, matches, expected", [
+    (3, [], []),
+    # Disjoint matches are all kept, in text order
+    (6, [span(4, 6), span(0, 2)], [span(0, 2), span(4, 6)]),
+    # The longer of two overlapping matches covers more tokens
+    (4, [span(0, 2), span(0, 3)], [span(0, 3)]),
+    # Two short matches beat one long match they overlap
+    (4, [span(0, 2), span(1, 3), span(2, 4)], [span(0, 2), span(2, 4)]),
+    # Coverage is weighted by similarity
+    (3, [span(0, 3, 0.6), span(0, 2, 1.0)], [span(0, 2, 1.0)]),
+    (3, [span(0, 3, 0.9), span(0, 2, 1.0)], [span(0, 3, 0.9)]),
+    # Not greedy from the left: the later, longer match wins
+    (5, [span(0, 2), span(1, 5)], [span(1, 5)]),
+])
+def test_resolve(length: int, matches: list[PhraseMatch], expected: list[PhraseMatch]):
+    assert PhraseMatcher.resolve(length, matches) == expected
+
+
+def test_exact_and_stem_phrase_matches():
+    matcher = PhraseMatcher(VOCABULARY)
+
+    exact, stem = matcher.find_phrases_batch([
+        "we had a lot of fun all day".split(),
+        "she wakes up and falls in love".split(),
+    ])
+
+    assert [(match.phrase, match.start, match.end, match.tier) for match in exact] == [
+        ("a lot", 2, 4, "exact"), ("all day", 6, 8, "exact"),
+    ]
+    assert [(match.phrase, match.tier) for match in stem] == [("wake up", "stem"), ("fall in love", "stem")]
+
+
+def test_derived_words_are_not_stem_matches():
+    matcher = PhraseMatcher(VOCABULARY)
+
+    assert matcher.find_phrases("wakeful up".split()) == []
+    assert [match.phrase for match in matcher.find_phrases("waking up".split())] == ["wake up"]
+
+
+def test_single_words_and_cased_tokens():
+    matcher = PhraseMatcher(VOCABULARY)
+
+    assert matcher.phrase_count == 7
+    assert matcher.find_phrases(["ice"]) == []
+    assert [match.phrase for match in matcher.find_phrases(["Thank", "You"])] == ["thank you"]
+
+
+def test_find_spans_matches_candidates_overlapping_a_window():
+    matcher = PhraseMatcher(VOCABULARY)
+    tokens = "thank you a lot all day".split()
+
+    assert [(match.start, match.end) for match in matcher.find_spans(tokens, 2, 3)] == [(2, 4)]
+    # An empty window gives the spans crossing its position
+    assert [match.phrase for match in matcher.find_spans(tokens, 4, 4)] == []
+    assert [match.phrase for match in matcher.find_spans(tokens, 1, 1)] == ["thank you"]
+    assert matcher.resolve(len(tokens), matcher.find_spans(tokens, 0, len(tokens))) == matcher.find_phrases(tokens)
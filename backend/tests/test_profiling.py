@@ -0,0 +1,109 @@
+"""Tests for sampled request profiling."""
+
+import asyncio
+import hashlib
+import json
+import pstats
+from pathlib import Path
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.api.middleware import ProfilingMiddleware, _text_hash
+from app.core.profiling import begin_request_profile, profiled_call
+from app.services.async_translation_service import AsyncTranslationService
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _reverse(text: str) -> str:
+    return text[::-1]
+
+
+def _profiled_app(directory: Path, **options) -> TestClient:
+    async def reverse(request: Request) -> PlainTextResponse:
+        text = (await request.body()).decode()
+        return PlainTextResponse(await asyncio.to_thread(profiled_call, _reverse, text))
+
+    async def echo(request: Request) -> PlainTextResponse:
+        return PlainTextResponse((await request.body()).decode())
+
+    app = Starlette(routes=[
+        Route("/translate", reverse, methods=["GET", "POST"]),
+        Route("/echo", echo, methods=["POST"]),
+    ])
+    return TestClient(ProfilingMiddleware(app, directory=directory, **options))
+
+
+def test_text_hash_prefers_the_text_field():
+    assert _text_hash({}, b'{"text": "secret words"}') == _sha256("secret words")
+    assert _text_hash({"query_string": b"text=secret%20words"}, b"") == _sha256("secret words")
+    assert _text_hash({}, b"raw body") == hashlib.sha256(b"raw body").hexdigest()
+
+
+def test_token_forces_a_profile_without_storing_the_text(tmp_path: Path):
+    client = _profiled_app(tmp_path, sample_rate=0.0, header_token="let-me-in")
+
+    assert "x-profile-id" not in client.post("/translate", json={"text": "private"}).headers
+    response = client.post(
+        "/translate", json={"text": "private"}, headers={"X-Profile-Token": "let-me-in"}
+    )
+
+    profile_id = response.headers["x-profile-id"]
+    assert (tmp_path / f"{profile_id}.prof").is_file()
+    metadata = json.loads((tmp_path / f"{profile_id}.json").read_text())
+    assert metadata["text_sha256"] == _sha256("private")
+    assert metadata["status"] == 200
+    assert metadata["profiled_calls"] == 1
+    assert "private" not in (tmp_path / f"{profile_id}.json").read_text()
+
+
+def test_oldest_profiles_are_pruned(tmp_path: Path):
+    client = _profiled_app(tmp_path, sample_rate=1.0, max_files=2)
+
+    for _ in range(4):
+        client.get("/translate", params={"text": "hello"})
+
+    assert len(list(tmp_path.glob("*.prof"))) == 2
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+
+def _functions(stats: pstats.Stats) -> set[str]:
+    return {function for _, _, function in stats.stats}
+
+
+def test_profile_covers_calls_in_worker_threads(tmp_path: Path):
+    client = _profiled_app(tmp_path, sample_rate=1.0)
+
+    response = client.post("/translate", content=b"hello")
+
+    assert response.text == "olleh"
+    stats = pstats.Stats(str(tmp_path / f"{response.headers['x-profile-id']}.prof"))
+    assert "_reverse" in _functions(stats)
+
+
+def test_requests_without_profiled_calls_get_the_sidecar_only(tmp_path: Path):
+    client = _profiled_app(tmp_path, sample_rate=1.0)
+
+    profile_id = client.post("/echo", content=b"hello").headers["x-profile-id"]
+
+    assert not (tmp_path / f"{profile_id}.prof").exists()
+    assert json.loads((tmp_path / f"{profile_id}.json").read_text())["profiled_calls"] == 0
+
+
+def test_profile_of_a_translation_has_the_service_frames(async_translation_service: AsyncTranslationService):
+    async def translate():
+        profile = begin_request_profile()
+        await async_translation_service.translate("Hello Priya, thank you")
+        return profile
+
+    profile = asyncio.run(translate())
+
+    functions = _functions(profile.stats())
+    assert {"find_best_matches", "get_entity_words", "find_phrases", "find_video"} <= functions
+    assert profile.call_count >= 4
@@ -0,0 +1,49 @@
+"""Tests for direct JSON serialization of translation responses."""
+
+import orjson
+
+from app.api.responses import build_stats, dumps, json_response, translation_payload
+from app.schemas.translation import TranslationItemSchema, TranslationResponse
+from app.services.translation_service import TranslationService
+
+
+def test_payload_matches_the_response_schema(translation_service: TranslationService):
+    result = translation_service.translate("hello Zed, welcome xyzzy")
+
+    body = orjson.loads(dumps(translation_payload(result)))
+
+    assert TranslationResponse.model_validate(body).model_dump() == body
+    assert [item["type"] for item in body["translations"]] == ["video", "fingerspell", "video", "skipped"]
+    assert body["stats"] == {
+        "video_count": 2,
+        "fingerspell_count": 1,
+        "skipped_count": 1,
+        "total": 4,
+        "total_duration": result.total_duration,
+    }
+
+
+def test_items_serialize_in_schema_field_order(translation_service: TranslationService):
+    result = translation_service.translate("hello")
+
+    item = orjson.loads(dumps(translation_payload(result)))["translations"][0]
+
+    assert list(item) == list(TranslationItemSchema.model_fields)
+
+
+def test_json_response(translation_service: TranslationService):
+    result = translation_service.translate("hello")
+
+    response = json_response(translation_payload(result), headers={"X-Test": "1"})
+
+    assert response.media_type == "application/json"
+    assert response.headers["x-test"] == "1"
+    assert orjson.loads(response.body)["stats"] == build_stats(result)
+
+
+def test_translate_route_body(client):
+    body = client.post("/api/v1/translate", json={"text": "hello"}).json()
+
+    assert body["success"] is True
+    assert body["translations"][0]["url"] == "/signs/hello.mp4"
+    TranslationResponse.model_validate(body)
@@ -0,0 +1,154 @@
+"""Tests for subtitle parsing, sign scheduling and the sign track CLI."""
+
+import io
+
+import orjson
+import pytest
+
+from app.cli import subtitles
+from app.cli.subtitles import (
+    Cue,
+    format_chunk,
+    iter_chunks,
+    iter_cues,
+    natural_duration,
+    schedule_signs,
+    translate_subtitles,
+)
+from app.services.translation_service import TranslationItem, TranslationService, build_result
+
+SRT = """1
+00:00:01,000 --> 00:00:03,500
+<i>Hello</i> &amp; welcome
+
+2
+00:01:02,25 --> 00:01:04,000
+to school
+
+"""
+
+VTT = """WEBVTT - Lesson one
+
+NOTE written by hand,
+spanning two lines
+
+STYLE
+::cue { color: yellow }
+
+intro
+00:01.500 --> 00:03.000 align:start position:10%
+<v Teacher>{\\an8}We have
+fun   all day
+"""
+
+
+def video(word: str, duration: float | None = None) -> TranslationItem:
+    return TranslationItem(original_word=word, matched_word=word, type="video", url=f"/signs/{word}.mp4", duration=duration)
+
+
+def fingerspell(word: str) -> TranslationItem:
+    return TranslationItem(original_word=word, matched_word=None, type="fingerspell", letters=list(word.upper()))
+
+
+def skipped(word: str) -> TranslationItem:
+    return TranslationItem(original_word=word, matched_word=None, type="skipped")
+
+
+def test_srt_cues_are_parsed_without_markup():
+    cues = list(iter_cues(io.StringIO(SRT)))
+
+    assert cues == [
+        Cue(index=0, start=1.0, end=3.5, text="Hello & welcome"),
+        Cue(index=1, start=62.25, end=64.0, text="to school"),
+    ]
+
+
+def test_webvtt_headers_notes_and_styles_are_not_cues():
+    cues = list(iter_cues(VTT.splitlines(keepends=True)))
+
+    # Cue identifiers and settings are dropped, hours are optional
+    assert cues == [Cue(index=0, start=1.5, end=3.0, text="We have fun all day")]
+
+
+def test_cues_with_crlf_and_without_a_trailing_blank_line():
+    lines = ["1\r\n", "00:00:00,500 --> 00:00:01,000\r\n", "hello\r\n"]
+
+    assert list(iter_cues(lines)) == [Cue(index=0, start=0.5, end=1.0, text="hello")]
+
+
+def test_chunks_keep_order_and_size():
+    chunks = list(iter_chunks(range(7), 3))
+
+    assert chunks == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(iter_chunks([], 3)) == []
+
+
+def test_natural_duration():
+    assert natural_duration(video("hello", 1.6)) == 1.6
+    assert natural_duration(video("hello")) == subtitles.DEFAULT_SIGN_SECONDS
+    assert natural_duration(fingerspell("ana")) == pytest.approx(3 * subtitles.FINGERSPELL_LETTER_SECONDS)
+
+
+def test_signs_fitting_the_cue_play_at_normal_speed():
+    cue = Cue(index=0, start=10.0, end=15.0, text="hello ana huh")
+    result = build_result(cue.text, [video("hello", 2.0), fingerspell("ana"), skipped("huh")])
+
+    signs = schedule_signs(cue, result)
+
+    assert [(sign["start"], sign["end"], sign["speed"]) for sign in signs] == [
+        (10.0, 12.0, 1.0),
+        (12.0, 12.9, 1.0),
+    ]
+    assert signs[1]["word"] == "ana"
+    assert signs[1]["letters"] == ["A", "N", "A"]
+
+
+def test_signs_are_sped_up_to_fit_the_cue():
+    cue = Cue(index=0, start=0.0, end=2.0, text="hello welcome")
+    result = build_result(cue.text, [video("hello", 2.0), video("welcome", 2.0)])
+
+    signs = schedule_signs(cue, result)
+
+    assert [(sign["start"], sign["end"]) for sign in signs] == [(0.0, 1.0), (1.0, 2.0)]
+    assert {sign["speed"] for sign in signs} == {2.0}
+
+
+def test_signs_of_an_empty_cue_window_keep_their_speed():
+    cue = Cue(index=0, start=5.0, end=5.0, text="hello")
+
+    signs = schedule_signs(cue, build_result(cue.text, [video("hello", 1.0)]))
+
+    assert signs[0]["speed"] == 1.0
+    assert signs[0]["end"] == 6.0
+
+
+def test_format_chunk_renders_one_line_per_cue_or_sign():
+    cues = [Cue(index=3, start=0.0, end=4.0, text="hello huh")]
+    results = [build_result("hello huh", [video("hello", 1.0), skipped("huh")])]
+
+    (cue_line,) = format_chunk(cues, results, "cues").splitlines()
+    (sign_line,) = format_chunk(cues, results, "signs").splitlines()
+
+    cue_event = orjson.loads(cue_line)
+    assert cue_event["cue"] == 3
+    assert cue_event["skipped_count"] == 1
+    assert cue_event["signs"][0]["url"] == "/signs/hello.mp4"
+    assert orjson.loads(sign_line) == {"cue": 3, **cue_event["signs"][0]}
+
+
+def test_translate_subtitles_in_process(monkeypatch: pytest.MonkeyPatch, translation_service: TranslationService):
+    monkeypatch.setattr(subtitles, "_service", None)
+
+    def init_worker(vocabulary: str | None, single_threaded: bool) -> None:
+        subtitles._service = translation_service
+
+    monkeypatch.setattr(subtitles, "_init_worker", init_worker)
+    output = io.BytesIO()
+
+    count = translate_subtitles(io.StringIO(SRT), output, "cues", workers=1, chunk_cues=1)
+
+    events = [orjson.loads(line) for line in output.getvalue().splitlines()]
+    assert count == 2
+    assert [event["cue"] for event in events] == [0, 1]
+    assert [sign["word"] for sign in events[0]["signs"]] == ["hello", "welcome"]
+    assert [sign["word"] for sign in events[1]["signs"]] == ["to", "school"]
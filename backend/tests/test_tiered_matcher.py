@@ -0,0 +1,188 @@
+"""Tests for the tiered matcher and its lookup tiers."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from app.core.interfaces.embedding_matcher import MatchResult
+from app.core.interfaces.video_repository import VideoLookupResult
+from app.services.stand_in_services import HashingEmbeddingMatcher
+from app.services.tiered_matcher import (
+    StemTier,
+    TieredMatcher,
+    TypoTier,
+    _osa_distance,
+    inflected_forms,
+    load_lexicon,
+)
+from app.services.translation_service import word_item
+
+VOCABULARY = [
+    "animal", "general", "university", "organize", "community", "run", "cat",
+    "make", "cry", "study", "hope", "hop", "stop", "go", "box", "walk", "see",
+    "agree", "die", "eye", "visit", "open", "rain", "shop", "she", "be", "a",
+    "thank you",
+]
+
+
+@pytest.mark.parametrize("base, expected", [
+    ("cat", {"cats", "catted", "catting"}),
+    ("make", {"makes", "making", "maked"}),
+    ("cry", {"cries", "cried", "crying"}),
+    ("box", {"boxes", "boxed", "boxing"}),
+    ("die", {"dies", "dying"}),
+    ("see", {"sees", "seeing"}),
+    ("visit", {"visits", "visited", "visiting"}),
+    ("go", {"goes", "going"}),
+    ("a", set()),
+    ("be", set()),
+])
+def test_inflected_forms(base: str, expected: set[str]):
+    assert inflected_forms(base) == expected
+
+
+@pytest.mark.parametrize("word, sign_word", [
+    ("running", "run"), ("cats", "cat"), ("making", "make"), ("cries", "cry"),
+    ("studied", "study"), ("hoped", "hope"), ("hopped", "hop"), ("stopped", "stop"),
+    ("going", "go"), ("boxes", "box"), ("walked", "walk"), ("seeing", "see"),
+    ("agreed", "agree"), ("dying", "die"), ("eyes", "eye"), ("visited", "visit"),
+    ("opened", "open"), ("rained", "rain"), ("shopping", "shop"),
+])
+def test_stem_tier_undoes_inflections(word: str, sign_word: str):
+    assert StemTier(VOCABULARY).lookup(word) == sign_word
+
+
+@pytest.mark.parametrize("word", [
+    "animated", "animation", "generous", "universe", "organization", "communism",
+    "as", "bed", "shed", "seed",
+])
+def test_stem_tier_ignores_derivations_and_short_bases(word: str):
+    assert StemTier(VOCABULARY).lookup(word) is None
+
+
+def test_exact_then_stem_then_fallback():
+    fallback = HashingEmbeddingMatcher(VOCABULARY, similarity_threshold=0.0)
+    matcher = TieredMatcher.from_vocabulary(VOCABULARY, fallback=fallback)
+
+    exact, stem, derived = matcher.find_best_matches(["Cat", "cats", "animation"])
+
+    assert (exact.matched_word, exact.tier, exact.similarity) == ("cat", "exact", 1.0)
+    assert (stem.matched_word, stem.tier) == ("cat", "stem")
+    # Left to the embedding matcher, which scores it on its own
+    assert derived.tier != "stem"
+    assert matcher.get_tier_stats() == {"exact": 1, "stem": 1, "fallback": 1}
+
+
+def test_synonym_tier(tmp_path: Path):
+    synonyms = tmp_path / "synonyms.json"
+    synonyms.write_text(json.dumps({"kitty": "cat", "unknown": "not-a-sign"}))
+    matcher = TieredMatcher.from_vocabulary(VOCABULARY, fallback=None, synonyms_path=synonyms)
+
+    assert matcher.find_best_match("kitty").matched_word == "cat"
+    assert matcher.find_best_match("unknown") == MatchResult(
+        query_word="unknown", matched_word=None, similarity=0.0, is_match=False
+    )
+
+
+def test_restricted_matcher_has_no_fallback():
+    fallback = HashingEmbeddingMatcher(VOCABULARY, similarity_threshold=0.0)
+    matcher = TieredMatcher.from_vocabulary(VOCABULARY, fallback=fallback)
+
+    degraded = matcher.restricted_to({"exact"})
+
+    assert degraded.tier_names == ["exact"]
+    assert not degraded.find_best_match("cats").is_match
+
+
+@pytest.mark.parametrize("source, target, max_distance, expected", [
+    ("hello", "hello", 2, 0),
+    ("helo", "hello", 2, 1),
+    ("hlelo", "hello", 2, 1),  # Adjacent transposition is one edit
+    ("beutiful", "beautiful", 2, 1),
+    ("kitten", "sitting", 3, 3),
+    ("kitten", "sitting", 2, 3),  # Beyond the bound: max_distance + 1
+    ("cat", "catalogue", 2, 3),
+])
+def test_osa_distance(source: str, target: str, max_distance: int, expected: int):
+    assert _osa_distance(source, target, max_distance) == expected
+
+
+@pytest.fixture
+def lexicon_path(tmp_path: Path) -> Path:
+    path = tmp_path / "lexicon.txt"
+    path.write_text("join 500\njohn 900\nwent 800\nwet 100\nhello 700\n", encoding="utf-8")
+    return path
+
+
+def test_load_lexicon(lexicon_path: Path):
+    assert load_lexicon(lexicon_path)["john"] == 900
+
+
+def test_typo_tier_scores_corrections_by_edit_distance():
+    tier = TypoTier(["hello", "beautiful", "welcome", "cat"])
+
+    assert tier.correct("helo") == ("hello", 0.8)
+    assert tier.correct("beutiful") == ("beautiful", round(1 - 1 / 9, 4))
+    assert tier.correct("welcmoe")[0] == "welcome"
+    # Too short to correct, or too far from any sign
+    assert tier.correct("cta") is None
+    assert tier.correct("xylophone") is None
+
+
+def test_typo_tier_leaves_lexicon_words_alone():
+    tier = TypoTier(["join", "wet"], lexicon={"john": 900, "went": 800})
+
+    assert tier.correct("john") is None
+    assert tier.correct("went") is None
+    assert tier.correct("jion")[0] == "join"
+
+
+def test_typo_tier_is_built_without_a_lexicon():
+    matcher = TieredMatcher.from_vocabulary(["join"], fallback=None, typo=True)
+
+    assert matcher.tier_names[-1] == "typo"
+    assert matcher.find_best_match("jion").matched_word == "join"
+    assert not TieredMatcher.from_vocabulary(["join"], fallback=None).find_best_match("jion").is_match
+
+
+def test_typos_are_corrected_before_the_embedding_model(lexicon_path: Path):
+    vocabulary = ["hello", "welcome", "wet"]
+    lenient = HashingEmbeddingMatcher(vocabulary, similarity_threshold=0.0)
+    matcher = TieredMatcher.from_vocabulary(vocabulary, fallback=lenient, typo=True, lexicon_path=lexicon_path)
+
+    typo, known, miss = matcher.find_best_matches(["helo", "went", "xylophone"])
+
+    assert (typo.matched_word, typo.tier, typo.similarity) == ("hello", "typo", 0.8)
+    # Lexicon words and words too far from any sign go to the fallback
+    assert (known.tier, miss.tier) == ("embedding", "embedding")
+    assert matcher.find_best_match("helo").tier == "typo"
+    assert matcher.get_tier_stats() == {"typo": 2, "fallback": 2}
+
+
+def test_typo_tier_without_a_lexicon_only_sees_embedding_misses():
+    vocabulary = ["hello", "welcome", "wet"]
+    lenient = HashingEmbeddingMatcher(vocabulary, similarity_threshold=0.0)
+    strict = HashingEmbeddingMatcher(vocabulary, similarity_threshold=1.01)
+
+    embedded = TieredMatcher.from_vocabulary(vocabulary, fallback=lenient, typo=True)
+    corrected = TieredMatcher.from_vocabulary(vocabulary, fallback=strict, typo=True)
+
+    # A real word close to a sign keeps its semantic match
+    assert embedded.find_best_match("went").tier == "embedding"
+    typo, miss = corrected.find_best_matches(["helo", "xylophone"])
+    assert (typo.matched_word, typo.tier) == ("hello", "typo")
+    assert (miss.is_match, miss.tier) == (False, "embedding")
+    assert corrected.get_tier_stats() == {"fallback": 2, "typo": 1}
+
+
+def test_named_entities_are_never_typo_corrected():
+    typo = MatchResult(query_word="Jon", matched_word="join", similarity=0.75, is_match=True, tier="typo")
+    stem = MatchResult(query_word="Cats", matched_word="cat", similarity=1.0, is_match=True, tier="stem")
+
+    def find_video(word: str) -> VideoLookupResult:
+        return VideoLookupResult(word=word, found=True, url=f"/signs/{word}.mp4")
+
+    assert word_item("Jon", {"jon"}, typo, find_video).type == "fingerspell"
+    assert word_item("Jon", set(), typo, find_video).matched_word == "join"
+    assert word_item("Cats", {"cats"}, stem, find_video).type == "video"
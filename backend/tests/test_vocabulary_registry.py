@@ -0,0 +1,96 @@
+"""Tests for the registry of named vocabularies."""
+
+import threading
+
+import pytest
+
+from app.services.translation_service import TranslationService
+from app.services.vocabulary_registry import LoadedVocabulary, UnknownVocabularyError, VocabularyRegistry
+
+MIB = 2**20
+
+
+@pytest.fixture
+def loads() -> list[str]:
+    return []
+
+
+@pytest.fixture
+def make_registry(translation_service: TranslationService, video_repository, loads: list[str]):
+    def make(names=("isl", "asl", "bsl"), default="isl", budget=2 * MIB, pinned=("isl",)):
+        def loader(name: str) -> LoadedVocabulary:
+            loads.append(name)
+            return LoadedVocabulary(
+                name=name,
+                translation_service=translation_service,
+                async_translation_service=None,
+                video_repository=video_repository,
+                memory_bytes=MIB,
+                fingerprint=f"{name}-fp",
+                pinned=name in pinned,
+            )
+
+        return VocabularyRegistry(list(names), default, loader, memory_budget_bytes=budget)
+
+    return make
+
+
+def test_vocabularies_load_on_first_use(make_registry, loads: list[str]):
+    registry = make_registry()
+
+    assert registry.loaded_names() == []
+    assert registry.get().name == "isl"
+    assert registry.get("isl") is registry.get(None)
+    assert loads == ["isl"]
+    assert registry.memory_bytes() == MIB
+
+
+def test_least_recently_used_vocabulary_is_evicted(make_registry, loads: list[str]):
+    registry = make_registry(pinned=())
+
+    registry.get("isl")
+    registry.get("asl")
+    registry.get("isl")
+    registry.get("bsl")
+
+    assert registry.loaded_names() == ["isl", "bsl"]
+    assert registry.memory_bytes() <= 2 * MIB
+    registry.get("asl")
+    assert loads == ["isl", "asl", "bsl", "asl"]
+
+
+def test_pinned_and_just_loaded_vocabularies_are_kept(make_registry):
+    registry = make_registry(budget=MIB)
+
+    registry.get("isl")
+    registry.get("asl")
+    registry.get("bsl")
+
+    # Over budget rather than evicting the pinned or the new vocabulary
+    assert registry.loaded_names() == ["isl", "bsl"]
+
+
+def test_unknown_vocabulary(make_registry):
+    registry = make_registry()
+
+    with pytest.raises(UnknownVocabularyError):
+        registry.get("klingon")
+    with pytest.raises(ValueError):
+        make_registry(default="klingon")
+
+
+def test_concurrent_requests_load_once(make_registry, loads: list[str]):
+    registry = make_registry()
+    barrier = threading.Barrier(4)
+
+    def request() -> None:
+        barrier.wait()
+        registry.get("asl")
+
+    threads = [threading.Thread(target=request) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loads == ["asl"]
@@ -0,0 +1,129 @@
+"""Tests for the result caches and their snapshots."""
+
+import json
+import stat
+import time
+from pathlib import Path
+
+import pytest
+
+from app.api import dependencies
+from app.config import Settings
+from app.core.cache import LruCache
+from app.core.interfaces.embedding_matcher import MatchResult
+from app.services.stand_in_services import HashingEmbeddingMatcher
+from app.services.translation_service import TranslationService
+from app.services.warm_cache import CacheWarmer, CachingMatcher, compute_fingerprint
+
+
+def match(word: str, sign_word: str) -> MatchResult:
+    return MatchResult(query_word=word, matched_word=sign_word, similarity=1.0, is_match=True, tier="exact")
+
+
+def make_warmer(path: Path, fingerprint: str = "fp", **kwargs) -> CacheWarmer:
+    return CacheWarmer(
+        path=path,
+        fingerprint=fingerprint,
+        match_cache=LruCache("match", 100),
+        sentence_cache=LruCache("sentence", 100),
+        **kwargs,
+    )
+
+
+def test_snapshots_are_off_by_default():
+    assert Settings.model_fields["cache_snapshot_enabled"].default is False
+
+
+def test_caching_matcher_computes_each_miss_once():
+    matcher = CachingMatcher(HashingEmbeddingMatcher(["hello"], similarity_threshold=0.0), LruCache("match", 10))
+
+    first = matcher.find_best_matches(["hello", "helo", "helo"])
+    second = matcher.find_best_match("helo")
+
+    assert second == first[1] == first[2]
+    assert matcher._cache.writes == 2
+
+
+def test_fingerprint_depends_on_vocabulary_and_settings():
+    assert compute_fingerprint(["b", "a"], "model", 0.7) == compute_fingerprint(["a", "b"], "model", 0.7)
+    assert compute_fingerprint(["a"], "model", 0.7) != compute_fingerprint(["a"], "model", 0.8)
+    assert compute_fingerprint(["a"], "model", 0.7) != compute_fingerprint(["a", "b"], "model", 0.7)
+
+
+def test_translation_fingerprint_covers_the_ner_model(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(dependencies, "get_settings", lambda: Settings(spacy_model="en_core_web_sm"))
+    small = dependencies.translation_fingerprint(["hello"])
+    monkeypatch.setattr(dependencies, "get_settings", lambda: Settings(spacy_model="en_core_web_trf"))
+
+    assert dependencies.translation_fingerprint(["hello"]) != small
+
+
+def test_snapshot_is_private(tmp_path: Path):
+    path = tmp_path / "cache" / "snapshot.json"
+    warmer = make_warmer(path)
+    warmer._match_cache.put("hello", match("hello", "hello"))
+    warmer._sentence_cache.put("hello there", None)
+
+    assert warmer.save()
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert stat.S_IMODE(path.parent.stat().st_mode) == 0o700
+    snapshot = json.loads(path.read_text(encoding="utf-8"))
+    assert snapshot["matches"] == [["hello", "hello", 1.0, True, "exact"]]
+    assert snapshot["sentences"] == ["hello there"]
+    assert not path.with_suffix(".json.tmp").exists()
+
+
+def test_unchanged_or_empty_caches_are_not_written(tmp_path: Path):
+    path = tmp_path / "snapshot.json"
+    warmer = make_warmer(path)
+
+    assert not warmer.save()
+    assert not path.exists()
+
+    warmer._match_cache.put("hello", match("hello", "hello"))
+    assert warmer.save()
+    assert not warmer.save()
+
+
+def test_warm_restores_matches_with_the_same_fingerprint(tmp_path: Path, translation_service: TranslationService):
+    path = tmp_path / "snapshot.json"
+    source = make_warmer(path)
+    source._match_cache.put("cats", match("cats", "cat"))
+    source._match_cache.put("hello", match("hello", "hello"))
+    source._sentence_cache.put("hello", None)
+    source.save()
+
+    target = make_warmer(path)
+    target.warm(target.load_snapshot(), translation_service, translation_service._embedding_matcher)
+
+    # Most recently used entry stays most recent
+    assert [word for word, _ in target._match_cache.items()] == ["hello", "cats"]
+    assert target._match_cache.get("cats") == match("cats", "cat")
+    assert not target.save()
+
+
+def test_warm_replays_words_with_another_fingerprint(tmp_path: Path, translation_service: TranslationService):
+    path = tmp_path / "snapshot.json"
+    source = make_warmer(path, fingerprint="old")
+    source._match_cache.put("cats", match("cats", "dog"))
+    source.save()
+
+    target = make_warmer(path, fingerprint="new")
+    matcher = CachingMatcher(translation_service._embedding_matcher, target._match_cache)
+    target.warm(target.load_snapshot(), translation_service, matcher)
+
+    assert target._match_cache.get("cats").matched_word == "cat"
+
+
+def test_old_or_invalid_snapshots_are_ignored(tmp_path: Path):
+    path = tmp_path / "snapshot.json"
+    warmer = make_warmer(path, max_age_seconds=60)
+
+    assert warmer.load_snapshot() is None
+    path.write_text("not json", encoding="utf-8")
+    assert warmer.load_snapshot() is None
+    path.write_text(json.dumps({"version": 1, "created_at": time.time() - 120}), encoding="utf-8")
+    assert warmer.load_snapshot() is None
+    path.write_text(json.dumps({"version": 1, "created_at": time.time()}), encoding="utf-8")
+    assert warmer.load_snapshot() is not None